@@ -5,21 +5,45 @@ with Full Shared Drive Support
 Supports: Gmail, Drive, Docs, Sheets, Slides, Calendar, Tasks
 """
 import os
+import sys
+import re
 import json
+import secrets
+import uuid
+import functools
+import itertools
+import threading
+import time
 import base64
+import copy
+import binascii
+import random
+import shutil
 from pathlib import Path
 from typing import Optional, List
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.mime.base import MIMEBase
+from email.header import Header
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from fastmcp import FastMCP
 from google.oauth2.credentials import Credentials
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload
+from googleapiclient.model import JsonModel
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import io
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used without it
+    orjson = None
+
 # Initialize MCP server
 mcp = FastMCP("google-workspace-full")
 
@@ -60,101 +84,867 @@ SCOPES = [
 ]
 
 
+# Loaded credentials, reused until the token file changes on disk.
+_creds_cache = {'path': None, 'mtime': None, 'dir_mtime': None, 'creds': None}
+_creds_lock = threading.Lock()
+
+# Seconds before expiry at which the access token is refreshed in the background,
+# so tool calls don't wait on the token endpoint.
+REFRESH_MARGIN = 300
+_refresh_timer = None
+
+
+def _stage_token(token_path: Path, creds) -> Path:
+    """Write creds to a temporary file next to token_path, ready to be moved into place."""
+    tmp_path = token_path.with_name(f"{token_path.name}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w') as token:
+        token.write(creds.to_json())
+    return tmp_path
+
+
+def _write_token(token_path: Path, creds):
+    """Atomically replace the token file with the current credentials."""
+    os.replace(_stage_token(token_path, creds), token_path)
+
+
+def _schedule_refresh(creds, token_path: Optional[Path]):
+    """Arm a daemon timer that refreshes creds shortly before they expire. Call with _creds_lock held."""
+    global _refresh_timer
+    if _refresh_timer is not None:
+        _refresh_timer.cancel()
+        _refresh_timer = None
+    if not creds.expiry or not creds.refresh_token:
+        return
+
+    delay = max((creds.expiry - datetime.utcnow()).total_seconds() - REFRESH_MARGIN, 0)
+    _refresh_timer = threading.Timer(delay, _background_refresh, (creds, token_path))
+    _refresh_timer.daemon = True
+    _refresh_timer.start()
+
+
+def _background_refresh(creds, token_path: Optional[Path]):
+    """Refresh creds ahead of expiry, persist them, and re-arm the timer.
+
+    The refresh runs on a copy outside _creds_lock, so tool calls keep using the current
+    token meanwhile; the lock is only taken to swap the refreshed copy in.
+    """
+    fresh = copy.copy(creds)
+    try:
+        fresh.refresh(Request())
+    except Exception:
+        return  # Leave it to the on-demand refresh in get_credentials
+    tmp_path = _stage_token(token_path, fresh) if token_path is not None else None
+
+    with _creds_lock:
+        if _creds_cache['creds'] is not creds:
+            # Replaced by a newer token since this timer was armed
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return
+        if tmp_path is not None:
+            os.replace(tmp_path, token_path)
+            _creds_cache['mtime'] = token_path.stat().st_mtime
+        _creds_cache['creds'] = fresh
+        _schedule_refresh(fresh, token_path)
+
+
 def get_credentials():
     """Get authenticated credentials with automatic user detection."""
     # For cloud deployment, load credentials from environment variable
     if os.environ.get('TRANSPORT') == 'sse' and os.environ.get('GOOGLE_CREDENTIALS_JSON'):
-        import json
-        creds_data = json.loads(os.environ.get('GOOGLE_CREDENTIALS_JSON'))
-        creds = Credentials.from_authorized_user_info(creds_data, SCOPES)
-
-        # Refresh token if expired (but we can't save it back in cloud mode)
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+        with _creds_lock:
+            creds = _creds_cache['creds']
+            if creds is None:
+                creds_data = json.loads(os.environ.get('GOOGLE_CREDENTIALS_JSON'))
+                creds = _creds_cache['creds'] = Credentials.from_authorized_user_info(creds_data, SCOPES)
+                _schedule_refresh(creds, None)
+
+            # Refresh token if expired (but we can't save it back in cloud mode)
+            if creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                _schedule_refresh(creds, None)
 
         return creds
 
-    # For local deployment, load from file
-    token_path = get_token_path()
-    creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+    # For local deployment, load from file. The credentials directory is only
+    # searched again when its mtime changes (a token file was added, removed or
+    # replaced), and the file is only re-read when its own mtime changes.
+    with _creds_lock:
+        token_path = _creds_cache['path']
+        try:
+            dir_mtime = TOKEN_DIR.stat().st_mtime
+        except FileNotFoundError:
+            dir_mtime = None
+        if dir_mtime != _creds_cache['dir_mtime']:
+            token_path = None
+        try:
+            mtime = token_path.stat().st_mtime if token_path else None
+        except FileNotFoundError:
+            token_path = None
+        if token_path is None:
+            token_path = get_token_path()
+            mtime = token_path.stat().st_mtime
+
+        creds = _creds_cache['creds']
+        reschedule = False
+        if creds is None or token_path != _creds_cache['path'] or mtime != _creds_cache['mtime']:
+            creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            reschedule = True
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                _write_token(token_path, creds)
+                mtime = token_path.stat().st_mtime
+                reschedule = True
+            else:
+                raise Exception("Credentials expired. Please run authenticate.py again.")
+
+        _creds_cache.update(path=token_path, mtime=mtime, dir_mtime=dir_mtime, creds=creds)
+        if reschedule:
+            _schedule_refresh(creds, token_path)
+
+    return creds
+
+
+# Socket timeout for API requests, in seconds.
+HTTP_TIMEOUT = int(os.environ.get('GOOGLE_MCP_HTTP_TIMEOUT', '60'))
+
+# httplib2.Http is not thread-safe, so each thread keeps its own keep-alive connection.
+_thread_local = threading.local()
+
+# Upper bound on parallel requests per call, to stay well inside per-user quotas.
+MAX_CONCURRENCY = 8
+
+
+def _thread_http():
+    """Return this thread's keep-alive httplib2.Http."""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = httplib2.Http(timeout=HTTP_TIMEOUT)
+    return http
+
+
+class PooledHttp:
+    """Single transport shared by every service client.
+
+    Requests go through the calling thread's keep-alive httplib2.Http, so all APIs
+    reuse the same open TLS connection per thread and concurrent tool calls or pool
+    workers never share a socket.
+    """
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        # Google only gzips responses when the user agent mentions gzip. JsonModel
+        # marks API calls that way, but batch and media requests bypass the model.
+        headers = dict(headers) if headers else {}
+        user_agent = headers.get('user-agent', '')
+        if 'gzip' not in user_agent:
+            headers['user-agent'] = f"{user_agent} (gzip)".lstrip()
+        return _thread_http().request(uri, method, body=body, headers=headers, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(_thread_http(), name)
+
+
+_http = PooledHttp()
+
+
+# Client-side request budget, kept just under the per-user per-minute API quota.
+RATE_LIMIT_PER_MINUTE = int(os.environ.get('GOOGLE_MCP_RATE_LIMIT', '300'))
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate_per_minute` requests per minute."""
+
+    def __init__(self, rate_per_minute: int):
+        self.capacity = max(1, rate_per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiter = TokenBucket(RATE_LIMIT_PER_MINUTE)
+
+
+def is_retryable(request, status: int, idempotent: Optional[bool] = None) -> bool:
+    """Whether a request that failed with `status` can safely be sent again.
+
+    A 429 means the request was not processed, so it is always retryable. A 5xx may
+    arrive after a write was committed, so it is only retried for idempotent requests:
+    anything but POST (batches are POSTs), unless `idempotent` says otherwise.
+    """
+    if status == 429:
+        return True
+    if idempotent is None:
+        idempotent = getattr(request, 'method', 'POST') != 'POST'
+    return idempotent and status in RETRY_STATUSES
+
+
+def execute_with_retry(request, http=None, idempotent: Optional[bool] = None):
+    """Execute an API request under the rate limiter.
+
+    Rate-limit (429) errors, and transient server errors on idempotent requests, are
+    retried with jittered exponential backoff, honouring Retry-After when the API
+    sends one. Pass idempotent=True for a POST the API deduplicates (e.g. via requestId).
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        _rate_limiter.acquire()
+        try:
+            return request.execute(http=http)
+        except HttpError as e:
+            if not is_retryable(request, e.resp.status, idempotent) or attempt == MAX_RETRIES:
+                raise
+            delay = min(2 ** attempt + random.random(), 64)
+            retry_after = e.resp.get('retry-after', '')
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            time.sleep(delay)
+
+
+def execute_concurrently(requests: list, max_workers: int = MAX_CONCURRENCY,
+                         idempotent: Optional[bool] = None) -> list:
+    """Execute independent API requests in parallel.
+
+    Returns a (response, error) pair per request, in the order given.
+    """
+    def run(request):
+        try:
+            return execute_with_retry(request, idempotent=idempotent), None
+        except Exception as e:
+            return None, e
+
+    if not requests:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as pool:
+        return list(pool.map(run, requests))
+
+
+# Most Google APIs accept at most 100 calls per HTTP batch.
+BATCH_LIMIT = 100
+
+
+def execute_batch(service, requests: list, idempotent: Optional[bool] = None) -> list:
+    """Execute requests for one API as multipart HTTP batches of up to 100, sent in parallel.
+
+    Items the batch answers with a 429, or a transient 5xx when they are idempotent (see
+    is_retryable), are re-sent in a smaller batch after a jittered backoff. If the batch
+    endpoint rejects a batch outright, that chunk is sent as parallel individual requests
+    instead; after a 5xx the batch may already have run, so only idempotent items are
+    re-sent then. Returns a (response, error) pair per request, in the order given.
+    """
+    results = [(None, None)] * len(requests)
+    if not requests:
+        return results
+
+    def collect(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    sent_individually = set()
 
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-            with open(token_path, 'w') as token:
-                token.write(creds.to_json())
+    def send(chunk):
+        batch = service.new_batch_http_request(callback=collect)
+        for index in chunk:
+            batch.add(requests[index], request_id=str(index))
+        try:
+            # The batch itself is a POST; a 5xx is only retried whole if every item is safe to repeat
+            execute_with_retry(batch, idempotent=bool(idempotent))
+        except HttpError as e:
+            # execute_concurrently already retries each request on its own
+            sent_individually.update(chunk)
+            if e.resp.status >= 500:
+                resend = [index for index in chunk if is_retryable(requests[index], e.resp.status, idempotent)]
+                for index in chunk:
+                    results[index] = (None, e)
+            else:
+                resend = chunk
+            for index, result in zip(resend, execute_concurrently([requests[index] for index in resend],
+                                                                  idempotent=idempotent)):
+                results[index] = result
+
+    pending = list(range(len(requests)))
+    for attempt in range(MAX_RETRIES + 1):
+        chunks = [pending[start:start + BATCH_LIMIT] for start in range(0, len(pending), BATCH_LIMIT)]
+        if len(chunks) > 1:
+            # Past 100 items, send the batches side by side rather than one after another
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(chunks))) as pool:
+                list(pool.map(send, chunks))
         else:
-            raise Exception("Credentials expired. Please run authenticate.py again.")
+            send(chunks[0])
 
-    return creds
+        # Re-send only the items the batch answered with a retryable error
+        pending = [index for index in pending if index not in sent_individually
+                   and isinstance(results[index][1], HttpError)
+                   and is_retryable(requests[index], results[index][1].resp.status, idempotent)]
+        if not pending or attempt == MAX_RETRIES:
+            break
+        time.sleep(min(2 ** attempt + random.random(), 64))
+    return results
+
+
+def paginate(list_page, key: str):
+    """Yield the items under key from every page of a list call.
+
+    list_page(page_token) builds the request for one page. Pages are fetched lazily,
+    so a caller that stops early (e.g. with itertools.islice) never requests the rest.
+    """
+    page_token = None
+    while True:
+        response = execute_with_retry(list_page(page_token))
+        yield from response.get(key, ())
+        page_token = response.get('nextPageToken')
+        if not page_token:
+            return
+
+
+class OrjsonModel(JsonModel):
+    """JsonModel that encodes request bodies and parses responses with orjson when it
+    is installed.
+
+    httplib2 sends str bodies as latin-1, so bodies must stay ASCII; anything orjson
+    cannot produce as ASCII falls back to the stdlib encoder, which escapes it.
+    """
+
+    def serialize(self, body_value):
+        if orjson is None:
+            return super().serialize(body_value)
+        if isinstance(body_value, dict) and 'data' not in body_value and self._data_wrapper:
+            body_value = {'data': body_value}
+        try:
+            body = orjson.dumps(body_value).decode('utf-8')
+        except TypeError:
+            return json.dumps(body_value)
+        return body if body.isascii() else json.dumps(body_value)
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+# Built service clients, keyed by (api, version). Building one parses the discovery
+# document, so it is done once per API rather than on every tool call. The cache is
+# dropped when get_credentials loads a different token (e.g. authenticate.py wrote a
+# new one); refreshing the current token in place keeps the clients.
+_services = {}
+_services_creds = None
+_services_lock = threading.Lock()
 
 
 def get_service(service_name: str, version: str):
     """Get Google API service."""
+    global _services_creds
+    key = (service_name, version)
+    creds = get_credentials()
+    service = _services.get(key) if creds is _services_creds else None
+    if service is None:
+        with _services_lock:
+            if creds is not _services_creds:
+                _services.clear()
+                _services_creds = creds
+            service = _services.get(key)
+            if service is None:
+                # http= carries the credentials, so credentials= must not be passed too.
+                service = build(service_name, version, http=AuthorizedHttp(creds, http=_http),
+                                model=OrjsonModel(), cache_discovery=False, static_discovery=True)
+                _services[key] = service
+    return service
+
+
+# Set GOOGLE_MCP_OUTPUT=json to have metadata/listing tools return the API payload
+# as compact JSON instead of a formatted report.
+JSON_OUTPUT = os.environ.get('GOOGLE_MCP_OUTPUT', 'text').lower() == 'json'
+
+
+def to_json(payload) -> str:
+    """Serialize an API payload for JSON output mode."""
+    return json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+
+
+def parse_json(text: str):
+    """Parse a JSON tool argument, with orjson when it is installed.
+
+    Raises ValueError (which both parsers' decode errors subclass) on invalid input.
+    """
+    if orjson is None:
+        return json.loads(text)
+    return orjson.loads(text)
+
+
+class TTLCache:
+    """Small thread-safe cache whose entries expire `ttl` seconds after they are set."""
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            if item[0] < time.monotonic():
+                del self._data[key]
+                return default
+            return item[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# Near-static account data (Drive quota, calendar list) reused across tool calls.
+_account_cache = TTLCache(ttl=30, maxsize=16)
+
+
+def _cached_for_account(key: str, fetch):
+    """Return fetch()'s result, reusing it for 30s while the credentials are unchanged."""
     creds = get_credentials()
-    return build(service_name, version, credentials=creds)
+    cached = _account_cache.get(key)
+    if cached and cached[0] is creds:
+        return cached[1]
+    result = fetch()
+    _account_cache.set(key, (creds, result))
+    return result
+
+
+_INV255 = 1.0 / 255.0
+
+
+@functools.lru_cache(maxsize=256)
+def hex_to_rgb(hex_color: str) -> tuple:
+    """Convert '#RRGGBB' to (red, green, blue) floats in 0-1, as the Workspace APIs expect."""
+    v = int(hex_color[1:7], 16)
+    return ((v >> 16) & 0xFF) * _INV255, ((v >> 8) & 0xFF) * _INV255, (v & 0xFF) * _INV255
+
+
+# Open batches of Sheets/Slides batchUpdate requests keyed by (api, document id).
+# While a batch is open, tools queue their requests and the *_batch_commit tool
+# sends them all in one batchUpdate.
+_pending_batches = {}
+_batch_lock = threading.Lock()
+
+
+def _send_batch_update(api: str, document_id: str, requests: list) -> dict:
+    """Execute a batchUpdate against a spreadsheet or presentation."""
+    if api == 'sheets':
+        return execute_with_retry(get_service('sheets', 'v4').spreadsheets().batchUpdate(
+            spreadsheetId=document_id, body={'requests': requests}))
+    return execute_with_retry(get_service('slides', 'v1').presentations().batchUpdate(
+        presentationId=document_id, body={'requests': requests}))
+
+
+def batch_update(api: str, document_id: str, requests: list, needs_replies: bool = False) -> Optional[dict]:
+    """Send batchUpdate requests, or queue them when a batch is open for the document.
+
+    Returns None if the requests were queued. Tools that read their replies pass
+    needs_replies=True; anything already queued is then sent ahead of their requests
+    in the same batchUpdate and the replies are trimmed back to their own.
+    """
+    key = (api, document_id)
+    with _batch_lock:
+        pending = _pending_batches.get(key)
+        if pending is not None and not needs_replies:
+            for request in requests:
+                enqueue_request(pending, request)
+            return None
+        queued = pending[:] if pending else []
+        if pending:
+            pending.clear()
+    try:
+        response = _send_batch_update(api, document_id, queued + requests)
+    except Exception as e:
+        if queued and not _requeue(api, document_id, queued, e):
+            raise Exception(f"The API rejected this change together with {len(queued)} queued request(s), "
+                            f"which were discarded: {str(e)}") from e
+        raise
+    if queued:
+        response['replies'] = response.get('replies', [])[len(queued):]
+    return response
+
+
+def _requeue(api: str, document_id: str, queued: list, error: Exception) -> bool:
+    """Put queued requests back at the front of the batch after a failed send.
+
+    Only transient failures (429, 5xx, network errors) keep them; a 4xx means one of
+    them is invalid and would fail every later send too, so they are dropped and
+    False is returned.
+    """
+    if isinstance(error, HttpError) and not is_retryable(None, error.resp.status, idempotent=True):
+        return False
+    with _batch_lock:
+        _pending_batches.setdefault((api, document_id), [])[:0] = queued
+    return True
+
+
+def queued_message(api: str, document_id: str) -> str:
+    """Tool result for a request that was queued in an open batch."""
+    count = len(_pending_batches.get((api, document_id), []))
+    return f"⏳ Queued ({count} request(s) pending). Call {api}_batch_commit to apply."
+
+
+def begin_batch(api: str, document_id: str) -> str:
+    """Open a batch for a spreadsheet or presentation."""
+    with _batch_lock:
+        _pending_batches.setdefault((api, document_id), [])
+    return f"✅ Batch started for {document_id}. Changes will be queued until {api}_batch_commit is called."
+
+
+def commit_batch(api: str, document_id: str) -> str:
+    """Close a batch and send everything it queued."""
+    with _batch_lock:
+        pending = _pending_batches.pop((api, document_id), None)
+    if pending is None:
+        return f"❌ No open batch for {document_id}"
+    if not pending:
+        return "ℹ️ Batch closed, no changes were queued"
+    try:
+        _send_batch_update(api, document_id, pending)
+    except Exception as e:
+        # A transient failure reopens the batch so the commit can be retried
+        if _requeue(api, document_id, pending, e):
+            raise
+        return f"❌ Batch discarded, the API rejected it ({len(pending)} request(s) not applied): {str(e)}"
+    return f"✅ Applied {len(pending)} queued request(s) in a single batchUpdate"
+
+
+def discard_batch(api: str, document_id: str) -> str:
+    """Close a batch without sending what it queued."""
+    with _batch_lock:
+        pending = _pending_batches.pop((api, document_id), None)
+    if pending is None:
+        return f"❌ No open batch for {document_id}"
+    return f"✅ Batch discarded, {len(pending)} queued request(s) dropped"
 
 
 # ============================================================================
 # GMAIL TOOLS
 # ============================================================================
 
+class LabelModifyBatcher:
+    """Coalesces concurrent single-message label changes into batchModify calls.
+
+    A change with nothing else in flight for the same label set is sent at once, so
+    an isolated tool call pays no extra latency. Changes that arrive while one is in
+    flight queue up and go out together in one batchModify as soon as it returns.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = set()
+        self._queued = {}
+
+    def _send(self, ids: list, add: tuple, remove: tuple) -> dict:
+        """Apply one label change to `ids`; returns the error for each ID that failed.
+
+        batchModify is all-or-nothing, so if it rejects a group (one bad or deleted ID is
+        enough) each message is modified on its own and only the bad ones report an error.
+        Label changes are safe to repeat, so they are retried like idempotent requests.
+        """
+        body = {}
+        if add:
+            body['addLabelIds'] = list(add)
+        if remove:
+            body['removeLabelIds'] = list(remove)
+        service = get_service('gmail', 'v1')
+        messages = service.users().messages()
+        if len(ids) == 1:
+            execute_with_retry(messages.modify(userId='me', id=ids[0], body=body), idempotent=True)
+            return {}
+        try:
+            execute_with_retry(messages.batchModify(userId='me', body={'ids': ids, **body}), idempotent=True)
+            return {}
+        except HttpError as e:
+            if e.resp.status >= 500:
+                raise
+        results = execute_batch(service, [
+            messages.modify(userId='me', id=message_id, body=body, fields='id') for message_id in ids
+        ], idempotent=True)
+        return {message_id: error for message_id, (_, error) in zip(ids, results) if error is not None}
+
+    def modify(self, message_id: str, add: tuple = (), remove: tuple = ()):
+        key = (tuple(sorted(add)), tuple(sorted(remove)))
+        with self._lock:
+            if key in self._in_flight:
+                queued = self._queued.get(key)
+                if queued is None:
+                    queued = self._queued[key] = {
+                        'ids': [], 'turn': threading.Event(), 'done': threading.Event(), 'errors': {}
+                    }
+                queued['ids'].append(message_id)
+                sender = len(queued['ids']) == 1
+            else:
+                self._in_flight.add(key)
+                queued = None
+
+        if queued is None:
+            self._run(key, [message_id])
+            return
+
+        # The first caller in a queued group sends it once the request ahead finishes
+        if sender:
+            queued['turn'].wait()
+            self._run(key, queued['ids'], queued)
+        else:
+            queued['done'].wait()
+        error = queued['errors'].get(message_id)
+        if error is not None:
+            raise error
+
+    def _run(self, key: tuple, ids: list, queued: Optional[dict] = None):
+        """Send one change, then hand the label set over to the next queued group."""
+        try:
+            errors = self._send(ids, *key)
+        except Exception as e:
+            errors = dict.fromkeys(ids, e)
+        if queued is not None:
+            queued['errors'] = errors
+            queued['done'].set()
+
+        with self._lock:
+            next_group = self._queued.pop(key, None)
+            if next_group is None:
+                self._in_flight.discard(key)
+        if next_group is not None:
+            next_group['turn'].set()
+
+        if errors and queued is None:
+            raise errors[ids[0]]
+
+
+_label_batcher = LabelModifyBatcher()
+
+# Thread summaries keyed on each thread's historyId, which changes whenever the thread
+# does, so a hit is always current.
+_thread_summary_cache = TTLCache(ttl=3600, maxsize=1024)
+
+
+def _raw_message(to: str, subject: str, body: str, cc: Optional[str] = None,
+                 extra_headers: Optional[dict] = None) -> str:
+    """Base64url-encoded plain-text message for the Gmail API's raw field.
+
+    The RFC 5322 text is written out directly rather than through the email package's
+    generator. Non-ASCII subjects are RFC 2047 encoded; non-ASCII addresses still go
+    through MIMEText, which knows how to encode display names.
+    """
+    headers = {'to': to, 'subject': subject}
+    if cc:
+        headers['cc'] = cc
+    if extra_headers:
+        headers.update(extra_headers)
+
+    if not all((value or '').isascii() for name, value in headers.items() if name != 'subject'):
+        message = MIMEText(body)
+        for name, value in headers.items():
+            message[name] = value
+        return base64.urlsafe_b64encode(message.as_bytes()).decode()
+
+    if not subject.isascii():
+        headers['subject'] = Header(subject, 'utf-8').encode()
+    lines = [
+        'Content-Type: text/plain; charset="utf-8"',
+        'MIME-Version: 1.0',
+        'Content-Transfer-Encoding: base64',
+    ]
+    # Header values must stay on one line, or they could inject extra headers
+    lines.extend(f"{name}: {' '.join(str(value).splitlines())}" for name, value in headers.items())
+    raw = '\n'.join(lines) + '\n\n' + base64.encodebytes(body.encode('utf-8')).decode('ascii')
+    return base64.urlsafe_b64encode(raw.encode('ascii')).decode('ascii')
+
+
+def _header_map(headers: list, names: Optional[frozenset] = None) -> dict:
+    """Index a message's headers by lower-cased name, for single-lookup access.
+
+    Built in reverse so a repeated header keeps its first value, as Gmail lists it.
+    Pass `names` (lower-cased) to keep only those headers.
+    """
+    if names is None:
+        return {h['name'].lower(): h['value'] for h in reversed(headers)}
+    return {key: h['value'] for h in reversed(headers) if (key := h['name'].lower()) in names}
+
+
+_SUMMARY_HEADERS = frozenset(('subject', 'from', 'date'))
+
+
+_URLSAFE_TRANS = bytes.maketrans(b'-_', b'+/')
+
+# base64 characters decoded per write when saving attachments (a multiple of 4).
+ATTACHMENT_DECODE_CHUNK = 1024 * 1024
+
+
+def _b64url_decode(data: str) -> bytes:
+    """Decode Gmail's base64url data straight through binascii."""
+    return binascii.a2b_base64(data.encode('ascii').translate(_URLSAFE_TRANS))
+
+
+_ID_SPLIT = re.compile(r'\s*,\s*')
+
+# Most IDs messages.batchModify / batchDelete accept per call.
+GMAIL_BATCH_IDS = 1000
+
+
+def _split_ids(ids: str) -> list:
+    """Split a comma-separated ID list, ignoring surrounding whitespace and empty entries."""
+    return list(filter(None, _ID_SPLIT.split(ids.strip())))
+
+
+def _next_page_line(results: dict) -> str:
+    """Listing trailer with the token for the next page, if there is one."""
+    token = results.get('nextPageToken')
+    return f"NEXT_PAGE_TOKEN: {token}\n" if token else ""
+
+
+def _walk_parts(payload: dict):
+    """Yield a message payload and all of its nested MIME parts, depth first."""
+    yield payload
+    for part in payload.get('parts') or ():
+        yield from _walk_parts(part)
+
+
+def _plain_text_body(payload: dict) -> str:
+    """Decode the text/plain body of a message payload ('' if there is none).
+
+    Finds the plain part however deeply it is nested (e.g. multipart/alternative
+    inside multipart/mixed). Invalid UTF-8 is replaced rather than failing the read.
+    """
+    if 'parts' not in payload:
+        data = payload.get('body', {}).get('data')
+        return _b64url_decode(data).decode('utf-8', errors='replace') if data else ""
+
+    for part in _walk_parts(payload):
+        if part.get('mimeType') == 'text/plain':
+            data = part.get('body', {}).get('data')
+            if data:
+                return _b64url_decode(data).decode('utf-8', errors='replace')
+    return ""
+
+
 @mcp.tool()
-def gmail_search(query: str, max_results: int = 10) -> str:
-    """Search for emails in Gmail with advanced queries."""
+def gmail_search(query: str, max_results: int = 10, page_token: Optional[str] = None) -> str:
+    """Search for emails in Gmail with advanced queries.
+
+    To read several of the results, use gmail_get_messages_batch rather than calling
+    gmail_read once per message. Pass the NEXT_PAGE_TOKEN from a previous result as
+    page_token to get the next page.
+    """
     service = get_service('gmail', 'v1')
-    results = service.users().messages().list(userId='me', q=query, maxResults=max_results).execute()
+    results = execute_with_retry(service.users().messages().list(
+        userId='me', q=query, maxResults=max_results, pageToken=page_token, fields='nextPageToken,messages/id'))
     messages = results.get('messages', [])
 
     if not messages:
         return f"No messages found for query: {query}"
 
-    output = f"Found {len(messages)} message(s):\n\n"
-    for msg in messages:
-        message = service.users().messages().get(userId='me', id=msg['id'], format='metadata').execute()
-        headers = message['payload']['headers']
-        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-        from_addr = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-        date = next((h['value'] for h in headers if h['name'] == 'Date'), 'Unknown')
-        output += f"📧 {subject}\n   From: {from_addr}\n   Date: {date}\n   ID: {msg['id']}\n\n"
-    return output
+    # Fetch every message's headers in one batched HTTP request instead of one call each
+    fetched = execute_batch(service, [
+        service.users().messages().get(userId='me', id=msg['id'], format='metadata',
+                                       metadataHeaders=['Subject', 'From', 'Date'], fields='payload/headers')
+        for msg in messages
+    ])
+
+    output = [f"Found {len(messages)} message(s):\n\n"]
+    for msg, (message, error) in zip(messages, fetched):
+        if error:
+            output.append(f"❌ {msg['id']}: {str(error)}\n\n")
+            continue
+        headers = _header_map(message['payload']['headers'])
+        subject = headers.get('subject', 'No Subject')
+        from_addr = headers.get('from', 'Unknown')
+        date = headers.get('date', 'Unknown')
+        output.append(f"📧 {subject}\n   From: {from_addr}\n   Date: {date}\n   ID: {msg['id']}\n\n")
+    output.append(_next_page_line(results))
+    return ''.join(output)
 
 
 @mcp.tool()
 def gmail_read(message_id: str) -> str:
     """Read a specific Gmail message with full content."""
     service = get_service('gmail', 'v1')
-    message = service.users().messages().get(userId='me', id=message_id, format='full').execute()
-    headers = message['payload']['headers']
-
-    subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-    from_addr = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-    to_addr = next((h['value'] for h in headers if h['name'] == 'To'), 'Unknown')
-    date = next((h['value'] for h in headers if h['name'] == 'Date'), 'Unknown')
-
-    body = ""
-    if 'parts' in message['payload']:
-        for part in message['payload']['parts']:
-            if part['mimeType'] == 'text/plain' and 'data' in part['body']:
-                body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                break
-    elif 'body' in message['payload'] and 'data' in message['payload']['body']:
-        body = base64.urlsafe_b64decode(message['payload']['body']['data']).decode('utf-8')
+    message = execute_with_retry(service.users().messages().get(userId='me', id=message_id, format='full'))
+    headers = _header_map(message['payload']['headers'])
+
+    subject = headers.get('subject', 'No Subject')
+    from_addr = headers.get('from', 'Unknown')
+    to_addr = headers.get('to', 'Unknown')
+    date = headers.get('date', 'Unknown')
+
+    body = _plain_text_body(message['payload'])
 
     return f"Subject: {subject}\nFrom: {from_addr}\nTo: {to_addr}\nDate: {date}\n\n{'-'*60}\n\n{body}"
 
 
+@mcp.tool()
+def gmail_get_messages_batch(message_ids: str, format: str = "metadata") -> str:
+    """Read several Gmail messages in one call (one batched API request).
+
+    Args:
+        message_ids: Comma-separated message IDs
+        format: "metadata" for headers only, or "full" to include the plain-text body
+    """
+    if format not in ('metadata', 'full'):
+        return "❌ format must be 'metadata' or 'full'"
+
+    service = get_service('gmail', 'v1')
+    ids = _split_ids(message_ids)
+
+    fetched = execute_batch(service, [
+        service.users().messages().get(userId='me', id=mid, format=format) for mid in ids
+    ])
+
+    output = []
+    for mid, (message, error) in zip(ids, fetched):
+        if error:
+            output.append(f"❌ {mid}: {str(error)}\n\n")
+            continue
+        headers = _header_map(message['payload']['headers'])
+        subject = headers.get('subject', 'No Subject')
+        from_addr = headers.get('from', 'Unknown')
+        to_addr = headers.get('to', 'Unknown')
+        date = headers.get('date', 'Unknown')
+
+        output.append(f"📧 {subject}\nFrom: {from_addr}\nTo: {to_addr}\nDate: {date}\nID: {mid}\n")
+        if format == 'full':
+            output.append(f"\n{_plain_text_body(message['payload'])}\n")
+        output.append(f"\n{'-'*60}\n\n")
+
+    return ''.join(output)
+
+
 @mcp.tool()
 def gmail_send(to: str, subject: str, body: str, cc: Optional[str] = None) -> str:
     """Send an email via Gmail."""
     service = get_service('gmail', 'v1')
-    message = MIMEText(body)
-    message['to'] = to
-    message['subject'] = subject
-    if cc:
-        message['cc'] = cc
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw = _raw_message(to, subject, body, cc)
     sent_message = service.users().messages().send(userId='me', body={'raw': raw}).execute()
     return f"✅ Email sent!\nMessage ID: {sent_message['id']}\nTo: {to}\nSubject: {subject}"
 
@@ -165,23 +955,17 @@ def gmail_reply(message_id: str, body: str) -> str:
     service = get_service('gmail', 'v1')
 
     # Get original message to extract thread ID and headers
-    original = service.users().messages().get(userId='me', id=message_id, format='full').execute()
+    original = execute_with_retry(service.users().messages().get(userId='me', id=message_id, format='full'))
     thread_id = original['threadId']
-    headers = original['payload']['headers']
+    headers = _header_map(original['payload']['headers'])
 
-    subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-    to = next((h['value'] for h in headers if h['name'] == 'From'), None)
+    subject = headers.get('subject', 'No Subject')
+    to = headers.get('from')
 
     if not subject.startswith('Re:'):
         subject = f"Re: {subject}"
 
-    message = MIMEText(body)
-    message['to'] = to
-    message['subject'] = subject
-    message['In-Reply-To'] = message_id
-    message['References'] = message_id
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw = _raw_message(to, subject, body, extra_headers={'In-Reply-To': message_id, 'References': message_id})
     sent = service.users().messages().send(userId='me', body={'raw': raw, 'threadId': thread_id}).execute()
     return f"✅ Reply sent!\nMessage ID: {sent['id']}\nThread ID: {thread_id}"
 
@@ -189,24 +973,21 @@ def gmail_reply(message_id: str, body: str) -> str:
 @mcp.tool()
 def gmail_mark_read(message_id: str) -> str:
     """Mark an email as read."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'removeLabelIds': ['UNREAD']}).execute()
+    _label_batcher.modify(message_id, remove=('UNREAD',))
     return f"✅ Marked message {message_id} as read"
 
 
 @mcp.tool()
 def gmail_mark_unread(message_id: str) -> str:
     """Mark an email as unread."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'addLabelIds': ['UNREAD']}).execute()
+    _label_batcher.modify(message_id, add=('UNREAD',))
     return f"✅ Marked message {message_id} as unread"
 
 
 @mcp.tool()
 def gmail_archive(message_id: str) -> str:
     """Archive an email (remove from inbox)."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'removeLabelIds': ['INBOX']}).execute()
+    _label_batcher.modify(message_id, remove=('INBOX',))
     return f"✅ Archived message {message_id}"
 
 
@@ -214,7 +995,7 @@ def gmail_archive(message_id: str) -> str:
 def gmail_delete(message_id: str) -> str:
     """Move an email to trash."""
     service = get_service('gmail', 'v1')
-    service.users().messages().trash(userId='me', id=message_id).execute()
+    execute_with_retry(service.users().messages().trash(userId='me', id=message_id))
     return f"✅ Moved message {message_id} to trash"
 
 
@@ -222,7 +1003,7 @@ def gmail_delete(message_id: str) -> str:
 def gmail_untrash(message_id: str) -> str:
     """Restore an email from trash."""
     service = get_service('gmail', 'v1')
-    service.users().messages().untrash(userId='me', id=message_id).execute()
+    execute_with_retry(service.users().messages().untrash(userId='me', id=message_id))
     return f"✅ Restored message {message_id} from trash"
 
 
@@ -230,63 +1011,56 @@ def gmail_untrash(message_id: str) -> str:
 def gmail_permanently_delete(message_id: str) -> str:
     """Permanently delete an email. WARNING: This cannot be undone!"""
     service = get_service('gmail', 'v1')
-    service.users().messages().delete(userId='me', id=message_id).execute()
+    execute_with_retry(service.users().messages().delete(userId='me', id=message_id))
     return f"✅ Permanently deleted message {message_id}"
 
 
 @mcp.tool()
 def gmail_move_to_inbox(message_id: str) -> str:
     """Move an email to inbox (unarchive)."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'addLabelIds': ['INBOX']}).execute()
+    _label_batcher.modify(message_id, add=('INBOX',))
     return f"✅ Moved message {message_id} to inbox"
 
 
 @mcp.tool()
 def gmail_star(message_id: str) -> str:
     """Star an email."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'addLabelIds': ['STARRED']}).execute()
+    _label_batcher.modify(message_id, add=('STARRED',))
     return f"✅ Starred message {message_id}"
 
 
 @mcp.tool()
 def gmail_unstar(message_id: str) -> str:
     """Unstar an email."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'removeLabelIds': ['STARRED']}).execute()
+    _label_batcher.modify(message_id, remove=('STARRED',))
     return f"✅ Unstarred message {message_id}"
 
 
 @mcp.tool()
 def gmail_mark_important(message_id: str) -> str:
     """Mark an email as important."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'addLabelIds': ['IMPORTANT']}).execute()
+    _label_batcher.modify(message_id, add=('IMPORTANT',))
     return f"✅ Marked message {message_id} as important"
 
 
 @mcp.tool()
 def gmail_mark_not_important(message_id: str) -> str:
     """Mark an email as not important."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'removeLabelIds': ['IMPORTANT']}).execute()
+    _label_batcher.modify(message_id, remove=('IMPORTANT',))
     return f"✅ Marked message {message_id} as not important"
 
 
 @mcp.tool()
 def gmail_add_label(message_id: str, label_id: str) -> str:
     """Add a label to an email. Use gmail_list_labels to get label IDs."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'addLabelIds': [label_id]}).execute()
+    _label_batcher.modify(message_id, add=(label_id,))
     return f"✅ Added label {label_id} to message {message_id}"
 
 
 @mcp.tool()
 def gmail_remove_label(message_id: str, label_id: str) -> str:
     """Remove a label from an email."""
-    service = get_service('gmail', 'v1')
-    service.users().messages().modify(userId='me', id=message_id, body={'removeLabelIds': [label_id]}).execute()
+    _label_batcher.modify(message_id, remove=(label_id,))
     return f"✅ Removed label {label_id} from message {message_id}"
 
 
@@ -294,7 +1068,7 @@ def gmail_remove_label(message_id: str, label_id: str) -> str:
 def gmail_list_labels() -> str:
     """List all Gmail labels (both system and custom)."""
     service = get_service('gmail', 'v1')
-    results = service.users().labels().list(userId='me').execute()
+    results = execute_with_retry(service.users().labels().list(userId='me', fields='labels(id,name,type)'))
     labels = results.get('labels', [])
 
     if not labels:
@@ -310,21 +1084,21 @@ def gmail_list_labels() -> str:
         else:
             custom_labels.append(label)
 
-    output = ""
+    output = []
 
     if system_labels:
-        output += "📌 System Labels:\n\n"
+        output.append("📌 System Labels:\n\n")
         for label in system_labels:
-            output += f"  {label['name']}\n"
-            output += f"    ID: {label['id']}\n\n"
+            output.append(f"  {label['name']}\n")
+            output.append(f"    ID: {label['id']}\n\n")
 
     if custom_labels:
-        output += "🏷️  Custom Labels:\n\n"
+        output.append("🏷️  Custom Labels:\n\n")
         for label in custom_labels:
-            output += f"  {label['name']}\n"
-            output += f"    ID: {label['id']}\n\n"
+            output.append(f"  {label['name']}\n")
+            output.append(f"    ID: {label['id']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -338,7 +1112,7 @@ def gmail_create_label(name: str) -> str:
         'labelListVisibility': 'labelShow'
     }
 
-    created_label = service.users().labels().create(userId='me', body=label_object).execute()
+    created_label = execute_with_retry(service.users().labels().create(userId='me', body=label_object))
     return f"✅ Label created!\nName: {created_label['name']}\nID: {created_label['id']}"
 
 
@@ -346,7 +1120,7 @@ def gmail_create_label(name: str) -> str:
 def gmail_delete_label(label_id: str) -> str:
     """Delete a custom label."""
     service = get_service('gmail', 'v1')
-    service.users().labels().delete(userId='me', id=label_id).execute()
+    execute_with_retry(service.users().labels().delete(userId='me', id=label_id))
     return f"✅ Deleted label {label_id}"
 
 
@@ -357,7 +1131,7 @@ def gmail_send_with_attachment(to: str, subject: str, body: str, attachment_path
 
     # Check if attachment exists
     att_path = Path(attachment_path)
-    if not att_path.exists():
+    if not att_path.is_file():
         return f"❌ Attachment not found: {attachment_path}"
 
     # Create message with attachment
@@ -370,11 +1144,15 @@ def gmail_send_with_attachment(to: str, subject: str, body: str, attachment_path
     # Add body
     message.attach(MIMEText(body, 'plain'))
 
-    # Add attachment
-    with open(attachment_path, 'rb') as f:
-        attachment = MIMEText(f.read(), _subtype='octet-stream', _charset='utf-8')
-        attachment.add_header('Content-Disposition', 'attachment', filename=att_path.name)
-        message.attach(attachment)
+    # Base64-encode the file as it is read, so the raw bytes are never held in memory whole
+    encoded = io.BytesIO()
+    with att_path.open('rb') as src:
+        base64.encode(src, encoded)
+    attachment = MIMEBase('application', 'octet-stream')
+    attachment.set_payload(encoded.getvalue().decode('ascii'))
+    attachment['Content-Transfer-Encoding'] = 'base64'
+    attachment.add_header('Content-Disposition', 'attachment', filename=att_path.name)
+    message.attach(attachment)
 
     raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
     sent_message = service.users().messages().send(userId='me', body={'raw': raw}).execute()
@@ -386,17 +1164,18 @@ def gmail_get_attachment(message_id: str, attachment_id: str, destination_path:
     """Download an email attachment. Use gmail_read to see attachment IDs."""
     service = get_service('gmail', 'v1')
 
-    attachment = service.users().messages().attachments().get(
+    attachment = execute_with_retry(service.users().messages().attachments().get(
         userId='me',
         messageId=message_id,
         id=attachment_id
-    ).execute()
-
-    file_data = base64.urlsafe_b64decode(attachment['data'])
+    ))
 
+    # Decode and write in slices so the decoded file is never held in memory whole
+    data = attachment.pop('data')
     dest_path = Path(destination_path)
     with open(dest_path, 'wb') as f:
-        f.write(file_data)
+        for start in range(0, len(data), ATTACHMENT_DECODE_CHUNK):
+            f.write(_b64url_decode(data[start:start + ATTACHMENT_DECODE_CHUNK]))
 
     return f"✅ Attachment downloaded!\nSaved to: {dest_path}\nSize: {attachment.get('size', 'unknown')} bytes"
 
@@ -407,10 +1186,10 @@ def gmail_forward(message_id: str, to: str, comment: Optional[str] = None) -> st
     service = get_service('gmail', 'v1')
 
     # Get original message
-    original = service.users().messages().get(userId='me', id=message_id, format='full').execute()
-    headers = original['payload']['headers']
+    original = execute_with_retry(service.users().messages().get(userId='me', id=message_id, format='full'))
+    headers = _header_map(original['payload']['headers'])
 
-    subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
+    subject = headers.get('subject', 'No Subject')
     if not subject.startswith('Fwd:'):
         subject = f"Fwd: {subject}"
 
@@ -420,54 +1199,79 @@ def gmail_forward(message_id: str, to: str, comment: Optional[str] = None) -> st
         forward_body = f"{comment}\n\n---------- Forwarded message ---------\n"
 
     # Extract original body
-    if 'parts' in original['payload']:
-        for part in original['payload']['parts']:
-            if part['mimeType'] == 'text/plain' and 'data' in part['body']:
-                forward_body += base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                break
-    elif 'body' in original['payload'] and 'data' in original['payload']['body']:
-        forward_body += base64.urlsafe_b64decode(original['payload']['body']['data']).decode('utf-8')
-
-    message = MIMEText(forward_body)
-    message['to'] = to
-    message['subject'] = subject
+    forward_body += _plain_text_body(original['payload'])
 
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw = _raw_message(to, subject, forward_body)
     sent = service.users().messages().send(userId='me', body={'raw': raw}).execute()
     return f"✅ Message forwarded!\nMessage ID: {sent['id']}\nTo: {to}"
 
 
 @mcp.tool()
-def gmail_list_threads(query: Optional[str] = None, max_results: int = 10) -> str:
-    """List email threads (conversations). Optional query to filter."""
+def gmail_list_threads(query: Optional[str] = None, max_results: int = 10, page_token: Optional[str] = None) -> str:
+    """List email threads (conversations). Optional query to filter.
+
+    To read several messages, use gmail_get_messages_batch rather than calling
+    gmail_read once per message. Pass the NEXT_PAGE_TOKEN from a previous result as
+    page_token to get the next page.
+    """
     service = get_service('gmail', 'v1')
 
-    params = {'userId': 'me', 'maxResults': max_results}
+    params = {'userId': 'me', 'maxResults': max_results, 'pageToken': page_token,
+              'fields': 'nextPageToken,threads(id,historyId)'}
     if query:
         params['q'] = query
 
-    results = service.users().threads().list(**params).execute()
+    results = execute_with_retry(service.users().threads().list(**params))
     threads = results.get('threads', [])
 
     if not threads:
         return "No threads found."
 
-    output = f"Found {len(threads)} thread(s):\n\n"
+    # Reuse summaries while a thread's historyId is unchanged; fetch the rest in one batch
+    summaries = {}
+    stale = []
     for thread in threads:
-        # Get thread details
-        thread_data = service.users().threads().get(userId='me', id=thread['id'], format='metadata').execute()
+        cached = _thread_summary_cache.get(thread['id'])
+        if cached and cached[0] == thread['historyId']:
+            summaries[thread['id']] = cached[1:]
+        else:
+            stale.append(thread)
+
+    fetched = execute_batch(service, [
+        service.users().threads().get(userId='me', id=thread['id'], format='metadata',
+                                      metadataHeaders=['Subject'], fields='messages/payload/headers')
+        for thread in stale
+    ])
+    for thread, (thread_data, error) in zip(stale, fetched):
+        if error:
+            summaries[thread['id']] = error
+            continue
         messages = thread_data.get('messages', [])
-
         if messages:
-            first_msg = messages[0]
-            headers = first_msg['payload']['headers']
-            subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
+            headers = _header_map(messages[0]['payload']['headers'])
+            summary = (headers.get('subject', 'No Subject'), len(messages))
+            summaries[thread['id']] = summary
+            _thread_summary_cache.set(thread['id'], (thread['historyId'],) + summary)
 
-            output += f"💬 {subject}\n"
-            output += f"   Thread ID: {thread['id']}\n"
-            output += f"   Messages: {len(messages)}\n\n"
+    output = [f"Found {len(threads)} thread(s):\n\n"]
+    for thread in threads:
+        summary = summaries.get(thread['id'])
+        if summary is None:
+            continue
+        if isinstance(summary, Exception):
+            output.append(f"❌ {thread['id']}: {str(summary)}\n\n")
+            continue
+        subject, count = summary
+        output.append(f"💬 {subject}\n")
+        output.append(f"   Thread ID: {thread['id']}\n")
+        output.append(f"   Messages: {count}\n\n")
 
-    return output
+    output.append(_next_page_line(results))
+    return ''.join(output)
+
+
+_THREAD_HEADER_RULE = "=" * 60 + "\n\n"
+_THREAD_MESSAGE_RULE = "-" * 60 + "\n\n"
 
 
 @mcp.tool()
@@ -475,40 +1279,32 @@ def gmail_get_thread(thread_id: str) -> str:
     """Read an entire email thread (conversation) with all messages."""
     service = get_service('gmail', 'v1')
 
-    thread = service.users().threads().get(userId='me', id=thread_id, format='full').execute()
+    thread = execute_with_retry(service.users().threads().get(userId='me', id=thread_id, format='full'))
     messages = thread.get('messages', [])
 
     if not messages:
         return f"No messages in thread {thread_id}"
 
-    output = f"Thread ID: {thread_id}\nMessages: {len(messages)}\n\n"
-    output += "="*60 + "\n\n"
+    output = [f"Thread ID: {thread_id}\nMessages: {len(messages)}\n\n", _THREAD_HEADER_RULE]
 
     for idx, msg in enumerate(messages, 1):
-        headers = msg['payload']['headers']
-        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-        from_addr = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-        date = next((h['value'] for h in headers if h['name'] == 'Date'), 'Unknown')
+        headers = _header_map(msg['payload']['headers'], _SUMMARY_HEADERS)
+        subject = headers.get('subject', 'No Subject')
+        from_addr = headers.get('from', 'Unknown')
+        date = headers.get('date', 'Unknown')
 
-        output += f"Message {idx}/{len(messages)}:\n"
-        output += f"Subject: {subject}\n"
-        output += f"From: {from_addr}\n"
-        output += f"Date: {date}\n\n"
+        output.append(f"Message {idx}/{len(messages)}:\n")
+        output.append(f"Subject: {subject}\n")
+        output.append(f"From: {from_addr}\n")
+        output.append(f"Date: {date}\n\n")
 
         # Extract body
-        body = ""
-        if 'parts' in msg['payload']:
-            for part in msg['payload']['parts']:
-                if part['mimeType'] == 'text/plain' and 'data' in part['body']:
-                    body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                    break
-        elif 'body' in msg['payload'] and 'data' in msg['payload']['body']:
-            body = base64.urlsafe_b64decode(msg['payload']['body']['data']).decode('utf-8')
-
-        output += f"{body}\n\n"
-        output += "-"*60 + "\n\n"
+        body = _plain_text_body(msg['payload'])
 
-    return output
+        output.append(f"{body}\n\n")
+        output.append(_THREAD_MESSAGE_RULE)
+
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -516,17 +1312,19 @@ def gmail_batch_modify(message_ids: str, add_labels: Optional[str] = None, remov
     """Modify multiple messages at once. message_ids: comma-separated IDs. Labels: comma-separated label IDs."""
     service = get_service('gmail', 'v1')
 
-    ids = [mid.strip() for mid in message_ids.split(',')]
+    ids = _split_ids(message_ids)
 
-    body = {'ids': ids}
+    body = {}
 
     if add_labels:
-        body['addLabelIds'] = [lid.strip() for lid in add_labels.split(',')]
+        body['addLabelIds'] = _split_ids(add_labels)
 
     if remove_labels:
-        body['removeLabelIds'] = [lid.strip() for lid in remove_labels.split(',')]
+        body['removeLabelIds'] = _split_ids(remove_labels)
 
-    service.users().messages().batchModify(userId='me', body=body).execute()
+    for start in range(0, len(ids), GMAIL_BATCH_IDS):
+        execute_with_retry(service.users().messages().batchModify(
+            userId='me', body={'ids': ids[start:start + GMAIL_BATCH_IDS], **body}))
 
     return f"✅ Modified {len(ids)} message(s)"
 
@@ -536,40 +1334,43 @@ def gmail_batch_delete(message_ids: str) -> str:
     """Permanently delete multiple messages at once. message_ids: comma-separated IDs. WARNING: Cannot be undone!"""
     service = get_service('gmail', 'v1')
 
-    ids = [mid.strip() for mid in message_ids.split(',')]
+    ids = _split_ids(message_ids)
 
-    body = {'ids': ids}
-
-    service.users().messages().batchDelete(userId='me', body=body).execute()
+    for start in range(0, len(ids), GMAIL_BATCH_IDS):
+        execute_with_retry(service.users().messages().batchDelete(
+            userId='me', body={'ids': ids[start:start + GMAIL_BATCH_IDS]}))
 
     return f"✅ Permanently deleted {len(ids)} message(s)"
 
 
 @mcp.tool()
-def gmail_list_drafts(max_results: int = 10) -> str:
-    """List all draft emails."""
+def gmail_list_drafts(max_results: int = 10, page_token: Optional[str] = None) -> str:
+    """List all draft emails. Pass a previous result's NEXT_PAGE_TOKEN as page_token for the next page."""
     service = get_service('gmail', 'v1')
 
-    results = service.users().drafts().list(userId='me', maxResults=max_results).execute()
+    results = execute_with_retry(service.users().drafts().list(
+        userId='me', maxResults=max_results, pageToken=page_token, fields='nextPageToken,drafts/id'))
     drafts = results.get('drafts', [])
 
     if not drafts:
         return "No drafts found."
 
-    output = f"Found {len(drafts)} draft(s):\n\n"
+    output = [f"Found {len(drafts)} draft(s):\n\n"]
     for draft in drafts:
-        draft_data = service.users().drafts().get(userId='me', id=draft['id'], format='metadata').execute()
+        draft_data = execute_with_retry(service.users().drafts().get(
+            userId='me', id=draft['id'], format='metadata', fields='message/payload/headers'))
         message = draft_data.get('message', {})
-        headers = message.get('payload', {}).get('headers', [])
+        headers = _header_map(message.get('payload', {}).get('headers', []))
 
-        subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-        to = next((h['value'] for h in headers if h['name'] == 'To'), 'No recipient')
+        subject = headers.get('subject', 'No Subject')
+        to = headers.get('to', 'No recipient')
 
-        output += f"📝 {subject}\n"
-        output += f"   To: {to}\n"
-        output += f"   Draft ID: {draft['id']}\n\n"
+        output.append(f"📝 {subject}\n")
+        output.append(f"   To: {to}\n")
+        output.append(f"   Draft ID: {draft['id']}\n\n")
 
-    return output
+    output.append(_next_page_line(results))
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -577,18 +1378,12 @@ def gmail_create_draft(to: str, subject: str, body: str, cc: Optional[str] = Non
     """Create a draft email."""
     service = get_service('gmail', 'v1')
 
-    message = MIMEText(body)
-    message['to'] = to
-    message['subject'] = subject
-    if cc:
-        message['cc'] = cc
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw = _raw_message(to, subject, body, cc)
 
-    draft = service.users().drafts().create(
+    draft = execute_with_retry(service.users().drafts().create(
         userId='me',
         body={'message': {'raw': raw}}
-    ).execute()
+    ))
 
     return f"✅ Draft created!\nDraft ID: {draft['id']}\nTo: {to}\nSubject: {subject}"
 
@@ -602,25 +1397,17 @@ def gmail_get_draft(draft_id: str) -> str:
     """
     service = get_service('gmail', 'v1')
 
-    draft = service.users().drafts().get(userId='me', id=draft_id, format='full').execute()
+    draft = execute_with_retry(service.users().drafts().get(userId='me', id=draft_id, format='full'))
     message = draft.get('message', {})
 
     # Extract headers
-    headers = message.get('payload', {}).get('headers', [])
-    subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-    to = next((h['value'] for h in headers if h['name'] == 'To'), 'No recipient')
-    cc = next((h['value'] for h in headers if h['name'] == 'Cc'), None)
+    headers = _header_map(message.get('payload', {}).get('headers', []))
+    subject = headers.get('subject', 'No Subject')
+    to = headers.get('to', 'No recipient')
+    cc = headers.get('cc')
 
     # Extract body
-    body = ''
-    payload = message.get('payload', {})
-    if 'parts' in payload:
-        for part in payload['parts']:
-            if part['mimeType'] == 'text/plain':
-                body = base64.urlsafe_b64decode(part['body'].get('data', '')).decode('utf-8')
-                break
-    elif 'body' in payload and 'data' in payload['body']:
-        body = base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8')
+    body = _plain_text_body(message.get('payload', {}))
 
     output = f"Draft Details:\n\n"
     output += f"Draft ID: {draft['id']}\n"
@@ -648,25 +1435,17 @@ def gmail_update_draft(draft_id: str, to: Optional[str] = None, subject: Optiona
     service = get_service('gmail', 'v1')
 
     # Get current draft
-    current_draft = service.users().drafts().get(userId='me', id=draft_id, format='full').execute()
+    current_draft = execute_with_retry(service.users().drafts().get(userId='me', id=draft_id, format='full'))
     current_message = current_draft.get('message', {})
 
     # Extract current values
-    headers = current_message.get('payload', {}).get('headers', [])
-    current_to = next((h['value'] for h in headers if h['name'] == 'To'), '')
-    current_subject = next((h['value'] for h in headers if h['name'] == 'Subject'), '')
-    current_cc = next((h['value'] for h in headers if h['name'] == 'Cc'), None)
+    headers = _header_map(current_message.get('payload', {}).get('headers', []))
+    current_to = headers.get('to', '')
+    current_subject = headers.get('subject', '')
+    current_cc = headers.get('cc')
 
     # Extract current body
-    current_body = ''
-    payload = current_message.get('payload', {})
-    if 'parts' in payload:
-        for part in payload['parts']:
-            if part['mimeType'] == 'text/plain':
-                current_body = base64.urlsafe_b64decode(part['body'].get('data', '')).decode('utf-8')
-                break
-    elif 'body' in payload and 'data' in payload['body']:
-        current_body = base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8')
+    current_body = _plain_text_body(current_message.get('payload', {}))
 
     # Use new values if provided, otherwise keep current
     final_to = to if to is not None else current_to
@@ -675,20 +1454,14 @@ def gmail_update_draft(draft_id: str, to: Optional[str] = None, subject: Optiona
     final_cc = cc if cc is not None else current_cc
 
     # Create updated message
-    message = MIMEText(final_body)
-    message['to'] = final_to
-    message['subject'] = final_subject
-    if final_cc:
-        message['cc'] = final_cc
-
-    raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+    raw = _raw_message(final_to, final_subject, final_body, final_cc)
 
     # Update draft
-    updated_draft = service.users().drafts().update(
+    updated_draft = execute_with_retry(service.users().drafts().update(
         userId='me',
         id=draft_id,
         body={'message': {'raw': raw}}
-    ).execute()
+    ))
 
     return f"✅ Draft updated!\nDraft ID: {updated_draft['id']}\nTo: {final_to}\nSubject: {final_subject}"
 
@@ -708,7 +1481,7 @@ def gmail_delete_draft(draft_id: str) -> str:
     """Delete a draft email."""
     service = get_service('gmail', 'v1')
 
-    service.users().drafts().delete(userId='me', id=draft_id).execute()
+    execute_with_retry(service.users().drafts().delete(userId='me', id=draft_id))
 
     return f"✅ Draft {draft_id} deleted"
 
@@ -722,7 +1495,7 @@ def gmail_get_profile() -> str:
     """
     service = get_service('gmail', 'v1')
 
-    profile = service.users().getProfile(userId='me').execute()
+    profile = execute_with_retry(service.users().getProfile(userId='me'))
 
     output = f"Gmail Profile:\n\n"
     output += f"Email Address: {profile.get('emailAddress', 'N/A')}\n"
@@ -742,7 +1515,7 @@ def gmail_list_filters() -> str:
     """
     service = get_service('gmail', 'v1')
 
-    filters = service.users().settings().filters().list(userId='me').execute()
+    filters = execute_with_retry(service.users().settings().filters().list(userId='me'))
     filter_list = filters.get('filter', [])
 
     if not filter_list:
@@ -864,7 +1637,7 @@ def gmail_create_filter(criteria_from: Optional[str] = None, criteria_to: Option
         'action': action
     }
 
-    created = service.users().settings().filters().create(userId='me', body=filter_body).execute()
+    created = execute_with_retry(service.users().settings().filters().create(userId='me', body=filter_body))
 
     return f"✅ Filter created!\nFilter ID: {created.get('id', 'N/A')}"
 
@@ -878,7 +1651,7 @@ def gmail_delete_filter(filter_id: str) -> str:
     """
     service = get_service('gmail', 'v1')
 
-    service.users().settings().filters().delete(userId='me', id=filter_id).execute()
+    execute_with_retry(service.users().settings().filters().delete(userId='me', id=filter_id))
 
     return f"✅ Filter {filter_id} deleted"
 
@@ -891,7 +1664,7 @@ def gmail_get_vacation_settings() -> str:
     """
     service = get_service('gmail', 'v1')
 
-    settings = service.users().settings().getVacation(userId='me').execute()
+    settings = execute_with_retry(service.users().settings().getVacation(userId='me'))
 
     enabled = settings.get('enableAutoReply', False)
 
@@ -966,7 +1739,7 @@ def gmail_set_vacation_responder(enable: bool, response_subject: Optional[str] =
         vacation_settings['restrictToContacts'] = restrict_to_contacts
         vacation_settings['restrictToDomain'] = restrict_to_domain
 
-    service.users().settings().updateVacation(userId='me', body=vacation_settings).execute()
+    execute_with_retry(service.users().settings().updateVacation(userId='me', body=vacation_settings))
 
     status = "ENABLED" if enable else "DISABLED"
     return f"✅ Vacation responder {status}"
@@ -976,38 +1749,72 @@ def gmail_set_vacation_responder(enable: bool, response_subject: Optional[str] =
 # DRIVE TOOLS (with Shared Drive support)
 # ============================================================================
 
+# Largest pageSize files.list accepts; bigger requests are paged through.
+DRIVE_PAGE_MAX = 1000
+
+
+_QUERY_QUOTED = re.compile(r"'(?:[^'\\]|\\.)*'" r'|"(?:[^"\\]|\\.)*"')
+
+
+def _drive_quote(value: str) -> str:
+    """Quote a value as a Drive query string literal."""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def _unbalanced_query(query: str) -> bool:
+    """True when a Drive query has an unterminated string literal or unbalanced parentheses.
+
+    Drive rejects such queries with a 400, so catching them here saves the round trip.
+    """
+    bare = _QUERY_QUOTED.sub('', query)
+    return "'" in bare or '"' in bare or bare.count('(') != bare.count(')')
+
+
 @mcp.tool()
 def drive_list_shared_drives(page_size: int = 100) -> str:
     """List all shared drives (Team Drives) the user has access to."""
     service = get_service('drive', 'v3')
-    results = service.drives().list(pageSize=page_size, fields="drives(id, name)").execute()
-    drives = results.get('drives', [])
+    drives = list(itertools.islice(paginate(
+        lambda token: service.drives().list(pageSize=min(page_size, 100), pageToken=token,
+                                            fields="nextPageToken, drives(id, name)"),
+        'drives'), page_size))
+
+    if JSON_OUTPUT:
+        return to_json(drives)
 
     if not drives:
         return "No shared drives found."
 
-    output = f"Found {len(drives)} shared drive(s):\n\n"
+    output = [f"Found {len(drives)} shared drive(s):\n\n"]
     for drive in drives:
-        output += f"📁 {drive['name']}\n   ID: {drive['id']}\n\n"
-    return output
+        output.append(f"📁 {drive['name']}\n   ID: {drive['id']}\n\n")
+    return ''.join(output)
 
 
 @mcp.tool()
 def drive_list_files(folder_id: Optional[str] = None, drive_id: Optional[str] = None,
-                     query: Optional[str] = None, page_size: int = 20) -> str:
-    """List files and folders in Google Drive or Shared Drives."""
+                     query: Optional[str] = None, page_size: int = 20,
+                     order_by: Optional[str] = "modifiedTime desc") -> str:
+    """List files and folders in Google Drive or Shared Drives.
+
+    order_by is passed to Drive as orderBy. Set it to an empty string to skip the
+    server-side sort, which is faster on large shared drives; the files returned are
+    then whichever page_size Drive finds first, shown newest first.
+    """
     service = get_service('drive', 'v3')
 
     q_parts = []
     if folder_id:
-        q_parts.append(f"'{folder_id}' in parents")
+        q_parts.append(f"{_drive_quote(folder_id)} in parents")
     if query:
-        q_parts.append(query)
+        if _unbalanced_query(query):
+            return f"❌ Invalid query (unclosed quote or parenthesis): {query}"
+        q_parts.append(f"({query})")
 
     params = {
-        'pageSize': page_size,
-        'fields': 'files(id, name, mimeType, modifiedTime, size, webViewLink)',
-        'orderBy': 'modifiedTime desc'
+        'pageSize': min(page_size, DRIVE_PAGE_MAX),
+        'fields': 'nextPageToken, files(id, name, mimeType, modifiedTime, size, webViewLink)',
+        'orderBy': order_by or None
     }
 
     if q_parts:
@@ -1021,17 +1828,22 @@ def drive_list_files(folder_id: Optional[str] = None, drive_id: Optional[str] =
     else:
         params['corpora'] = 'user'
 
-    results = service.files().list(**params).execute()
-    files = results.get('files', [])
+    files = list(itertools.islice(
+        paginate(lambda token: service.files().list(pageToken=token, **params), 'files'), page_size))
+    if not order_by:
+        files.sort(key=lambda f: f.get('modifiedTime', ''), reverse=True)
+
+    if JSON_OUTPUT:
+        return to_json(files)
 
     if not files:
         return "No files found."
 
-    output = f"Found {len(files)} file(s):\n\n"
+    output = [f"Found {len(files)} file(s):\n\n"]
     for file in files:
         icon = "📁" if file['mimeType'] == 'application/vnd.google-apps.folder' else "📄"
-        output += f"{icon} {file['name']}\n   ID: {file['id']}\n   Type: {file['mimeType']}\n   Link: {file.get('webViewLink', 'N/A')}\n\n"
-    return output
+        output.append(f"{icon} {file['name']}\n   ID: {file['id']}\n   Type: {file['mimeType']}\n   Link: {file.get('webViewLink', 'N/A')}\n\n")
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1049,6 +1861,10 @@ def drive_create_folder(name: str, parent_id: Optional[str] = None, drive_id: Op
     return f"✅ Folder created!\nName: {folder['name']}\nID: {folder['id']}\nLink: {folder.get('webViewLink', 'N/A')}"
 
 
+# Files up to this size are uploaded in a single multipart request.
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+
+
 @mcp.tool()
 def drive_upload_file(file_path: str, name: Optional[str] = None, parent_id: Optional[str] = None,
                       drive_id: Optional[str] = None) -> str:
@@ -1063,7 +1879,12 @@ def drive_upload_file(file_path: str, name: Optional[str] = None, parent_id: Opt
     if parent_id:
         file_metadata['parents'] = [parent_id]
 
-    media = MediaFileUpload(file_path, resumable=True)
+    # Small files go up in one multipart request; larger ones stay resumable but are
+    # streamed as a single PUT (chunksize=-1) instead of waiting on each chunk's reply
+    if path.stat().st_size <= SIMPLE_UPLOAD_LIMIT:
+        media = MediaFileUpload(file_path, resumable=False)
+    else:
+        media = MediaFileUpload(file_path, chunksize=-1, resumable=True)
     params = {'supportsAllDrives': True} if drive_id else {}
 
     file = service.files().create(body=file_metadata, media_body=media, fields='id, name, webViewLink', **params).execute()
@@ -1109,6 +1930,72 @@ def drive_share_file(file_id: str, email: str, role: str = "reader", drive_id: O
     return f"✅ Shared file {file_id} with {email} as {role}"
 
 
+# name/mimeType of recently downloaded or exported files, so a follow-up download or
+# export of the same file skips the metadata lookup.
+_file_meta_cache = TTLCache(ttl=60, maxsize=4096)
+
+
+def _file_name_and_type(service, file_id: str, params: dict) -> dict:
+    """A file's name and mimeType, from the short-lived cache when possible."""
+    metadata = _file_meta_cache.get(file_id)
+    if metadata is None:
+        metadata = service.files().get(fileId=file_id, fields='name, mimeType', **params).execute()
+        _file_meta_cache.set(file_id, metadata)
+    return metadata
+
+
+# Google Workspace files cannot be downloaded as-is; these are exported instead.
+_DOWNLOAD_EXPORT_MIMES = {
+    'application/vnd.google-apps.document': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'application/vnd.google-apps.spreadsheet': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'application/vnd.google-apps.presentation': 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+}
+_DOWNLOAD_EXPORT_EXTENSIONS = {
+    'application/vnd.google-apps.document': '.docx',
+    'application/vnd.google-apps.spreadsheet': '.xlsx',
+    'application/vnd.google-apps.presentation': '.pptx'
+}
+
+
+def _download_request(service, file_id: str, mime_type: str, params: dict):
+    """Media request for a file's content, exporting Google Workspace files to Office formats."""
+    if mime_type in _DOWNLOAD_EXPORT_MIMES:
+        return service.files().export_media(fileId=file_id, mimeType=_DOWNLOAD_EXPORT_MIMES[mime_type])
+    return service.files().get_media(fileId=file_id, **params)
+
+
+# Bytes copied per write when streaming a download to disk.
+MEDIA_COPY_CHUNK = 1024 * 1024
+
+_media_session_cache = None
+_media_session_lock = threading.Lock()
+
+
+def _media_session() -> AuthorizedSession:
+    """Pooled requests session for media downloads, rebuilt when the credentials change."""
+    global _media_session_cache
+    creds = get_credentials()
+    with _media_session_lock:
+        if _media_session_cache is None or _media_session_cache.credentials is not creds:
+            _media_session_cache = AuthorizedSession(creds)
+        return _media_session_cache
+
+
+def _save_media(request, dest_path) -> None:
+    """Stream a media request's content to dest_path with a single GET.
+
+    MediaIoBaseDownload issues one ranged request per chunk and buffers each chunk in
+    memory; streaming the response body copies it straight to the file instead.
+    """
+    _rate_limiter.acquire()
+    with _media_session().get(request.uri, stream=True, timeout=HTTP_TIMEOUT) as response:
+        if response.status_code >= 400:
+            raise HttpError(httplib2.Response({'status': response.status_code}), response.content, uri=request.uri)
+        response.raw.decode_content = True
+        with open(dest_path, 'wb') as fh:
+            shutil.copyfileobj(response.raw, fh, MEDIA_COPY_CHUNK)
+
+
 @mcp.tool()
 def drive_download_file(file_id: str, destination_path: str, drive_id: Optional[str] = None) -> str:
     """Download a file from Google Drive to local filesystem."""
@@ -1117,46 +2004,90 @@ def drive_download_file(file_id: str, destination_path: str, drive_id: Optional[
     params = {'supportsAllDrives': True} if drive_id else {}
 
     # Get file metadata to check if it's a Google Workspace file
-    file_metadata = service.files().get(fileId=file_id, fields='name, mimeType', **params).execute()
+    file_metadata = _file_name_and_type(service, file_id, params)
     file_name = file_metadata['name']
     mime_type = file_metadata['mimeType']
 
-    # Handle Google Workspace files (need to export)
-    export_mimes = {
-        'application/vnd.google-apps.document': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-        'application/vnd.google-apps.spreadsheet': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        'application/vnd.google-apps.presentation': 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
-    }
-
     dest_path = Path(destination_path)
+    _save_media(_download_request(service, file_id, mime_type, params), dest_path)
 
-    if mime_type in export_mimes:
-        # Export Google Workspace file
-        request = service.files().export_media(fileId=file_id, mimeType=export_mimes[mime_type])
-    else:
-        # Download regular file
-        request = service.files().get_media(fileId=file_id, **params)
+    return f"✅ Downloaded file!\nName: {file_name}\nSaved to: {dest_path}"
 
-    fh = io.FileIO(dest_path, 'wb')
-    downloader = MediaIoBaseDownload(fh, request)
 
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
+@mcp.tool()
+def drive_download_many(file_ids: str, destination_dir: str, drive_id: Optional[str] = None) -> str:
+    """Download several files into a local folder, fetching them in parallel.
 
-    return f"✅ Downloaded file!\nName: {file_name}\nSaved to: {dest_path}"
+    Args:
+        file_ids: Comma-separated file IDs
+        destination_dir: Local folder to save into (created if missing). Existing files are not
+            overwritten, and Google Docs, Sheets and Slides are saved as .docx, .xlsx and .pptx.
+    """
+    service = get_service('drive', 'v3')
+
+    ids = [fid.strip() for fid in file_ids.split(',') if fid.strip()]
+    params = {'supportsAllDrives': True} if drive_id else {}
+    dest_dir = Path(destination_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    # Resolve every file's name and type in one batched request
+    fetched = execute_batch(service, [
+        service.files().get(fileId=file_id, fields='name, mimeType', **params) for file_id in ids
+    ])
+
+    jobs = []
+    used_names = set()
+    output = []
+    for file_id, (metadata, error) in zip(ids, fetched):
+        if error:
+            output.append(f"❌ {file_id}: {str(error)}\n")
+            continue
+        _file_meta_cache.set(file_id, metadata)
+        name = metadata['name'].replace('/', '_')
+        # Workspace files are exported to Office formats, so name them accordingly
+        extension = _DOWNLOAD_EXPORT_EXTENSIONS.get(metadata['mimeType'], '')
+        if not name.lower().endswith(extension):
+            name += extension
+        if name in used_names:
+            name = f"{file_id}_{name}"
+        used_names.add(name)
+        if (dest_dir / name).exists():
+            output.append(f"❌ {file_id}: {dest_dir / name} already exists, not overwritten\n")
+            continue
+        jobs.append((file_id, dest_dir / name, _download_request(service, file_id, metadata['mimeType'], params)))
+
+    def download(job):
+        file_id, dest_path, request = job
+        try:
+            _save_media(request, dest_path)
+            return f"✅ {file_id} -> {dest_path}\n"
+        except Exception as e:
+            return f"❌ {file_id}: {str(e)}\n"
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(jobs))) as pool:
+            output.extend(pool.map(download, jobs))
+
+    return ''.join(output)
 
 
 @mcp.tool()
-def drive_move_file(file_id: str, new_parent_id: str, drive_id: Optional[str] = None) -> str:
-    """Move a file to a different folder."""
+def drive_move_file(file_id: str, new_parent_id: str, drive_id: Optional[str] = None,
+                    old_parent_id: Optional[str] = None) -> str:
+    """Move a file to a different folder.
+
+    Pass old_parent_id (comma-separated for several) when the current folder is known,
+    to skip looking it up.
+    """
     service = get_service('drive', 'v3')
 
     params = {'supportsAllDrives': True} if drive_id else {}
 
-    # Get current parents
-    file = service.files().get(fileId=file_id, fields='parents', **params).execute()
-    previous_parents = ",".join(file.get('parents', []))
+    # Get current parents, unless given
+    previous_parents = old_parent_id
+    if previous_parents is None:
+        file = service.files().get(fileId=file_id, fields='parents', **params).execute()
+        previous_parents = ",".join(file.get('parents', []))
 
     # Move file
     file = service.files().update(
@@ -1183,19 +2114,22 @@ def drive_get_file_metadata(file_id: str, drive_id: Optional[str] = None) -> str
         **params
     ).execute()
 
-    output = f"File: {file['name']}\n"
-    output += f"ID: {file['id']}\n"
-    output += f"Type: {file['mimeType']}\n"
-    output += f"Size: {file.get('size', 'N/A')} bytes\n"
-    output += f"Created: {file.get('createdTime', 'N/A')}\n"
-    output += f"Modified: {file.get('modifiedTime', 'N/A')}\n"
-    output += f"View Link: {file.get('webViewLink', 'N/A')}\n"
+    if JSON_OUTPUT:
+        return to_json(file)
+
+    output = [f"File: {file['name']}\n"]
+    output.append(f"ID: {file['id']}\n")
+    output.append(f"Type: {file['mimeType']}\n")
+    output.append(f"Size: {file.get('size', 'N/A')} bytes\n")
+    output.append(f"Created: {file.get('createdTime', 'N/A')}\n")
+    output.append(f"Modified: {file.get('modifiedTime', 'N/A')}\n")
+    output.append(f"View Link: {file.get('webViewLink', 'N/A')}\n")
 
     if 'owners' in file:
         owners = ", ".join([owner.get('displayName', owner.get('emailAddress', 'Unknown')) for owner in file['owners']])
-        output += f"Owners: {owners}\n"
+        output.append(f"Owners: {owners}\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1203,10 +2137,13 @@ def drive_search_files(query: str, drive_id: Optional[str] = None, page_size: in
     """Advanced file search using Google Drive query syntax. Example: 'name contains \"report\" and mimeType contains \"pdf\"'"""
     service = get_service('drive', 'v3')
 
+    if _unbalanced_query(query):
+        return f"❌ Invalid query (unclosed quote or parenthesis): {query}"
+
     params = {
         'q': query,
-        'pageSize': page_size,
-        'fields': 'files(id, name, mimeType, modifiedTime, size, webViewLink)',
+        'pageSize': min(page_size, DRIVE_PAGE_MAX),
+        'fields': 'nextPageToken, files(id, name, mimeType, modifiedTime, size, webViewLink)',
         'orderBy': 'modifiedTime desc'
     }
 
@@ -1218,23 +2155,26 @@ def drive_search_files(query: str, drive_id: Optional[str] = None, page_size: in
     else:
         params['corpora'] = 'user'
 
-    results = service.files().list(**params).execute()
-    files = results.get('files', [])
+    files = list(itertools.islice(
+        paginate(lambda token: service.files().list(pageToken=token, **params), 'files'), page_size))
+
+    if JSON_OUTPUT:
+        return to_json(files)
 
     if not files:
         return f"No files found matching: {query}"
 
-    output = f"Found {len(files)} file(s) matching '{query}':\n\n"
+    output = [f"Found {len(files)} file(s) matching '{query}':\n\n"]
     for file in files:
         icon = "📁" if file['mimeType'] == 'application/vnd.google-apps.folder' else "📄"
         size = f"{file.get('size', 'N/A')} bytes" if 'size' in file else 'N/A'
-        output += f"{icon} {file['name']}\n"
-        output += f"   ID: {file['id']}\n"
-        output += f"   Size: {size}\n"
-        output += f"   Modified: {file.get('modifiedTime', 'N/A')}\n"
-        output += f"   Link: {file.get('webViewLink', 'N/A')}\n\n"
+        output.append(f"{icon} {file['name']}\n")
+        output.append(f"   ID: {file['id']}\n")
+        output.append(f"   Size: {size}\n")
+        output.append(f"   Modified: {file.get('modifiedTime', 'N/A')}\n")
+        output.append(f"   Link: {file.get('webViewLink', 'N/A')}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1250,6 +2190,7 @@ def drive_rename_file(file_id: str, new_name: str, drive_id: Optional[str] = Non
         fields='id, name',
         **params
     ).execute()
+    _file_meta_cache.pop(file_id)
 
     return f"✅ Renamed file!\nNew name: {file['name']}\nID: {file['id']}"
 
@@ -1261,37 +2202,40 @@ def drive_list_permissions(file_id: str, drive_id: Optional[str] = None) -> str:
 
     params = {'supportsAllDrives': True} if drive_id else {}
 
-    permissions = service.permissions().list(
+    perms = list(paginate(lambda token: service.permissions().list(
         fileId=file_id,
-        fields='permissions(id, type, role, emailAddress, domain, displayName)',
+        pageSize=100,
+        pageToken=token,
+        fields='nextPageToken, permissions(id, type, role, emailAddress, domain, displayName)',
         **params
-    ).execute()
+    ), 'permissions'))
 
-    perms = permissions.get('permissions', [])
+    if JSON_OUTPUT:
+        return to_json(perms)
 
     if not perms:
         return "No permissions found (file is private)."
 
-    output = f"Permissions for file {file_id}:\n\n"
+    output = [f"Permissions for file {file_id}:\n\n"]
     for perm in perms:
         perm_type = perm.get('type', 'unknown')
         role = perm.get('role', 'unknown')
 
         if perm_type == 'user':
-            output += f"👤 {perm.get('displayName', perm.get('emailAddress', 'Unknown'))}\n"
-            output += f"   Email: {perm.get('emailAddress', 'N/A')}\n"
+            output.append(f"👤 {perm.get('displayName', perm.get('emailAddress', 'Unknown'))}\n")
+            output.append(f"   Email: {perm.get('emailAddress', 'N/A')}\n")
         elif perm_type == 'group':
-            output += f"👥 {perm.get('displayName', perm.get('emailAddress', 'Unknown'))}\n"
-            output += f"   Email: {perm.get('emailAddress', 'N/A')}\n"
+            output.append(f"👥 {perm.get('displayName', perm.get('emailAddress', 'Unknown'))}\n")
+            output.append(f"   Email: {perm.get('emailAddress', 'N/A')}\n")
         elif perm_type == 'domain':
-            output += f"🏢 Domain: {perm.get('domain', 'Unknown')}\n"
+            output.append(f"🏢 Domain: {perm.get('domain', 'Unknown')}\n")
         elif perm_type == 'anyone':
-            output += f"🌐 Anyone with the link\n"
+            output.append(f"🌐 Anyone with the link\n")
 
-        output += f"   Role: {role}\n"
-        output += f"   Permission ID: {perm['id']}\n\n"
+        output.append(f"   Role: {role}\n")
+        output.append(f"   Permission ID: {perm['id']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1370,27 +2314,30 @@ def drive_list_trashed_files(page_size: int = 20) -> str:
     """List files in the trash."""
     service = get_service('drive', 'v3')
 
-    results = service.files().list(
-        q="trashed=true",
-        pageSize=page_size,
-        fields='files(id, name, mimeType, trashedTime, webViewLink)',
-        orderBy='trashedTime desc'
-    ).execute()
+    files = list(itertools.islice(paginate(
+        lambda token: service.files().list(
+            q="trashed=true",
+            pageSize=min(page_size, DRIVE_PAGE_MAX),
+            pageToken=token,
+            fields='nextPageToken, files(id, name, mimeType, trashedTime, webViewLink)',
+            orderBy='trashedTime desc'
+        ), 'files'), page_size))
 
-    files = results.get('files', [])
+    if JSON_OUTPUT:
+        return to_json(files)
 
     if not files:
         return "Trash is empty."
 
-    output = f"Found {len(files)} file(s) in trash:\n\n"
+    output = [f"Found {len(files)} file(s) in trash:\n\n"]
     for file in files:
         icon = "📁" if file['mimeType'] == 'application/vnd.google-apps.folder' else "📄"
-        output += f"{icon} {file['name']}\n"
-        output += f"   ID: {file['id']}\n"
-        output += f"   Trashed: {file.get('trashedTime', 'N/A')}\n"
-        output += f"   Link: {file.get('webViewLink', 'N/A')}\n\n"
+        output.append(f"{icon} {file['name']}\n")
+        output.append(f"   ID: {file['id']}\n")
+        output.append(f"   Trashed: {file.get('trashedTime', 'N/A')}\n")
+        output.append(f"   Link: {file.get('webViewLink', 'N/A')}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1420,6 +2367,34 @@ def drive_empty_trash() -> str:
     return f"✅ Trash emptied! All trashed files permanently deleted."
 
 
+# Export formats available for each Google Workspace file type, by MIME type.
+_EXPORT_MAPPINGS = {
+    'application/vnd.google-apps.document': {
+        'pdf': 'application/pdf',
+        'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        'txt': 'text/plain',
+        'html': 'text/html',
+        'zip': 'application/zip',
+        'epub': 'application/epub+zip',
+        'rtf': 'application/rtf',
+        'odt': 'application/vnd.oasis.opendocument.text'
+    },
+    'application/vnd.google-apps.spreadsheet': {
+        'pdf': 'application/pdf',
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'csv': 'text/csv',
+        'zip': 'application/zip',
+        'ods': 'application/vnd.oasis.opendocument.spreadsheet'
+    },
+    'application/vnd.google-apps.presentation': {
+        'pdf': 'application/pdf',
+        'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+        'txt': 'text/plain',
+        'odp': 'application/vnd.oasis.opendocument.presentation'
+    }
+}
+
+
 @mcp.tool()
 def drive_export_file(file_id: str, destination_path: str, export_format: str = "pdf") -> str:
     """Export a Google Workspace file to a specific format.
@@ -1428,59 +2403,79 @@ def drive_export_file(file_id: str, destination_path: str, export_format: str =
     service = get_service('drive', 'v3')
 
     # Get file metadata to determine type
-    file_metadata = service.files().get(fileId=file_id, fields='name, mimeType').execute()
+    file_metadata = _file_name_and_type(service, file_id, {})
     mime_type = file_metadata['mimeType']
     file_name = file_metadata['name']
 
-    # Map export formats to MIME types for each Google Workspace file type
-    export_mappings = {
-        'application/vnd.google-apps.document': {
-            'pdf': 'application/pdf',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'txt': 'text/plain',
-            'html': 'text/html',
-            'zip': 'application/zip',
-            'epub': 'application/epub+zip',
-            'rtf': 'application/rtf',
-            'odt': 'application/vnd.oasis.opendocument.text'
-        },
-        'application/vnd.google-apps.spreadsheet': {
-            'pdf': 'application/pdf',
-            'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            'csv': 'text/csv',
-            'zip': 'application/zip',
-            'ods': 'application/vnd.oasis.opendocument.spreadsheet'
-        },
-        'application/vnd.google-apps.presentation': {
-            'pdf': 'application/pdf',
-            'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            'txt': 'text/plain',
-            'odp': 'application/vnd.oasis.opendocument.presentation'
-        }
-    }
-
-    if mime_type not in export_mappings:
+    if mime_type not in _EXPORT_MAPPINGS:
         return f"❌ Cannot export {mime_type}. Only Google Docs, Sheets, and Slides can be exported."
 
-    if export_format not in export_mappings[mime_type]:
-        available = ', '.join(export_mappings[mime_type].keys())
+    if export_format not in _EXPORT_MAPPINGS[mime_type]:
+        available = ', '.join(_EXPORT_MAPPINGS[mime_type].keys())
         return f"❌ Format '{export_format}' not available for this file type. Available: {available}"
 
-    export_mime = export_mappings[mime_type][export_format]
+    export_mime = _EXPORT_MAPPINGS[mime_type][export_format]
 
     # Export the file
     request = service.files().export_media(fileId=file_id, mimeType=export_mime)
 
     dest_path = Path(destination_path)
-    fh = io.FileIO(dest_path, 'wb')
-    downloader = MediaIoBaseDownload(fh, request)
-
-    done = False
-    while not done:
-        status, done = downloader.next_chunk()
+    _save_media(request, dest_path)
 
     return f"✅ Exported file to {export_format}!\nName: {file_name}\nSaved to: {dest_path}"
 
+@mcp.tool()
+def drive_export_many(file_ids: str, destination_dir: str, export_format: str = "pdf") -> str:
+    """Export several Google Workspace files into a local folder, in parallel.
+
+    Args:
+        file_ids: Comma-separated file IDs (Docs, Sheets or Slides)
+        destination_dir: Local folder to save into (created if missing)
+        export_format: Format for every file, e.g. pdf, docx, xlsx (see drive_export_file)
+    """
+    service = get_service('drive', 'v3')
+
+    ids = [fid.strip() for fid in file_ids.split(',') if fid.strip()]
+    dest_dir = Path(destination_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+
+    # Resolve every file's name and type in one batched request
+    fetched = execute_batch(service, [
+        service.files().get(fileId=file_id, fields='name, mimeType') for file_id in ids
+    ])
+
+    jobs = []
+    used_names = set()
+    output = []
+    for file_id, (metadata, error) in zip(ids, fetched):
+        if error:
+            output.append(f"❌ {file_id}: {str(error)}\n")
+            continue
+        _file_meta_cache.set(file_id, metadata)
+        export_mime = _EXPORT_MAPPINGS.get(metadata['mimeType'], {}).get(export_format)
+        if export_mime is None:
+            output.append(f"❌ {file_id}: cannot export {metadata['mimeType']} as {export_format}\n")
+            continue
+        name = f"{metadata['name'].replace('/', '_')}.{export_format}"
+        if name in used_names:
+            name = f"{file_id}_{name}"
+        used_names.add(name)
+        jobs.append((file_id, dest_dir / name, service.files().export_media(fileId=file_id, mimeType=export_mime)))
+
+    def export(job):
+        file_id, dest_path, request = job
+        try:
+            _save_media(request, dest_path)
+            return f"✅ {file_id} -> {dest_path}\n"
+        except Exception as e:
+            return f"❌ {file_id}: {str(e)}\n"
+
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENCY, len(jobs))) as pool:
+            output.extend(pool.map(export, jobs))
+
+    return ''.join(output)
+
 
 @mcp.tool()
 def drive_create_shortcut(name: str, target_file_id: str, parent_id: Optional[str] = None, drive_id: Optional[str] = None) -> str:
@@ -1515,32 +2510,35 @@ def drive_list_revisions(file_id: str) -> str:
     service = get_service('drive', 'v3')
 
     try:
-        revisions = service.revisions().list(
+        revs = list(paginate(lambda token: service.revisions().list(
             fileId=file_id,
-            fields='revisions(id, modifiedTime, lastModifyingUser, size)'
-        ).execute()
+            pageSize=1000,
+            pageToken=token,
+            fields='nextPageToken, revisions(id, modifiedTime, lastModifyingUser, size)'
+        ), 'revisions'))
 
-        revs = revisions.get('revisions', [])
+        if JSON_OUTPUT:
+            return to_json(revs)
 
         if not revs:
             return f"No revisions found for file {file_id}"
 
-        output = f"Found {len(revs)} revision(s) for file {file_id}:\n\n"
+        output = [f"Found {len(revs)} revision(s) for file {file_id}:\n\n"]
         for idx, rev in enumerate(revs, 1):
-            output += f"Version {idx}:\n"
-            output += f"  Revision ID: {rev['id']}\n"
-            output += f"  Modified: {rev.get('modifiedTime', 'N/A')}\n"
+            output.append(f"Version {idx}:\n")
+            output.append(f"  Revision ID: {rev['id']}\n")
+            output.append(f"  Modified: {rev.get('modifiedTime', 'N/A')}\n")
 
             if 'lastModifyingUser' in rev:
                 user = rev['lastModifyingUser']
-                output += f"  Modified by: {user.get('displayName', user.get('emailAddress', 'Unknown'))}\n"
+                output.append(f"  Modified by: {user.get('displayName', user.get('emailAddress', 'Unknown'))}\n")
 
             if 'size' in rev:
-                output += f"  Size: {rev['size']} bytes\n"
+                output.append(f"  Size: {rev['size']} bytes\n")
 
-            output += "\n"
+            output.append("\n")
 
-        return output
+        return ''.join(output)
 
     except Exception as e:
         return f"❌ Error listing revisions: {str(e)}\nNote: Revisions are only available for Google Docs, Sheets, and Slides."
@@ -1574,32 +2572,35 @@ def drive_list_comments(file_id: str, drive_id: Optional[str] = None) -> str:
 
     params = {'supportsAllDrives': True} if drive_id else {}
 
-    comments = service.comments().list(
+    comment_list = list(paginate(lambda token: service.comments().list(
         fileId=file_id,
-        fields='comments(id, content, author, createdTime, resolved, replies)',
+        pageSize=100,
+        pageToken=token,
+        fields='nextPageToken, comments(id, content, author, createdTime, resolved, replies)',
         **params
-    ).execute()
+    ), 'comments'))
 
-    comment_list = comments.get('comments', [])
+    if JSON_OUTPUT:
+        return to_json(comment_list)
 
     if not comment_list:
         return f"No comments found on file {file_id}"
 
-    output = f"Found {len(comment_list)} comment(s):\n\n"
+    output = [f"Found {len(comment_list)} comment(s):\n\n"]
     for comment in comment_list:
         author = comment.get('author', {})
-        output += f"💬 {author.get('displayName', 'Unknown')}: {comment.get('content', '')}\n"
-        output += f"   ID: {comment['id']}\n"
-        output += f"   Created: {comment.get('createdTime', 'N/A')}\n"
-        output += f"   Resolved: {comment.get('resolved', False)}\n"
+        output.append(f"💬 {author.get('displayName', 'Unknown')}: {comment.get('content', '')}\n")
+        output.append(f"   ID: {comment['id']}\n")
+        output.append(f"   Created: {comment.get('createdTime', 'N/A')}\n")
+        output.append(f"   Resolved: {comment.get('resolved', False)}\n")
 
         replies = comment.get('replies', [])
         if replies:
-            output += f"   Replies: {len(replies)}\n"
+            output.append(f"   Replies: {len(replies)}\n")
 
-        output += "\n"
+        output.append("\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1777,20 +2778,20 @@ def drive_list_parents(file_id: str, drive_id: Optional[str] = None) -> str:
     if not parents:
         return f"File {file_id} has no parent folders (orphaned file)"
 
-    output = f"File is in {len(parents)} folder(s):\n\n"
-    for parent_id in parents:
-        # Get parent folder details
-        try:
-            parent = service.files().get(
-                fileId=parent_id,
-                fields='name',
-                **params
-            ).execute()
-            output += f"📁 {parent.get('name', 'Unknown')}\n   ID: {parent_id}\n\n"
-        except:
-            output += f"📁 Folder ID: {parent_id}\n\n"
+    # Look up every parent's name in one batched request
+    fetched = execute_batch(service, [
+        service.files().get(fileId=parent_id, fields='name', **params)
+        for parent_id in parents
+    ])
 
-    return output
+    output = [f"File is in {len(parents)} folder(s):\n\n"]
+    for parent_id, (parent, error) in zip(parents, fetched):
+        if error:
+            output.append(f"📁 Folder ID: {parent_id}\n\n")
+        else:
+            output.append(f"📁 {parent.get('name', 'Unknown')}\n   ID: {parent_id}\n\n")
+
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1799,7 +2800,7 @@ def drive_create_shared_drive(name: str) -> str:
     service = get_service('drive', 'v3')
 
     # Generate a unique request ID for idempotency
-    request_id = f"create_drive_{int(datetime.now().timestamp())}"
+    request_id = f"create_drive_{uuid.uuid4().hex}"
 
     drive_metadata = {
         'name': name
@@ -1875,20 +2876,20 @@ def drive_get_revision(file_id: str, revision_id: str) -> str:
         fields='id, modifiedTime, lastModifyingUser, size, keepForever, published'
     ).execute()
 
-    output = f"Revision {revision_id}:\n"
-    output += f"Modified: {revision.get('modifiedTime', 'N/A')}\n"
+    output = [f"Revision {revision_id}:\n"]
+    output.append(f"Modified: {revision.get('modifiedTime', 'N/A')}\n")
 
     if 'lastModifyingUser' in revision:
         user = revision['lastModifyingUser']
-        output += f"Modified by: {user.get('displayName', user.get('emailAddress', 'Unknown'))}\n"
+        output.append(f"Modified by: {user.get('displayName', user.get('emailAddress', 'Unknown'))}\n")
 
     if 'size' in revision:
-        output += f"Size: {revision['size']} bytes\n"
+        output.append(f"Size: {revision['size']} bytes\n")
 
-    output += f"Keep forever: {revision.get('keepForever', False)}\n"
-    output += f"Published: {revision.get('published', False)}\n"
+    output.append(f"Keep forever: {revision.get('keepForever', False)}\n")
+    output.append(f"Published: {revision.get('published', False)}\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1933,11 +2934,7 @@ def drive_download_revision(file_id: str, revision_id: str, destination_path: st
         revisionId=revision_id
     )
 
-    with open(destination_path, 'wb') as f:
-        downloader = MediaIoBaseDownload(f, request)
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
+    _save_media(request, destination_path)
 
     return f"✅ Revision {revision_id} downloaded to {destination_path}"
 
@@ -1948,8 +2945,10 @@ def drive_set_custom_properties(file_id: str, properties: str, drive_id: Optiona
     service = get_service('drive', 'v3')
 
     try:
-        props = json.loads(properties)
-    except:
+        props = parse_json(properties)
+    except ValueError:
+        props = None
+    if not isinstance(props, dict):
         return "❌ Error: properties must be valid JSON object"
 
     file_metadata = {
@@ -1985,11 +2984,11 @@ def drive_get_custom_properties(file_id: str, drive_id: Optional[str] = None) ->
     if not properties:
         return f"No custom properties found on file {file_id}"
 
-    output = f"Custom properties:\n\n"
+    output = [f"Custom properties:\n\n"]
     for key, value in properties.items():
-        output += f"{key}: {value}\n"
+        output.append(f"{key}: {value}\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -1998,8 +2997,10 @@ def drive_set_app_properties(file_id: str, properties: str, drive_id: Optional[s
     service = get_service('drive', 'v3')
 
     try:
-        props = json.loads(properties)
-    except:
+        props = parse_json(properties)
+    except ValueError:
+        props = None
+    if not isinstance(props, dict):
         return "❌ Error: properties must be valid JSON object"
 
     file_metadata = {
@@ -2042,6 +3043,12 @@ def drive_set_content_restrictions(file_id: str, read_only: bool = True, reason:
     return f"✅ File {file_id} is now {status}"
 
 
+# Next pages of drive_list_changes requested ahead of the caller, keyed by
+# (page token, drive, page size).
+_changes_prefetch = TTLCache(ttl=60, maxsize=16)
+_prefetch_pool = ThreadPoolExecutor(max_workers=2)
+
+
 @mcp.tool()
 def drive_list_changes(page_token: Optional[str] = None, drive_id: Optional[str] = None,
                        page_size: int = 100) -> str:
@@ -2059,36 +3066,54 @@ def drive_list_changes(page_token: Optional[str] = None, drive_id: Optional[str]
     params = {
         'pageToken': page_token,
         'pageSize': page_size,
-        'fields': 'changes(file(id, name, mimeType), removed, time), newStartPageToken, nextPageToken'
+        'fields': 'changes(fileId, file(id, name, mimeType), removed, time), newStartPageToken, nextPageToken'
     }
 
     if drive_id:
         params['supportsAllDrives'] = True
         params['driveId'] = drive_id
 
-    changes = service.changes().list(**params).execute()
+    # Use the page fetched in the background by the previous call, if there is one
+    prefetch_key = (page_token, drive_id, page_size)
+    prefetched = _changes_prefetch.get(prefetch_key)
+    _changes_prefetch.pop(prefetch_key)
+    try:
+        changes = prefetched.result() if prefetched else None
+    except Exception:
+        changes = None
+    if changes is None:
+        changes = execute_with_retry(service.changes().list(**params))
+
+    # Start fetching the next page now, so a follow-up call finds it ready
+    next_token = changes.get('nextPageToken')
+    if next_token:
+        request = service.changes().list(**{**params, 'pageToken': next_token})
+        _changes_prefetch.set((next_token, drive_id, page_size), _prefetch_pool.submit(execute_with_retry, request))
+
+    if JSON_OUTPUT:
+        return to_json(changes)
 
     change_list = changes.get('changes', [])
 
-    output = f"Found {len(change_list)} change(s):\n\n"
+    output = [f"Found {len(change_list)} change(s):\n\n"]
     for change in change_list:
         if change.get('removed'):
-            output += f"🗑️  Removed: {change.get('fileId', 'Unknown')}\n"
+            output.append(f"🗑️  Removed: {change.get('fileId', 'Unknown')}\n")
         else:
             file = change.get('file', {})
-            output += f"📝 {file.get('name', 'Unknown')}\n"
-            output += f"   ID: {file.get('id')}\n"
-            output += f"   Type: {file.get('mimeType', 'Unknown')}\n"
+            output.append(f"📝 {file.get('name', 'Unknown')}\n")
+            output.append(f"   ID: {file.get('id')}\n")
+            output.append(f"   Type: {file.get('mimeType', 'Unknown')}\n")
 
-        output += f"   Time: {change.get('time', 'N/A')}\n\n"
+        output.append(f"   Time: {change.get('time', 'N/A')}\n\n")
 
     if 'nextPageToken' in changes:
-        output += f"\nNext page token: {changes['nextPageToken']}\n"
+        output.append(f"\nNext page token: {changes['nextPageToken']}\n")
 
     if 'newStartPageToken' in changes:
-        output += f"New start page token: {changes['newStartPageToken']}\n"
+        output.append(f"New start page token: {changes['newStartPageToken']}\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -2096,33 +3121,33 @@ def drive_get_about() -> str:
     """Get information about the user's Drive (storage quota, limits, user info)."""
     service = get_service('drive', 'v3')
 
-    about = service.about().get(
+    about = _cached_for_account('drive_about', lambda: service.about().get(
         fields='user, storageQuota, importFormats, exportFormats, maxImportSizes, canCreateDrives'
-    ).execute()
+    ).execute())
 
     user = about.get('user', {})
     quota = about.get('storageQuota', {})
 
-    output = f"Drive Account Information:\n\n"
-    output += f"User: {user.get('displayName', 'Unknown')}\n"
-    output += f"Email: {user.get('emailAddress', 'Unknown')}\n\n"
+    output = [f"Drive Account Information:\n\n"]
+    output.append(f"User: {user.get('displayName', 'Unknown')}\n")
+    output.append(f"Email: {user.get('emailAddress', 'Unknown')}\n\n")
 
-    output += f"Storage:\n"
+    output.append(f"Storage:\n")
     if 'limit' in quota:
         limit = int(quota['limit'])
         used = int(quota.get('usage', 0))
-        output += f"  Used: {used / (1024**3):.2f} GB\n"
-        output += f"  Total: {limit / (1024**3):.2f} GB\n"
-        output += f"  Available: {(limit - used) / (1024**3):.2f} GB\n"
+        output.append(f"  Used: {used / (1024**3):.2f} GB\n")
+        output.append(f"  Total: {limit / (1024**3):.2f} GB\n")
+        output.append(f"  Available: {(limit - used) / (1024**3):.2f} GB\n")
     else:
-        output += f"  Unlimited storage\n"
+        output.append(f"  Unlimited storage\n")
 
     if 'usageInDrive' in quota:
-        output += f"  Drive usage: {int(quota['usageInDrive']) / (1024**3):.2f} GB\n"
+        output.append(f"  Drive usage: {int(quota['usageInDrive']) / (1024**3):.2f} GB\n")
 
-    output += f"\nCan create shared drives: {about.get('canCreateDrives', False)}\n"
+    output.append(f"\nCan create shared drives: {about.get('canCreateDrives', False)}\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -2130,33 +3155,31 @@ def drive_batch_get_metadata(file_ids: str, drive_id: Optional[str] = None) -> s
     """Get metadata for multiple files at once. file_ids: comma-separated IDs like 'id1,id2,id3'."""
     service = get_service('drive', 'v3')
 
-    ids = [fid.strip() for fid in file_ids.split(',')]
+    ids = [fid.strip() for fid in file_ids.split(',') if fid.strip()]
 
     params = {'supportsAllDrives': True} if drive_id else {}
 
-    output = f"Metadata for {len(ids)} file(s):\n\n"
+    # One batched request per 100 files instead of a round trip each
+    fetched = execute_batch(service, [
+        service.files().get(fileId=file_id, fields='id, name, mimeType, size, createdTime, modifiedTime', **params)
+        for file_id in ids
+    ])
 
-    for file_id in ids[:20]:  # Limit to 20 files
-        try:
-            file = service.files().get(
-                fileId=file_id,
-                fields='id, name, mimeType, size, createdTime, modifiedTime',
-                **params
-            ).execute()
-
-            output += f"📄 {file.get('name', 'Unknown')}\n"
-            output += f"   ID: {file['id']}\n"
-            output += f"   Type: {file.get('mimeType', 'Unknown')}\n"
-            if 'size' in file:
-                output += f"   Size: {file['size']} bytes\n"
-            output += f"   Created: {file.get('createdTime', 'N/A')}\n\n"
-        except Exception as e:
-            output += f"❌ Error getting {file_id}: {str(e)}\n\n"
+    output = [f"Metadata for {len(ids)} file(s):\n\n"]
 
-    if len(ids) > 20:
-        output += f"... and {len(ids) - 20} more files (limit: 20)\n"
+    for file_id, (file, error) in zip(ids, fetched):
+        if error:
+            output.append(f"❌ Error getting {file_id}: {str(error)}\n\n")
+            continue
 
-    return output
+        output.append(f"📄 {file.get('name', 'Unknown')}\n")
+        output.append(f"   ID: {file['id']}\n")
+        output.append(f"   Type: {file.get('mimeType', 'Unknown')}\n")
+        if 'size' in file:
+            output.append(f"   Size: {file['size']} bytes\n")
+        output.append(f"   Created: {file.get('createdTime', 'N/A')}\n\n")
+
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -2164,31 +3187,136 @@ def drive_batch_delete(file_ids: str, drive_id: Optional[str] = None) -> str:
     """Delete multiple files at once. file_ids: comma-separated IDs like 'id1,id2,id3'."""
     service = get_service('drive', 'v3')
 
-    ids = [fid.strip() for fid in file_ids.split(',')]
+    ids = [fid.strip() for fid in file_ids.split(',') if fid.strip()]
 
     params = {'supportsAllDrives': True} if drive_id else {}
 
-    success_count = 0
-    error_count = 0
-    errors = []
+    # One batched request per 100 files instead of a round trip each
+    results = execute_batch(service, [service.files().delete(fileId=file_id, **params) for file_id in ids])
 
-    for file_id in ids:
-        try:
-            service.files().delete(fileId=file_id, **params).execute()
-            success_count += 1
-        except Exception as e:
-            error_count += 1
-            errors.append(f"{file_id}: {str(e)}")
+    errors = [f"{file_id}: {str(error)}" for file_id, (_, error) in zip(ids, results) if error]
+    error_count = len(errors)
+    success_count = len(ids) - error_count
 
-    output = f"✅ Deleted {success_count} file(s)\n"
+    output = [f"✅ Deleted {success_count} file(s)\n"]
     if error_count > 0:
-        output += f"❌ Failed to delete {error_count} file(s):\n"
+        output.append(f"❌ Failed to delete {error_count} file(s):\n")
         for error in errors[:10]:
-            output += f"  - {error}\n"
+            output.append(f"  - {error}\n")
         if len(errors) > 10:
-            output += f"  ... and {len(errors) - 10} more errors\n"
+            output.append(f"  ... and {len(errors) - 10} more errors\n")
 
-    return output
+    return ''.join(output)
+
+@mcp.tool()
+def drive_batch_update_permissions(operations: str, drive_id: Optional[str] = None) -> str:
+    """Share, update or remove many permissions in one batched request.
+
+    Args:
+        operations: JSON list of operations, each with an "action" of:
+            - "share": {"action": "share", "file_id": ..., "email": ..., "role": "reader"}
+            - "update": {"action": "update", "file_id": ..., "permission_id": ..., "role": ...,
+              "expiration_time": ...} (role and/or expiration_time)
+            - "remove": {"action": "remove", "file_id": ..., "permission_id": ...}
+    """
+    service = get_service('drive', 'v3')
+
+    try:
+        ops = parse_json(operations)
+    except ValueError:
+        ops = None
+    if not isinstance(ops, list):
+        return "❌ Error: operations must be a valid JSON list"
+
+    params = {'supportsAllDrives': True} if drive_id else {}
+    permissions = service.permissions()
+    required_keys = {'share': ('file_id', 'email'), 'update': ('file_id', 'permission_id'),
+                     'remove': ('file_id', 'permission_id')}
+
+    # Malformed operations get their own error line; the rest still go out in the batch
+    requests = []
+    problems = {}
+    for i, op in enumerate(ops):
+        if not isinstance(op, dict):
+            problems[i] = "operation must be a JSON object"
+            continue
+        action = op.get('action')
+        if action not in required_keys:
+            problems[i] = f"unknown action: {action}. Use share, update or remove."
+            continue
+        missing = [key for key in required_keys[action] if not op.get(key)]
+        if missing:
+            problems[i] = f"{action} is missing {', '.join(missing)}"
+            continue
+        if action == 'share':
+            body = {'type': 'user', 'role': op.get('role', 'reader'), 'emailAddress': op['email']}
+            requests.append(permissions.create(fileId=op['file_id'], body=body, sendNotificationEmail=True,
+                                               fields='id', **params))
+        elif action == 'update':
+            body = {}
+            if 'role' in op:
+                body['role'] = op['role']
+            if 'expiration_time' in op:
+                body['expirationTime'] = op['expiration_time']
+            requests.append(permissions.update(fileId=op['file_id'], permissionId=op['permission_id'],
+                                               body=body, fields='id', **params))
+        else:
+            requests.append(permissions.delete(fileId=op['file_id'], permissionId=op['permission_id'], **params))
+
+    results = iter(execute_batch(service, requests))
+
+    output = []
+    for i, op in enumerate(ops):
+        if i in problems:
+            output.append(f"❌ Operation {i + 1}: {problems[i]}\n")
+            continue
+        _, error = next(results)
+        target = op.get('email') or op.get('permission_id')
+        if error:
+            output.append(f"❌ {op['action']} {target} on {op['file_id']}: {str(error)}\n")
+        else:
+            output.append(f"✅ {op['action']} {target} on {op['file_id']}\n")
+    return ''.join(output)
+
+
+@mcp.tool()
+def drive_batch_modify_parents(operations: str, drive_id: Optional[str] = None) -> str:
+    """Add files to or remove them from folders in one batched request.
+
+    Args:
+        operations: JSON list like '[{"file_id": "...", "add": "folderA", "remove": "folderB"}]'.
+            "add" and "remove" each take a folder ID or comma-separated IDs; either may be omitted.
+    """
+    service = get_service('drive', 'v3')
+
+    try:
+        ops = parse_json(operations)
+    except ValueError:
+        ops = None
+    if not isinstance(ops, list):
+        return "❌ Error: operations must be a valid JSON list"
+
+    params = {'supportsAllDrives': True} if drive_id else {}
+
+    # Operations without a file_id get their own error line; the rest still go out in the batch
+    valid = [isinstance(op, dict) and bool(op.get('file_id')) for op in ops]
+    results = iter(execute_batch(service, [
+        service.files().update(fileId=op['file_id'], addParents=op.get('add'), removeParents=op.get('remove'),
+                               fields='id', **params)
+        for op, ok in zip(ops, valid) if ok
+    ]))
+
+    output = []
+    for i, (op, ok) in enumerate(zip(ops, valid)):
+        if not ok:
+            output.append(f"❌ Operation {i + 1}: needs a JSON object with a file_id\n")
+            continue
+        _, error = next(results)
+        if error:
+            output.append(f"❌ {op['file_id']}: {str(error)}\n")
+        else:
+            output.append(f"✅ {op['file_id']}\n")
+    return ''.join(output)
 
 
 # ============================================================================
@@ -2202,23 +3330,23 @@ def calendar_list_calendars() -> str:
     Returns calendar IDs which can be used in other calendar functions.
     """
     service = get_service('calendar', 'v3')
-    calendars_result = service.calendarList().list().execute()
+    calendars_result = _cached_for_account('calendar_list', lambda: service.calendarList().list().execute())
     calendars = calendars_result.get('items', [])
 
     if not calendars:
         return "No calendars found."
 
-    output = f"Found {len(calendars)} calendar(s):\n\n"
+    output = [f"Found {len(calendars)} calendar(s):\n\n"]
     for calendar in calendars:
         primary = " [PRIMARY]" if calendar.get('primary', False) else ""
-        output += f"📅 {calendar['summary']}{primary}\n"
-        output += f"   ID: {calendar['id']}\n"
+        output.append(f"📅 {calendar['summary']}{primary}\n")
+        output.append(f"   ID: {calendar['id']}\n")
         if calendar.get('description'):
-            output += f"   Description: {calendar['description']}\n"
-        output += f"   Access Role: {calendar.get('accessRole', 'N/A')}\n"
-        output += f"   Time Zone: {calendar.get('timeZone', 'N/A')}\n\n"
+            output.append(f"   Description: {calendar['description']}\n")
+        output.append(f"   Access Role: {calendar.get('accessRole', 'N/A')}\n")
+        output.append(f"   Time Zone: {calendar.get('timeZone', 'N/A')}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -2259,17 +3387,22 @@ def calendar_list_events(calendar_id: str = "primary", max_results: int = 10,
     if not events:
         return "No events found matching the criteria."
 
-    output = f"Found {len(events)} event(s):\n\n"
+    output = [f"Found {len(events)} event(s):\n\n"]
     for event in events:
         start = event['start'].get('dateTime', event['start'].get('date'))
         end = event['end'].get('dateTime', event['end'].get('date'))
-        output += f"📅 {event['summary']}\n"
-        output += f"   Start: {start}\n"
-        output += f"   End: {end}\n"
+        output.append(f"📅 {event['summary']}\n")
+        output.append(f"   Start: {start}\n")
+        output.append(f"   End: {end}\n")
         if event.get('location'):
-            output += f"   Location: {event['location']}\n"
-        output += f"   ID: {event['id']}\n\n"
-    return output
+            output.append(f"   Location: {event['location']}\n")
+        output.append(f"   ID: {event['id']}\n\n")
+    return ''.join(output)
+
+
+# Event fields calendar_get_event displays; the rest of the resource is not fetched.
+_EVENT_DETAIL_FIELDS = ('id,summary,start,end,description,location,attendees/email,creator/email,'
+                        'organizer/email,htmlLink,status,visibility,transparency,recurrence')
 
 
 @mcp.tool()
@@ -2281,41 +3414,56 @@ def calendar_get_event(event_id: str, calendar_id: str = "primary") -> str:
         calendar_id: Calendar ID (default: "primary")
     """
     service = get_service('calendar', 'v3')
-    event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    event = service.events().get(calendarId=calendar_id, eventId=event_id, fields=_EVENT_DETAIL_FIELDS).execute()
 
-    output = f"Event Details:\n\n"
-    output += f"📅 {event['summary']}\n"
-    output += f"ID: {event['id']}\n"
+    output = [f"Event Details:\n\n"]
+    output.append(f"📅 {event['summary']}\n")
+    output.append(f"ID: {event['id']}\n")
 
     # Times
     start = event['start'].get('dateTime', event['start'].get('date'))
     end = event['end'].get('dateTime', event['end'].get('date'))
-    output += f"Start: {start}\n"
-    output += f"End: {end}\n"
+    output.append(f"Start: {start}\n")
+    output.append(f"End: {end}\n")
 
     # Optional fields
     if event.get('description'):
-        output += f"Description: {event['description']}\n"
+        output.append(f"Description: {event['description']}\n")
     if event.get('location'):
-        output += f"Location: {event['location']}\n"
+        output.append(f"Location: {event['location']}\n")
     if event.get('attendees'):
-        output += f"Attendees: {', '.join([a.get('email', 'N/A') for a in event['attendees']])}\n"
+        output.append(f"Attendees: {', '.join([a.get('email', 'N/A') for a in event['attendees']])}\n")
     if event.get('creator'):
-        output += f"Creator: {event['creator'].get('email', 'N/A')}\n"
+        output.append(f"Creator: {event['creator'].get('email', 'N/A')}\n")
     if event.get('organizer'):
-        output += f"Organizer: {event['organizer'].get('email', 'N/A')}\n"
+        output.append(f"Organizer: {event['organizer'].get('email', 'N/A')}\n")
     if event.get('htmlLink'):
-        output += f"Link: {event['htmlLink']}\n"
+        output.append(f"Link: {event['htmlLink']}\n")
     if event.get('status'):
-        output += f"Status: {event['status']}\n"
+        output.append(f"Status: {event['status']}\n")
     if event.get('visibility'):
-        output += f"Visibility: {event['visibility']}\n"
+        output.append(f"Visibility: {event['visibility']}\n")
     if event.get('transparency'):
-        output += f"Transparency: {event['transparency']}\n"
+        output.append(f"Transparency: {event['transparency']}\n")
     if event.get('recurrence'):
-        output += f"Recurrence: {', '.join(event['recurrence'])}\n"
+        output.append(f"Recurrence: {', '.join(event['recurrence'])}\n")
 
-    return output
+    return ''.join(output)
+
+
+def _event_time(value: str, timezone: Optional[str] = None, patch: bool = False) -> dict:
+    """Calendar start/end object: all-day for a bare date, timed for an RFC3339 datetime.
+
+    PATCH merges nested objects, so with patch=True the unused one of date/dateTime
+    is set to null to clear it when an event switches between all-day and timed.
+    """
+    key, other = ('dateTime', 'date') if 'T' in value else ('date', 'dateTime')
+    field = {key: value}
+    if patch:
+        field[other] = None
+    if timezone:
+        field['timeZone'] = timezone
+    return field
 
 
 @mcp.tool()
@@ -2346,25 +3494,11 @@ def calendar_create_event(summary: str, start_time: str, end_time: str,
     """
     service = get_service('calendar', 'v3')
 
-    # Detect all-day events (date-only format)
-    is_all_day = 'T' not in start_time
-
-    event = {'summary': summary}
-
-    if is_all_day:
-        # All-day event
-        event['start'] = {'date': start_time}
-        event['end'] = {'date': end_time}
-        if timezone:
-            event['start']['timeZone'] = timezone
-            event['end']['timeZone'] = timezone
-    else:
-        # Timed event
-        event['start'] = {'dateTime': start_time}
-        event['end'] = {'dateTime': end_time}
-        if timezone:
-            event['start']['timeZone'] = timezone
-            event['end']['timeZone'] = timezone
+    event = {
+        'summary': summary,
+        'start': _event_time(start_time, timezone),
+        'end': _event_time(end_time, timezone),
+    }
 
     if description:
         event['description'] = description
@@ -2383,8 +3517,7 @@ def calendar_create_event(summary: str, start_time: str, end_time: str,
     if not use_default_reminders:
         reminder_overrides = []
         if reminders:
-            import json
-            reminder_list = json.loads(reminders) if isinstance(reminders, str) else reminders
+            reminder_list = parse_json(reminders) if isinstance(reminders, str) else reminders
             reminder_overrides = reminder_list
         event['reminders'] = {
             'useDefault': False,
@@ -2424,34 +3557,17 @@ def calendar_update_event(event_id: str, calendar_id: str = "primary",
     """
     service = get_service('calendar', 'v3')
 
-    # Get existing event
-    event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    # PATCH only the provided fields; no need to read the event first
+    event = {}
 
-    # Update only provided fields
     if summary is not None:
         event['summary'] = summary
 
     if start_time is not None:
-        is_all_day = 'T' not in start_time
-        if is_all_day:
-            event['start'] = {'date': start_time}
-            if timezone:
-                event['start']['timeZone'] = timezone
-        else:
-            event['start'] = {'dateTime': start_time}
-            if timezone:
-                event['start']['timeZone'] = timezone
+        event['start'] = _event_time(start_time, timezone, patch=True)
 
     if end_time is not None:
-        is_all_day = 'T' not in end_time
-        if is_all_day:
-            event['end'] = {'date': end_time}
-            if timezone:
-                event['end']['timeZone'] = timezone
-        else:
-            event['end'] = {'dateTime': end_time}
-            if timezone:
-                event['end']['timeZone'] = timezone
+        event['end'] = _event_time(end_time, timezone, patch=True)
 
     if description is not None:
         event['description'] = description
@@ -2471,17 +3587,17 @@ def calendar_update_event(event_id: str, calendar_id: str = "primary",
         if not use_default_reminders:
             reminder_overrides = []
             if reminders:
-                import json
-                reminder_list = json.loads(reminders) if isinstance(reminders, str) else reminders
+                reminder_list = parse_json(reminders) if isinstance(reminders, str) else reminders
                 reminder_overrides = reminder_list
             event['reminders'] = {
                 'useDefault': False,
                 'overrides': reminder_overrides
             }
         else:
-            event['reminders'] = {'useDefault': True}
+            event['reminders'] = {'useDefault': True, 'overrides': None}
 
-    updated = service.events().update(calendarId=calendar_id, eventId=event_id, body=event).execute()
+    updated = service.events().patch(calendarId=calendar_id, eventId=event_id, body=event,
+                                     fields='id,summary,htmlLink').execute()
     return f"✅ Event updated!\nTitle: {updated['summary']}\nID: {updated['id']}\nLink: {updated.get('htmlLink', 'N/A')}"
 
 
@@ -2784,9 +3900,7 @@ def docs_format_text(document_id: str, start_index: int, end_index: int,
         text_style['baselineOffset'] = baseline_offset
         fields.append('baselineOffset')
     if text_color:
-        r = int(text_color[1:3], 16) / 255
-        g = int(text_color[3:5], 16) / 255
-        b = int(text_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(text_color)
         text_style['foregroundColor'] = {
             'color': {
                 'rgbColor': {'red': r, 'green': g, 'blue': b}
@@ -2794,9 +3908,7 @@ def docs_format_text(document_id: str, start_index: int, end_index: int,
         }
         fields.append('foregroundColor')
     if background_color:
-        r = int(background_color[1:3], 16) / 255
-        g = int(background_color[3:5], 16) / 255
-        b = int(background_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(background_color)
         text_style['backgroundColor'] = {
             'color': {
                 'rgbColor': {'red': r, 'green': g, 'blue': b}
@@ -2804,6 +3916,9 @@ def docs_format_text(document_id: str, start_index: int, end_index: int,
         }
         fields.append('backgroundColor')
 
+    if not text_style:
+        return "ℹ️ No style changes requested"
+
     requests = [{
         'updateTextStyle': {
             'range': {
@@ -3241,9 +4356,7 @@ def docs_format_table_cells(document_id: str, table_start_index: int, start_row:
 
     # Background color
     if background_color:
-        r = int(background_color[1:3], 16) / 255
-        g = int(background_color[3:5], 16) / 255
-        b = int(background_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(background_color)
 
         requests.append({
             'updateTableCellStyle': {
@@ -3271,9 +4384,7 @@ def docs_format_table_cells(document_id: str, table_start_index: int, start_row:
 
     # Borders
     if border_width is not None and border_color:
-        r = int(border_color[1:3], 16) / 255
-        g = int(border_color[3:5], 16) / 255
-        b = int(border_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(border_color)
 
         border_style = {
             'width': {
@@ -3310,6 +4421,9 @@ def docs_format_table_cells(document_id: str, table_start_index: int, start_row:
             }
         })
 
+    if not requests:
+        return "ℹ️ No style changes requested"
+
     service.documents().batchUpdate(documentId=document_id, body={'requests': requests}).execute()
     return f"✅ Formatted table cells (rows {start_row}-{end_row-1}, cols {start_col}-{end_col-1})"
 
@@ -3942,6 +5056,52 @@ def docs_copy_content_between_docs(source_doc_id: str, target_doc_id: str,
 # SHEETS TOOLS
 # ============================================================================
 
+_FORMAT_FIELDS = re.compile(r'^userEnteredFormat\(([\w,]+)\)$')
+
+
+def _grid_key(grid_range: dict) -> tuple:
+    """Hashable key for a GridRange."""
+    return (grid_range.get('sheetId'), grid_range.get('startRowIndex'), grid_range.get('endRowIndex'),
+            grid_range.get('startColumnIndex'), grid_range.get('endColumnIndex'))
+
+
+def enqueue_request(pending: list, request: dict):
+    """Append a batchUpdate request, fusing it into the previous repeatCell when both format the same range.
+
+    Later format keys replace earlier ones and the field masks are unioned, which is what
+    applying the two requests back to back would have produced.
+    """
+    new = request.get('repeatCell')
+    last = pending[-1].get('repeatCell') if pending else None
+    if new and last and _grid_key(new['range']) == _grid_key(last['range']):
+        new_fields = _FORMAT_FIELDS.match(new.get('fields', ''))
+        last_fields = _FORMAT_FIELDS.match(last.get('fields', ''))
+        if new_fields and last_fields:
+            fields = last_fields.group(1).split(',')
+            fields += [f for f in new_fields.group(1).split(',') if f not in fields]
+            last['cell']['userEnteredFormat'].update(new['cell']['userEnteredFormat'])
+            last['fields'] = 'userEnteredFormat(' + ','.join(fields) + ')'
+            return
+    pending.append(request)
+
+
+def _dimension_range(sheet_id: int, dimension: str, start_index: int, end_index: int) -> dict:
+    """DimensionRange over ROWS or COLUMNS."""
+    return {'sheetId': sheet_id, 'dimension': dimension, 'startIndex': start_index, 'endIndex': end_index}
+
+
+def _dimension_properties_request(sheet_id: int, dimension: str, start_index: int, end_index: int,
+                                  properties: dict) -> dict:
+    """updateDimensionProperties request whose field mask covers exactly the given properties."""
+    return {
+        'updateDimensionProperties': {
+            'range': _dimension_range(sheet_id, dimension, start_index, end_index),
+            'properties': properties,
+            'fields': ','.join(properties)
+        }
+    }
+
+
 @mcp.tool()
 def sheets_create(title: str, parent_id: Optional[str] = None, drive_id: Optional[str] = None) -> str:
     """Create a new Google Sheet."""
@@ -3950,22 +5110,65 @@ def sheets_create(title: str, parent_id: Optional[str] = None, drive_id: Optiona
     if parent_id:
         file_metadata['parents'] = [parent_id]
     params = {'supportsAllDrives': True} if drive_id else {}
-    sheet = drive_service.files().create(body=file_metadata, fields='id, name, webViewLink', **params).execute()
+    sheet = execute_with_retry(drive_service.files().create(body=file_metadata, fields='id, name, webViewLink', **params))
     return f"✅ Google Sheet created!\nTitle: {sheet['name']}\nID: {sheet['id']}\nLink: {sheet.get('webViewLink', 'N/A')}"
 
 
 @mcp.tool()
-def sheets_read(spreadsheet_id: str, range_name: str = "A1:Z1000") -> str:
-    """Read data from a Google Sheet."""
+def sheets_read(spreadsheet_id: str, range_name: str = "A1:Z1000", value_render_option: str = "FORMATTED_VALUE") -> str:
+    """Read data from a Google Sheet.
+
+    Args:
+        value_render_option: FORMATTED_VALUE (as displayed), UNFORMATTED_VALUE (raw values, dates as serial numbers) or FORMULA
+    """
     service = get_service('sheets', 'v4')
-    result = service.spreadsheets().values().get(spreadsheetId=spreadsheet_id, range=range_name).execute()
+    result = execute_with_retry(service.spreadsheets().values().get(
+        spreadsheetId=spreadsheet_id,
+        range=range_name,
+        majorDimension='ROWS',
+        valueRenderOption=value_render_option,
+        dateTimeRenderOption='SERIAL_NUMBER',
+        fields='values'
+    ))
     values = result.get('values', [])
     if not values:
         return "No data found in sheet."
-    output = f"Data from {range_name}:\n\n"
+    buf = io.StringIO()
+    buf.write(f"Data from {range_name}:\n\n")
     for row in values:
-        output += " | ".join(str(cell) for cell in row) + "\n"
-    return output
+        buf.write(" | ".join(map(str, row)))
+        buf.write("\n")
+    return buf.getvalue()
+
+
+@mcp.tool()
+def sheets_read_many(spreadsheet_ids: str, range_name: str = "A1:Z1000") -> str:
+    """Read the same range from several spreadsheets in parallel.
+
+    Args:
+        spreadsheet_ids: Comma-separated spreadsheet IDs
+    """
+    service = get_service('sheets', 'v4')
+    ids = [sid.strip() for sid in spreadsheet_ids.split(',') if sid.strip()]
+    results = execute_concurrently([
+        service.spreadsheets().values().get(spreadsheetId=sid, range=range_name, fields='values')
+        for sid in ids
+    ])
+
+    buf = io.StringIO()
+    for sid, (result, error) in zip(ids, results):
+        buf.write(f"=== {sid} ({range_name}) ===\n")
+        if error:
+            buf.write(f"❌ Error: {str(error)}\n\n")
+            continue
+        values = result.get('values', [])
+        if not values:
+            buf.write("No data found in sheet.\n")
+        for row in values:
+            buf.write(" | ".join(map(str, row)))
+            buf.write("\n")
+        buf.write("\n")
+    return buf.getvalue()
 
 
 @mcp.tool()
@@ -3977,12 +5180,14 @@ def sheets_write(spreadsheet_id: str, range_name: str, values: str) -> str:
     except:
         return "❌ Error: values must be valid JSON array"
 
-    result = service.spreadsheets().values().update(
+    result = execute_with_retry(service.spreadsheets().values().update(
         spreadsheetId=spreadsheet_id,
         range=range_name,
         valueInputOption='USER_ENTERED',
+        includeValuesInResponse=False,
+        fields='updatedCells',
         body={'values': data}
-    ).execute()
+    ))
     return f"✅ Updated {result.get('updatedCells', 0)} cells in range {range_name}"
 
 
@@ -3995,12 +5200,14 @@ def sheets_append(spreadsheet_id: str, range_name: str, values: str) -> str:
     except:
         return "❌ Error: values must be valid JSON array"
 
-    result = service.spreadsheets().values().append(
+    result = execute_with_retry(service.spreadsheets().values().append(
         spreadsheetId=spreadsheet_id,
         range=range_name,
         valueInputOption='USER_ENTERED',
+        includeValuesInResponse=False,
+        fields='updates/updatedRows',
         body={'values': data}
-    ).execute()
+    ))
     return f"✅ Appended {result.get('updates', {}).get('updatedRows', 0)} row(s)"
 
 
@@ -4008,38 +5215,149 @@ def sheets_append(spreadsheet_id: str, range_name: str, values: str) -> str:
 def sheets_clear(spreadsheet_id: str, range_name: str) -> str:
     """Clear all data in a specific range of a Google Sheet."""
     service = get_service('sheets', 'v4')
-    service.spreadsheets().values().clear(
+    execute_with_retry(service.spreadsheets().values().clear(
         spreadsheetId=spreadsheet_id,
         range=range_name
-    ).execute()
+    ))
     return f"✅ Cleared data in range {range_name}"
 
 
+# Plain decimal numbers, the part of USER_ENTERED parsing that _extended_value mirrors
+_NUMBER_TEXT = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+def _extended_value(value) -> dict:
+    """Convert a JSON cell value to a Sheets ExtendedValue, mirroring USER_ENTERED.
+
+    Formulas, plain numeric strings and a leading ' (forced text) are handled as Sheets
+    would; dates, percentages and currency stay text, unlike with USER_ENTERED.
+    """
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, (int, float)):
+        return {'numberValue': value}
+    if value is None:
+        return {}
+    value = str(value)
+    if value.startswith('='):
+        return {'formulaValue': value}
+    if value.startswith("'"):
+        return {'stringValue': value[1:]}
+    if _NUMBER_TEXT.fullmatch(value.strip()):
+        return {'numberValue': float(value)}
+    return {'stringValue': value}
+
+
+@mcp.tool()
+def sheets_replace(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
+                   start_col: int, end_col: int, values: str) -> str:
+    """Clear a range and write new data into it in a single request. Rows and columns are 0-indexed.
+
+    Args:
+        values: JSON array like '[["Name", "Email"], ["John", "john@example.com"]]', written from (start_row, start_col).
+                Must fit inside the cleared range.
+    """
+    try:
+        data = parse_json(values)
+    except ValueError:
+        data = None
+    if not isinstance(data, list) or not all(isinstance(row, list) for row in data):
+        return "❌ Error: values must be a JSON array of rows (arrays)"
+
+    rows, cols = len(data), max((len(row) for row in data), default=0)
+    if rows > end_row - start_row or cols > end_col - start_col:
+        return (f"❌ Error: values are {rows}x{cols} but the range is only "
+                f"{end_row - start_row}x{end_col - start_col}; widen the range to fit them")
+
+    requests = [
+        {
+            'updateCells': {
+                'range': {
+                    'sheetId': sheet_id,
+                    'startRowIndex': start_row,
+                    'endRowIndex': end_row,
+                    'startColumnIndex': start_col,
+                    'endColumnIndex': end_col
+                },
+                'fields': 'userEnteredValue'
+            }
+        },
+        {
+            'updateCells': {
+                'start': {'sheetId': sheet_id, 'rowIndex': start_row, 'columnIndex': start_col},
+                'rows': [
+                    {'values': [{'userEnteredValue': _extended_value(cell)} for cell in row]}
+                    for row in data
+                ],
+                'fields': 'userEnteredValue'
+            }
+        }
+    ]
+
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
+
+    return f"✅ Replaced range (rows {start_row}-{end_row}, cols {start_col}-{end_col}) with {len(data)} row(s)"
+
+
 @mcp.tool()
 def sheets_get_metadata(spreadsheet_id: str) -> str:
     """Get spreadsheet metadata including sheet names, IDs, and properties."""
     service = get_service('sheets', 'v4')
-    spreadsheet = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    spreadsheet = execute_with_retry(service.spreadsheets().get(
+        spreadsheetId=spreadsheet_id,
+        fields='properties/title,sheets/properties(sheetId,title,gridProperties(rowCount,columnCount))'
+    ))
+    sheets = spreadsheet.get('sheets', [])
+
+    if JSON_OUTPUT:
+        return to_json(sheets)
 
-    output = f"Spreadsheet: {spreadsheet.get('properties', {}).get('title', 'Untitled')}\n"
-    output += f"ID: {spreadsheet_id}\n"
-    output += f"Sheets: {len(spreadsheet.get('sheets', []))}\n\n"
+    output = [
+        f"Spreadsheet: {spreadsheet.get('properties', {}).get('title', 'Untitled')}",
+        f"ID: {spreadsheet_id}",
+        f"Sheets: {len(sheets)}\n",
+    ]
 
-    for sheet in spreadsheet.get('sheets', []):
+    for sheet in sheets:
         props = sheet.get('properties', {})
-        output += f"📊 {props.get('title', 'Untitled')}\n"
-        output += f"   Sheet ID: {props.get('sheetId')}\n"
-        output += f"   Rows: {props.get('gridProperties', {}).get('rowCount', 'N/A')}\n"
-        output += f"   Columns: {props.get('gridProperties', {}).get('columnCount', 'N/A')}\n\n"
+        grid = props.get('gridProperties', {})
+        output.append(
+            f"📊 {props.get('title', 'Untitled')}\n"
+            f"   Sheet ID: {props.get('sheetId')}\n"
+            f"   Rows: {grid.get('rowCount', 'N/A')}\n"
+            f"   Columns: {grid.get('columnCount', 'N/A')}\n"
+        )
 
-    return output
+    return "\n".join(output) + "\n"
+
+
+@mcp.tool()
+def sheets_batch_begin(spreadsheet_id: str) -> str:
+    """Start queuing formatting/structure changes to a spreadsheet so they are sent together.
+
+    Until sheets_batch_commit is called, batchUpdate-based sheets tools queue their changes
+    instead of applying them. Tools that return new IDs or counts still run immediately
+    (sending anything queued before them in the same request).
+    """
+    return begin_batch('sheets', spreadsheet_id)
+
+
+@mcp.tool()
+def sheets_batch_commit(spreadsheet_id: str) -> str:
+    """Apply all changes queued since sheets_batch_begin in a single batchUpdate."""
+    return commit_batch('sheets', spreadsheet_id)
+
+
+@mcp.tool()
+def sheets_batch_discard(spreadsheet_id: str) -> str:
+    """Drop all changes queued since sheets_batch_begin without applying them."""
+    return discard_batch('sheets', spreadsheet_id)
 
 
 @mcp.tool()
 def sheets_create_sheet_tab(spreadsheet_id: str, sheet_name: str) -> str:
     """Add a new sheet tab to an existing spreadsheet."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'addSheet': {
             'properties': {
@@ -4048,10 +5366,7 @@ def sheets_create_sheet_tab(spreadsheet_id: str, sheet_name: str) -> str:
         }
     }]
 
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    response = batch_update('sheets', spreadsheet_id, requests, needs_replies=True)
 
     new_sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
     return f"✅ Created new sheet tab '{sheet_name}'\nSheet ID: {new_sheet_id}"
@@ -4062,8 +5377,6 @@ def sheets_format_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_
                         start_col: int, end_col: int, bold: Optional[bool] = None,
                         background_color: Optional[str] = None, text_color: Optional[str] = None) -> str:
     """Format cells in a Google Sheet. Colors in hex format like '#FF0000'. Rows and columns are 0-indexed."""
-    service = get_service('sheets', 'v4')
-
     cell_format = {}
 
     if bold is not None:
@@ -4071,20 +5384,20 @@ def sheets_format_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_
 
     if background_color:
         # Convert hex to RGB
-        r = int(background_color[1:3], 16) / 255
-        g = int(background_color[3:5], 16) / 255
-        b = int(background_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(background_color)
         cell_format['backgroundColor'] = {'red': r, 'green': g, 'blue': b}
 
     if text_color:
-        r = int(text_color[1:3], 16) / 255
-        g = int(text_color[3:5], 16) / 255
-        b = int(text_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(text_color)
         if 'textFormat' not in cell_format:
             cell_format['textFormat'] = {}
         cell_format['textFormat']['foregroundColor'] = {'red': r, 'green': g, 'blue': b}
 
-    requests = [{
+    if not cell_format:
+        return "ℹ️ No style changes requested"
+
+    requests = []
+    enqueue_request(requests, {
         'repeatCell': {
             'range': {
                 'sheetId': sheet_id,
@@ -4098,12 +5411,10 @@ def sheets_format_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_
             },
             'fields': 'userEnteredFormat(' + ','.join(cell_format.keys()) + ')'
         }
-    }]
+    })
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Formatted cells in range (rows {start_row}-{end_row}, cols {start_col}-{end_col})"
 
@@ -4111,18 +5422,14 @@ def sheets_format_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_
 @mcp.tool()
 def sheets_delete_sheet_tab(spreadsheet_id: str, sheet_id: int) -> str:
     """Delete a sheet tab from a spreadsheet."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'deleteSheet': {
             'sheetId': sheet_id
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Deleted sheet with ID {sheet_id}"
 
@@ -4130,8 +5437,6 @@ def sheets_delete_sheet_tab(spreadsheet_id: str, sheet_id: int) -> str:
 @mcp.tool()
 def sheets_rename_sheet_tab(spreadsheet_id: str, sheet_id: int, new_name: str) -> str:
     """Rename a sheet tab."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'updateSheetProperties': {
             'properties': {
@@ -4142,10 +5447,8 @@ def sheets_rename_sheet_tab(spreadsheet_id: str, sheet_id: int, new_name: str) -
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Renamed sheet to '{new_name}'"
 
@@ -4153,8 +5456,6 @@ def sheets_rename_sheet_tab(spreadsheet_id: str, sheet_id: int, new_name: str) -
 @mcp.tool()
 def sheets_duplicate_sheet_tab(spreadsheet_id: str, sheet_id: int, new_sheet_name: Optional[str] = None) -> str:
     """Duplicate a sheet tab within the same spreadsheet."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'duplicateSheet': {
             'sourceSheetId': sheet_id,
@@ -4163,10 +5464,7 @@ def sheets_duplicate_sheet_tab(spreadsheet_id: str, sheet_id: int, new_sheet_nam
         }
     }]
 
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    response = batch_update('sheets', spreadsheet_id, requests, needs_replies=True)
 
     new_id = response['replies'][0]['duplicateSheet']['properties']['sheetId']
     new_title = response['replies'][0]['duplicateSheet']['properties']['title']
@@ -4176,8 +5474,6 @@ def sheets_duplicate_sheet_tab(spreadsheet_id: str, sheet_id: int, new_sheet_nam
 @mcp.tool()
 def sheets_move_sheet_tab(spreadsheet_id: str, sheet_id: int, new_index: int) -> str:
     """Move a sheet tab to a new position. Index starts at 0."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'updateSheetProperties': {
             'properties': {
@@ -4188,10 +5484,8 @@ def sheets_move_sheet_tab(spreadsheet_id: str, sheet_id: int, new_index: int) ->
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Moved sheet to position {new_index}"
 
@@ -4199,8 +5493,6 @@ def sheets_move_sheet_tab(spreadsheet_id: str, sheet_id: int, new_index: int) ->
 @mcp.tool()
 def sheets_hide_sheet_tab(spreadsheet_id: str, sheet_id: int, hidden: bool = True) -> str:
     """Hide or show a sheet tab."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'updateSheetProperties': {
             'properties': {
@@ -4211,10 +5503,8 @@ def sheets_hide_sheet_tab(spreadsheet_id: str, sheet_id: int, hidden: bool = Tru
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     status = "hidden" if hidden else "visible"
     return f"✅ Sheet is now {status}"
@@ -4230,11 +5520,11 @@ def sheets_copy_to_spreadsheet(source_spreadsheet_id: str, sheet_id: int,
         'destinationSpreadsheetId': destination_spreadsheet_id
     }
 
-    response = service.spreadsheets().sheets().copyTo(
+    response = execute_with_retry(service.spreadsheets().sheets().copyTo(
         spreadsheetId=source_spreadsheet_id,
         sheetId=sheet_id,
         body=request_body
-    ).execute()
+    ))
 
     return f"✅ Sheet copied!\nNew sheet ID in destination: {response.get('sheetId')}\nTitle: {response.get('title')}"
 
@@ -4242,24 +5532,15 @@ def sheets_copy_to_spreadsheet(source_spreadsheet_id: str, sheet_id: int,
 @mcp.tool()
 def sheets_insert_rows(spreadsheet_id: str, sheet_id: int, start_index: int, num_rows: int) -> str:
     """Insert blank rows. start_index is 0-based (0 = before first row)."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'insertDimension': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_index,
-                'endIndex': start_index + num_rows
-            },
+            'range': _dimension_range(sheet_id, 'ROWS', start_index, start_index + num_rows),
             'inheritFromBefore': False
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Inserted {num_rows} row(s) at index {start_index}"
 
@@ -4267,24 +5548,15 @@ def sheets_insert_rows(spreadsheet_id: str, sheet_id: int, start_index: int, num
 @mcp.tool()
 def sheets_insert_columns(spreadsheet_id: str, sheet_id: int, start_index: int, num_columns: int) -> str:
     """Insert blank columns. start_index is 0-based (0 = before column A)."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'insertDimension': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_index,
-                'endIndex': start_index + num_columns
-            },
+            'range': _dimension_range(sheet_id, 'COLUMNS', start_index, start_index + num_columns),
             'inheritFromBefore': False
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Inserted {num_columns} column(s) at index {start_index}"
 
@@ -4292,23 +5564,14 @@ def sheets_insert_columns(spreadsheet_id: str, sheet_id: int, start_index: int,
 @mcp.tool()
 def sheets_delete_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int) -> str:
     """Delete rows. Indices are 0-based (0 = first row). Deletes rows from start_index to end_index-1."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'deleteDimension': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            }
+            'range': _dimension_range(sheet_id, 'ROWS', start_index, end_index)
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_deleted = end_index - start_index
     return f"✅ Deleted {num_deleted} row(s) (indices {start_index}-{end_index-1})"
@@ -4317,23 +5580,14 @@ def sheets_delete_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end
 @mcp.tool()
 def sheets_delete_columns(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int) -> str:
     """Delete columns. Indices are 0-based (0 = column A). Deletes columns from start_index to end_index-1."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'deleteDimension': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            }
+            'range': _dimension_range(sheet_id, 'COLUMNS', start_index, end_index)
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_deleted = end_index - start_index
     return f"✅ Deleted {num_deleted} column(s) (indices {start_index}-{end_index-1})"
@@ -4343,27 +5597,11 @@ def sheets_delete_columns(spreadsheet_id: str, sheet_id: int, start_index: int,
 def sheets_resize_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int,
                        pixel_size: int) -> str:
     """Set row height in pixels. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
-    requests = [{
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            },
-            'properties': {
-                'pixelSize': pixel_size
-            },
-            'fields': 'pixelSize'
-        }
-    }]
+    requests = [_dimension_properties_request(sheet_id, 'ROWS', start_index, end_index,
+                                              {'pixelSize': pixel_size})]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_rows = end_index - start_index
     return f"✅ Resized {num_rows} row(s) to {pixel_size}px"
@@ -4373,27 +5611,11 @@ def sheets_resize_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end
 def sheets_resize_columns(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int,
                           pixel_size: int) -> str:
     """Set column width in pixels. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
-    requests = [{
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            },
-            'properties': {
-                'pixelSize': pixel_size
-            },
-            'fields': 'pixelSize'
-        }
-    }]
+    requests = [_dimension_properties_request(sheet_id, 'COLUMNS', start_index, end_index,
+                                              {'pixelSize': pixel_size})]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_cols = end_index - start_index
     return f"✅ Resized {num_cols} column(s) to {pixel_size}px"
@@ -4402,23 +5624,14 @@ def sheets_resize_columns(spreadsheet_id: str, sheet_id: int, start_index: int,
 @mcp.tool()
 def sheets_auto_resize_columns(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int) -> str:
     """Auto-resize columns to fit content. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'autoResizeDimensions': {
-            'dimensions': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            }
+            'dimensions': _dimension_range(sheet_id, 'COLUMNS', start_index, end_index)
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_cols = end_index - start_index
     return f"✅ Auto-resized {num_cols} column(s)"
@@ -4428,27 +5641,11 @@ def sheets_auto_resize_columns(spreadsheet_id: str, sheet_id: int, start_index:
 def sheets_hide_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int,
                      hidden: bool = True) -> str:
     """Hide or show rows. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
-    requests = [{
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'ROWS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            },
-            'properties': {
-                'hiddenByUser': hidden
-            },
-            'fields': 'hiddenByUser'
-        }
-    }]
+    requests = [_dimension_properties_request(sheet_id, 'ROWS', start_index, end_index,
+                                              {'hiddenByUser': hidden})]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_rows = end_index - start_index
     status = "hidden" if hidden else "visible"
@@ -4459,27 +5656,11 @@ def sheets_hide_rows(spreadsheet_id: str, sheet_id: int, start_index: int, end_i
 def sheets_hide_columns(spreadsheet_id: str, sheet_id: int, start_index: int, end_index: int,
                         hidden: bool = True) -> str:
     """Hide or show columns. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
-    requests = [{
-        'updateDimensionProperties': {
-            'range': {
-                'sheetId': sheet_id,
-                'dimension': 'COLUMNS',
-                'startIndex': start_index,
-                'endIndex': end_index
-            },
-            'properties': {
-                'hiddenByUser': hidden
-            },
-            'fields': 'hiddenByUser'
-        }
-    }]
+    requests = [_dimension_properties_request(sheet_id, 'COLUMNS', start_index, end_index,
+                                              {'hiddenByUser': hidden})]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     num_cols = end_index - start_index
     status = "hidden" if hidden else "visible"
@@ -4490,8 +5671,6 @@ def sheets_hide_columns(spreadsheet_id: str, sheet_id: int, start_index: int, en
 def sheets_merge_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                        start_col: int, end_col: int, merge_type: str = "MERGE_ALL") -> str:
     """Merge cells. merge_type: MERGE_ALL, MERGE_COLUMNS, or MERGE_ROWS. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'mergeCells': {
             'range': {
@@ -4505,10 +5684,8 @@ def sheets_merge_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_r
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Merged cells (rows {start_row}-{end_row-1}, cols {start_col}-{end_col-1})"
 
@@ -4517,8 +5694,6 @@ def sheets_merge_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_r
 def sheets_unmerge_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                          start_col: int, end_col: int) -> str:
     """Unmerge cells in a range. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'unmergeCells': {
             'range': {
@@ -4531,10 +5706,8 @@ def sheets_unmerge_cells(spreadsheet_id: str, sheet_id: int, start_row: int, end
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Unmerged cells in range"
 
@@ -4544,12 +5717,8 @@ def sheets_add_borders(spreadsheet_id: str, sheet_id: int, start_row: int, end_r
                        start_col: int, end_col: int, border_style: str = "SOLID",
                        border_color: str = "#000000") -> str:
     """Add borders to cells. border_style: SOLID, DOTTED, DASHED. Color in hex. Indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     # Convert hex to RGB
-    r = int(border_color[1:3], 16) / 255
-    g = int(border_color[3:5], 16) / 255
-    b = int(border_color[5:7], 16) / 255
+    r, g, b = hex_to_rgb(border_color)
 
     border = {
         'style': border_style,
@@ -4574,10 +5743,8 @@ def sheets_add_borders(spreadsheet_id: str, sheet_id: int, start_row: int, end_r
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Added borders to range"
 
@@ -4586,8 +5753,6 @@ def sheets_add_borders(spreadsheet_id: str, sheet_id: int, start_row: int, end_r
 def sheets_set_number_format(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                               start_col: int, end_col: int, format_type: str) -> str:
     """Set number format. Types: NUMBER, CURRENCY, PERCENT, DATE, TIME, DATE_TIME, SCIENTIFIC, TEXT. Indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     # Format patterns
     patterns = {
         'NUMBER': '0.00',
@@ -4623,10 +5788,8 @@ def sheets_set_number_format(spreadsheet_id: str, sheet_id: int, start_row: int,
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Applied {format_type} format to range"
 
@@ -4635,8 +5798,6 @@ def sheets_set_number_format(spreadsheet_id: str, sheet_id: int, start_row: int,
 def sheets_add_data_validation(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                                 start_col: int, end_col: int, values: str, strict: bool = True) -> str:
     """Add dropdown data validation. values: JSON array like '["Option1", "Option2"]'. Indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     try:
         value_list = json.loads(values)
     except:
@@ -4664,10 +5825,8 @@ def sheets_add_data_validation(spreadsheet_id: str, sheet_id: int, start_row: in
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Added dropdown validation with {len(value_list)} options"
 
@@ -4678,8 +5837,6 @@ def sheets_copy_paste(spreadsheet_id: str, source_sheet_id: int, source_start_ro
                       dest_sheet_id: int, dest_start_row: int, dest_start_col: int,
                       paste_type: str = "NORMAL") -> str:
     """Copy and paste cells. paste_type: NORMAL, VALUES, FORMAT, FORMULA. All indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'copyPaste': {
             'source': {
@@ -4700,10 +5857,8 @@ def sheets_copy_paste(spreadsheet_id: str, source_sheet_id: int, source_start_ro
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Copied and pasted range ({paste_type})"
 
@@ -4712,8 +5867,6 @@ def sheets_copy_paste(spreadsheet_id: str, source_sheet_id: int, source_start_ro
 def sheets_find_replace(spreadsheet_id: str, sheet_id: int, find: str, replacement: str,
                         match_case: bool = False, match_entire_cell: bool = False) -> str:
     """Find and replace text in a sheet."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'findReplace': {
             'find': find,
@@ -4724,10 +5877,7 @@ def sheets_find_replace(spreadsheet_id: str, sheet_id: int, find: str, replaceme
         }
     }]
 
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    response = batch_update('sheets', spreadsheet_id, requests, needs_replies=True)
 
     occurrences = response['replies'][0]['findReplace'].get('occurrencesChanged', 0)
     return f"✅ Replaced {occurrences} occurrence(s) of '{find}' with '{replacement}'"
@@ -4737,8 +5887,6 @@ def sheets_find_replace(spreadsheet_id: str, sheet_id: int, find: str, replaceme
 def sheets_sort_range(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                       start_col: int, end_col: int, sort_col_index: int, ascending: bool = True) -> str:
     """Sort a range by a column. sort_col_index is 0-based within the range."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'sortRange': {
             'range': {
@@ -4755,10 +5903,8 @@ def sheets_sort_range(spreadsheet_id: str, sheet_id: int, start_row: int, end_ro
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     direction = "ascending" if ascending else "descending"
     return f"✅ Sorted range by column {start_col + sort_col_index} ({direction})"
@@ -4768,8 +5914,6 @@ def sheets_sort_range(spreadsheet_id: str, sheet_id: int, start_row: int, end_ro
 def sheets_freeze_rows_columns(spreadsheet_id: str, sheet_id: int, frozen_row_count: int = 0,
                                 frozen_column_count: int = 0) -> str:
     """Freeze rows and/or columns. Set counts to 0 to unfreeze."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'updateSheetProperties': {
             'properties': {
@@ -4783,10 +5927,8 @@ def sheets_freeze_rows_columns(spreadsheet_id: str, sheet_id: int, frozen_row_co
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Froze {frozen_row_count} row(s) and {frozen_column_count} column(s)"
 
@@ -4795,8 +5937,6 @@ def sheets_freeze_rows_columns(spreadsheet_id: str, sheet_id: int, frozen_row_co
 def sheets_create_named_range(spreadsheet_id: str, range_name: str, sheet_id: int,
                                start_row: int, end_row: int, start_col: int, end_col: int) -> str:
     """Create a named range. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'addNamedRange': {
             'namedRange': {
@@ -4812,10 +5952,8 @@ def sheets_create_named_range(spreadsheet_id: str, range_name: str, sheet_id: in
         }
     }]
 
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Created named range '{range_name}'"
 
@@ -4825,12 +5963,8 @@ def sheets_add_conditional_format(spreadsheet_id: str, sheet_id: int, start_row:
                                    start_col: int, end_col: int, condition_type: str,
                                    condition_value: str, background_color: str = "#00FF00") -> str:
     """Add conditional formatting. condition_type: NUMBER_GREATER, NUMBER_LESS, TEXT_CONTAINS, etc. Indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     # Convert hex to RGB
-    r = int(background_color[1:3], 16) / 255
-    g = int(background_color[3:5], 16) / 255
-    b = int(background_color[5:7], 16) / 255
+    r, g, b = hex_to_rgb(background_color)
 
     condition_values = [{'userEnteredValue': condition_value}]
 
@@ -4858,20 +5992,15 @@ def sheets_add_conditional_format(spreadsheet_id: str, sheet_id: int, start_row:
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Added conditional formatting rule ({condition_type})"
 
 
-@mcp.tool()
-def sheets_add_note(spreadsheet_id: str, sheet_id: int, row: int, col: int, note: str) -> str:
-    """Add a note to a cell. Row and column are 0-based."""
-    service = get_service('sheets', 'v4')
-
-    requests = [{
+def _note_request(sheet_id: int, row: int, col: int, note: str) -> dict:
+    """updateCells request setting the note on a single cell."""
+    return {
         'updateCells': {
             'range': {
                 'sheetId': sheet_id,
@@ -4887,23 +6016,56 @@ def sheets_add_note(spreadsheet_id: str, sheet_id: int, row: int, col: int, note
             }],
             'fields': 'note'
         }
-    }]
+    }
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+
+@mcp.tool()
+def sheets_add_note(spreadsheet_id: str, sheet_id: int, row: int, col: int, note: str) -> str:
+    """Add a note to a cell. Row and column are 0-based."""
+    requests = [_note_request(sheet_id, row, col, note)]
+
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Added note to cell (row {row}, col {col})"
 
 
+@mcp.tool()
+def sheets_add_notes(spreadsheet_id: str, sheet_id: int, notes: str) -> str:
+    """Add notes to many cells in a single request. Rows and columns are 0-based.
+
+    Args:
+        notes: JSON array like '[{"row": 0, "col": 0, "note": "Check this"}]'; an item may set its own "sheet_id"
+    """
+    try:
+        items = parse_json(notes)
+    except ValueError:
+        items = None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return "❌ Error: notes must be a JSON array of objects"
+
+    try:
+        requests = [
+            _note_request(item.get('sheet_id', sheet_id), item['row'], item['col'], item['note'])
+            for item in items
+        ]
+    except KeyError as e:
+        return f"❌ Invalid note, missing key: {str(e)}"
+
+    if not requests:
+        return "ℹ️ No notes to add"
+
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
+
+    return f"✅ Added {len(requests)} note(s) in one request"
+
+
 @mcp.tool()
 def sheets_protect_range(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                          start_col: int, end_col: int, description: str = "Protected Range",
                          warning_only: bool = False) -> str:
     """Protect a range from editing. warning_only=True shows warning instead of blocking. Indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'addProtectedRange': {
             'protectedRange': {
@@ -4920,10 +6082,8 @@ def sheets_protect_range(spreadsheet_id: str, sheet_id: int, start_row: int, end
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     protection_type = "warning" if warning_only else "protected"
     return f"✅ Range is now {protection_type}: {description}"
@@ -4934,8 +6094,6 @@ def sheets_create_chart(spreadsheet_id: str, sheet_id: int, chart_type: str,
                         data_start_row: int, data_end_row: int, data_start_col: int, data_end_col: int,
                         position_row: int = 0, position_col: int = 0) -> str:
     """Create a chart. chart_type: COLUMN, BAR, LINE, PIE, AREA, SCATTER. All indices 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'addChart': {
             'chart': {
@@ -4985,10 +6143,8 @@ def sheets_create_chart(spreadsheet_id: str, sheet_id: int, chart_type: str,
         }
     }]
 
-    response = service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Created {chart_type} chart"
 
@@ -4997,8 +6153,6 @@ def sheets_create_chart(spreadsheet_id: str, sheet_id: int, chart_type: str,
 def sheets_create_filter(spreadsheet_id: str, sheet_id: int, start_row: int, end_row: int,
                          start_col: int, end_col: int) -> str:
     """Create a filter view on a range. Indices are 0-based."""
-    service = get_service('sheets', 'v4')
-
     requests = [{
         'setBasicFilter': {
             'filter': {
@@ -5013,10 +6167,8 @@ def sheets_create_filter(spreadsheet_id: str, sheet_id: int, start_row: int, end
         }
     }]
 
-    service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('sheets', spreadsheet_id, requests) is None:
+        return queued_message('sheets', spreadsheet_id)
 
     return f"✅ Created filter on range"
 
@@ -5025,6 +6177,17 @@ def sheets_create_filter(spreadsheet_id: str, sheet_id: int, start_row: int, end
 # SLIDES TOOLS
 # ============================================================================
 
+# Object IDs must be unique within a presentation. A per-process random prefix plus a
+# counter keeps IDs unique even when many are generated in the same batch.
+_id_prefix = secrets.token_hex(3)
+_id_counter = itertools.count()
+
+
+def _oid(kind: str) -> str:
+    """Generate a unique Slides object ID like 'shape_a1b2c3f'."""
+    return f"{kind}_{_id_prefix}{next(_id_counter):x}"
+
+
 @mcp.tool()
 def slides_create(title: str, parent_id: Optional[str] = None, drive_id: Optional[str] = None) -> str:
     """Create a new Google Slides presentation."""
@@ -5033,7 +6196,7 @@ def slides_create(title: str, parent_id: Optional[str] = None, drive_id: Optiona
     if parent_id:
         file_metadata['parents'] = [parent_id]
     params = {'supportsAllDrives': True} if drive_id else {}
-    slides = drive_service.files().create(body=file_metadata, fields='id, name, webViewLink', **params).execute()
+    slides = execute_with_retry(drive_service.files().create(body=file_metadata, fields='id, name, webViewLink', **params))
     return f"✅ Google Slides created!\nTitle: {slides['name']}\nID: {slides['id']}\nLink: {slides.get('webViewLink', 'N/A')}"
 
 
@@ -5041,24 +6204,50 @@ def slides_create(title: str, parent_id: Optional[str] = None, drive_id: Optiona
 def slides_get_details(presentation_id: str) -> str:
     """Get presentation details including slide count and structure."""
     service = get_service('slides', 'v1')
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
+    presentation = execute_with_retry(service.presentations().get(
+        presentationId=presentation_id,
+        fields='title,slides(objectId,pageElements/shape/text/textElements/endIndex)'
+    ))
+    slides = presentation.get('slides', [])
+
+    output = [
+        f"Presentation: {presentation.get('title', 'Untitled')}\n",
+        f"ID: {presentation_id}\n",
+        f"Slides: {len(slides)}\n\n",
+    ]
 
-    output = f"Presentation: {presentation.get('title', 'Untitled')}\n"
-    output += f"ID: {presentation_id}\n"
-    output += f"Slides: {len(presentation.get('slides', []))}\n\n"
+    for idx, slide in enumerate(slides, 1):
+        output.append(f"Slide {idx}:\n")
+        output.append(f"  ID: {slide['objectId']}\n")
 
-    for idx, slide in enumerate(presentation.get('slides', []), 1):
-        output += f"Slide {idx}:\n"
-        output += f"  ID: {slide['objectId']}\n"
+        elements = slide.get('pageElements', ())
+        text_count = sum(1 for el in elements if 'text' in el.get('shape', ()))
+        output.append(f"  Text elements: {text_count}\n\n")
 
-        # Count text elements
-        text_count = 0
-        for element in slide.get('pageElements', []):
-            if 'shape' in element and 'text' in element['shape']:
-                text_count += 1
-        output += f"  Text elements: {text_count}\n\n"
+    return ''.join(output)
 
-    return output
+
+@mcp.tool()
+def slides_batch_begin(presentation_id: str) -> str:
+    """Start queuing edits to a presentation so they are sent together.
+
+    Until slides_batch_commit is called, batchUpdate-based slides tools queue their edits
+    instead of applying them. Tools that return new IDs or counts still run immediately
+    (sending anything queued before them in the same request).
+    """
+    return begin_batch('slides', presentation_id)
+
+
+@mcp.tool()
+def slides_batch_commit(presentation_id: str) -> str:
+    """Apply all edits queued since slides_batch_begin in a single batchUpdate."""
+    return commit_batch('slides', presentation_id)
+
+
+@mcp.tool()
+def slides_batch_discard(presentation_id: str) -> str:
+    """Drop all edits queued since slides_batch_begin without applying them."""
+    return discard_batch('slides', presentation_id)
 
 
 @mcp.tool()
@@ -5073,10 +6262,12 @@ def slides_list_layouts(presentation_id: str) -> str:
         presentation_id: The ID of the presentation
     """
     service = get_service('slides', 'v1')
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
+    presentation = execute_with_retry(service.presentations().get(
+        presentationId=presentation_id,
+        fields='layouts(objectId,layoutProperties,pageElements/shape/placeholder/type)'
+    ))
 
     layouts = presentation.get('layouts', [])
-    masters = presentation.get('masters', [])
 
     if not layouts:
         return "No layouts found in this presentation."
@@ -5111,24 +6302,28 @@ def slides_list_layouts(presentation_id: str) -> str:
 def slides_read(presentation_id: str) -> str:
     """Read all text content from a presentation."""
     service = get_service('slides', 'v1')
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
+    presentation = execute_with_retry(service.presentations().get(
+        presentationId=presentation_id,
+        fields='title,slides/pageElements/shape/text/textElements/textRun/content'
+    ))
 
-    output = f"Presentation: {presentation.get('title', 'Untitled')}\n"
-    output += f"{'-'*60}\n\n"
+    output = [
+        f"Presentation: {presentation.get('title', 'Untitled')}\n",
+        f"{'-'*60}\n\n",
+    ]
 
     for idx, slide in enumerate(presentation.get('slides', []), 1):
-        output += f"=== Slide {idx} ===\n"
+        output.append(f"=== Slide {idx} ===\n")
+        output.extend(
+            te['textRun'].get('content', '')
+            for el in slide.get('pageElements', ())
+            if 'shape' in el and 'text' in el['shape']
+            for te in el['shape']['text'].get('textElements', ())
+            if 'textRun' in te
+        )
+        output.append("\n\n")
 
-        for element in slide.get('pageElements', []):
-            if 'shape' in element and 'text' in element['shape']:
-                text_elements = element['shape']['text'].get('textElements', [])
-                for text_elem in text_elements:
-                    if 'textRun' in text_elem:
-                        output += text_elem['textRun'].get('content', '')
-
-        output += "\n\n"
-
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -5149,7 +6344,10 @@ def slides_add_slide(presentation_id: str, index: Optional[int] = None,
 
     # If layout_name is provided but not layout_id, search for it
     if layout_name and not layout_id:
-        presentation = service.presentations().get(presentationId=presentation_id).execute()
+        presentation = execute_with_retry(service.presentations().get(
+            presentationId=presentation_id,
+            fields='layouts(objectId,layoutProperties/displayName)'
+        ))
         layouts = presentation.get('layouts', [])
 
         for layout in layouts:
@@ -5162,7 +6360,7 @@ def slides_add_slide(presentation_id: str, index: Optional[int] = None,
             return f"❌ Layout '{layout_name}' not found. Use slides_list_layouts() to see available layouts."
 
     # Generate a unique ID for the new slide
-    slide_id = f'slide_{int(datetime.now().timestamp())}'
+    slide_id = _oid('slide')
 
     create_slide_request = {
         'objectId': slide_id,
@@ -5177,10 +6375,8 @@ def slides_add_slide(presentation_id: str, index: Optional[int] = None,
 
     requests = [{'createSlide': create_slide_request}]
 
-    response = service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    _speaker_notes_cache.pop(presentation_id)
+    response = batch_update('slides', presentation_id, requests, needs_replies=True)
 
     created_slide_id = response['replies'][0]['createSlide']['objectId']
 
@@ -5191,6 +6387,38 @@ def slides_add_slide(presentation_id: str, index: Optional[int] = None,
     return output
 
 
+@mcp.tool()
+def slides_add_slides(presentation_id: str, count: int, index: Optional[int] = None,
+                      layout_id: Optional[str] = None) -> str:
+    """Add several slides in a single request.
+
+    Args:
+        presentation_id: The ID of the presentation
+        count: Number of slides to add
+        index: Position of the first new slide (0-based, default: append to end)
+        layout_id: Layout ID to use for every new slide (get from slides_list_layouts)
+    """
+    slide_ids = [_oid('slide') for _ in range(count)]
+
+    requests = []
+    for i, slide_id in enumerate(slide_ids):
+        create_slide_request = {'objectId': slide_id}
+        if index is not None:
+            create_slide_request['insertionIndex'] = index + i
+        if layout_id:
+            create_slide_request['slideLayoutReference'] = {'layoutId': layout_id}
+        requests.append({'createSlide': create_slide_request})
+
+    if not requests:
+        return "ℹ️ No slides to add"
+
+    _speaker_notes_cache.pop(presentation_id)
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
+
+    return f"✅ Added {count} slide(s)!\nSlide IDs: {', '.join(slide_ids)}"
+
+
 @mcp.tool()
 def slides_insert_text_in_placeholder(presentation_id: str, slide_id: str, text: str,
                                       placeholder_type: Optional[str] = None,
@@ -5214,7 +6442,10 @@ def slides_insert_text_in_placeholder(presentation_id: str, slide_id: str, text:
     service = get_service('slides', 'v1')
 
     # Get the slide to find placeholders
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
+    presentation = execute_with_retry(service.presentations().get(
+        presentationId=presentation_id,
+        fields='slides(objectId,pageElements(objectId,shape/placeholder/type))'
+    ))
     slides = presentation.get('slides', [])
 
     target_slide = None
@@ -5266,25 +6497,17 @@ def slides_insert_text_in_placeholder(presentation_id: str, slide_id: str, text:
         }
     }]
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     placeholder_type_used = target_placeholder['shape']['placeholder']['type']
     return f"✅ Text inserted into {placeholder_type_used} placeholder!\nSlide: {slide_id}"
 
 
-@mcp.tool()
-def slides_add_text(presentation_id: str, slide_id: str, text: str,
-                    x: float = 100, y: float = 100, width: float = 400, height: float = 100) -> str:
-    """Add a text box to a slide. Coordinates in points (1 inch = 72 points)."""
-    service = get_service('slides', 'v1')
-
-    # Generate unique ID for text box
-    text_box_id = f'textbox_{int(datetime.now().timestamp())}'
-
-    requests = [
+def _text_box_requests(text_box_id: str, slide_id: str, text: str,
+                       x: float, y: float, width: float, height: float) -> list:
+    """createShape + insertText requests for a positioned text box."""
+    return [
         {
             'createShape': {
                 'objectId': text_box_id,
@@ -5313,40 +6536,77 @@ def slides_add_text(presentation_id: str, slide_id: str, text: str,
         }
     ]
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+
+@mcp.tool()
+def slides_add_text(presentation_id: str, slide_id: str, text: str,
+                    x: float = 100, y: float = 100, width: float = 400, height: float = 100) -> str:
+    """Add a text box to a slide. Coordinates in points (1 inch = 72 points)."""
+    requests = _text_box_requests(_oid('textbox'), slide_id, text, x, y, width, height)
+
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Text added to slide!\nText: {text[:50]}...\nSlide: {slide_id}"
 
 
 @mcp.tool()
-def slides_delete_slide(presentation_id: str, slide_id: str) -> str:
-    """Delete a slide from presentation."""
-    service = get_service('slides', 'v1')
+def slides_add_texts(presentation_id: str, slide_id: str, texts: str) -> str:
+    """Add several text boxes in a single request. Coordinates in points (1 inch = 72 points).
 
-    requests = [{
-        'deleteObject': {
-            'objectId': slide_id
-        }
-    }]
+    Args:
+        texts: JSON array like '[{"text": "Hello", "x": 100, "y": 100, "width": 400, "height": 100}]'.
+               Position and size default like slides_add_text; an item may set its own "slide_id".
+    """
+    try:
+        items = parse_json(texts)
+    except ValueError:
+        items = None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return "❌ Error: texts must be a JSON array of objects"
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    requests = []
+    for item in items:
+        if 'text' not in item:
+            return "❌ Invalid text box, missing key: 'text'"
+        requests.extend(_text_box_requests(
+            _oid('textbox'), item.get('slide_id', slide_id), item['text'],
+            item.get('x', 100), item.get('y', 100), item.get('width', 400), item.get('height', 100)
+        ))
+
+    if not requests:
+        return "ℹ️ No text boxes to add"
+
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
+
+    return f"✅ Added {len(items)} text box(es) in one request"
+
+
+@mcp.tool()
+def slides_delete_slide(presentation_id: str, slide_id: str) -> str:
+    """Delete a slide from presentation."""
+    requests = [{
+        'deleteObject': {
+            'objectId': slide_id
+        }
+    }]
+
+    _speaker_notes_cache.pop(presentation_id)
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Slide deleted!\nSlide ID: {slide_id}"
 
 
 @mcp.tool()
 def slides_insert_image(presentation_id: str, slide_id: str, image_url: str,
-                        x: float = 100, y: float = 100, width: float = 400, height: float = 300) -> str:
-    """Insert an image into a slide from a URL. Coordinates in points (1 inch = 72 points)."""
-    service = get_service('slides', 'v1')
+                        x: float = 100, y: float = 100, width: float = 400, height: float = 300,
+                        caption: Optional[str] = None) -> str:
+    """Insert an image into a slide from a URL. Coordinates in points (1 inch = 72 points).
 
-    image_id = f'image_{int(datetime.now().timestamp())}'
+    An optional caption is added in a text box just below the image, in the same request.
+    """
+    image_id = _oid('image')
 
     requests = [{
         'createImage': {
@@ -5369,10 +6629,11 @@ def slides_insert_image(presentation_id: str, slide_id: str, image_url: str,
         }
     }]
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    if caption:
+        requests.extend(_text_box_requests(_oid('caption'), slide_id, caption, x, y + height + 8, width, 40))
+
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Image inserted!\nImage ID: {image_id}\nSlide: {slide_id}"
 
@@ -5380,8 +6641,6 @@ def slides_insert_image(presentation_id: str, slide_id: str, image_url: str,
 @mcp.tool()
 def slides_replace_text(presentation_id: str, find_text: str, replace_text: str, match_case: bool = False) -> str:
     """Find and replace text across all slides in presentation."""
-    service = get_service('slides', 'v1')
-
     requests = [{
         'replaceAllText': {
             'containsText': {
@@ -5392,26 +6651,16 @@ def slides_replace_text(presentation_id: str, find_text: str, replace_text: str,
         }
     }]
 
-    response = service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    _speaker_notes_cache.pop(presentation_id)
+    response = batch_update('slides', presentation_id, requests, needs_replies=True)
 
     occurrences = response.get('replies', [{}])[0].get('replaceAllText', {}).get('occurrencesChanged', 0)
     return f"✅ Replaced {occurrences} occurrence(s) of '{find_text}' with '{replace_text}'"
 
 
-@mcp.tool()
-def slides_format_text(presentation_id: str, slide_id: str, shape_id: str,
-                       start_index: int, end_index: int, bold: Optional[bool] = None,
-                       italic: Optional[bool] = None, font_size: Optional[int] = None,
-                       foreground_color: Optional[str] = None) -> str:
-    """Format text within a text box/shape on a slide. Color in hex format like '#FF0000'."""
-    service = get_service('slides', 'v1')
-
-    requests = []
-
-    # Build text style
+def _slides_text_style(bold: Optional[bool] = None, italic: Optional[bool] = None,
+                       font_size: Optional[int] = None, foreground_color: Optional[str] = None):
+    """Build a Slides TextStyle and its field list from optional style arguments."""
     text_style = {}
     fields = []
 
@@ -5428,9 +6677,7 @@ def slides_format_text(presentation_id: str, slide_id: str, shape_id: str,
         fields.append('fontSize')
 
     if foreground_color:
-        r = int(foreground_color[1:3], 16) / 255
-        g = int(foreground_color[3:5], 16) / 255
-        b = int(foreground_color[5:7], 16) / 255
+        r, g, b = hex_to_rgb(foreground_color)
         text_style['foregroundColor'] = {
             'opaqueColor': {
                 'rgbColor': {'red': r, 'green': g, 'blue': b}
@@ -5438,6 +6685,19 @@ def slides_format_text(presentation_id: str, slide_id: str, shape_id: str,
         }
         fields.append('foregroundColor')
 
+    return text_style, fields
+
+
+@mcp.tool()
+def slides_format_text(presentation_id: str, slide_id: str, shape_id: str,
+                       start_index: int, end_index: int, bold: Optional[bool] = None,
+                       italic: Optional[bool] = None, font_size: Optional[int] = None,
+                       foreground_color: Optional[str] = None) -> str:
+    """Format text within a text box/shape on a slide. Color in hex format like '#FF0000'."""
+    requests = []
+
+    text_style, fields = _slides_text_style(bold, italic, font_size, foreground_color)
+
     if text_style:
         requests.append({
             'updateTextStyle': {
@@ -5452,21 +6712,25 @@ def slides_format_text(presentation_id: str, slide_id: str, shape_id: str,
             }
         })
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    if not requests:
+        return "ℹ️ No style changes requested"
+
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Formatted text in shape {shape_id} (indices {start_index}-{end_index})"
 
 
 @mcp.tool()
 def slides_add_shape(presentation_id: str, slide_id: str, shape_type: str,
-                     x: float = 100, y: float = 100, width: float = 200, height: float = 200) -> str:
-    """Add a shape to a slide. Types: RECTANGLE, ELLIPSE, TRIANGLE, ARROW, etc."""
-    service = get_service('slides', 'v1')
+                     x: float = 100, y: float = 100, width: float = 200, height: float = 200,
+                     text: Optional[str] = None, bold: Optional[bool] = None, italic: Optional[bool] = None,
+                     font_size: Optional[int] = None, foreground_color: Optional[str] = None) -> str:
+    """Add a shape to a slide. Types: RECTANGLE, ELLIPSE, TRIANGLE, ARROW, etc.
 
-    shape_id = f'shape_{int(datetime.now().timestamp())}'
+    Optional text is inserted and styled in the same request. Color in hex format like '#FF0000'.
+    """
+    shape_id = _oid('shape')
 
     requests = [{
         'createShape': {
@@ -5489,10 +6753,26 @@ def slides_add_shape(presentation_id: str, slide_id: str, shape_type: str,
         }
     }]
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    if text:
+        requests.append({
+            'insertText': {
+                'objectId': shape_id,
+                'text': text
+            }
+        })
+        text_style, fields = _slides_text_style(bold, italic, font_size, foreground_color)
+        if text_style:
+            requests.append({
+                'updateTextStyle': {
+                    'objectId': shape_id,
+                    'textRange': {'type': 'ALL'},
+                    'style': text_style,
+                    'fields': ','.join(fields)
+                }
+            })
+
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Shape added!\nShape ID: {shape_id}\nType: {shape_type}"
 
@@ -5500,8 +6780,6 @@ def slides_add_shape(presentation_id: str, slide_id: str, shape_type: str,
 @mcp.tool()
 def slides_duplicate_slide(presentation_id: str, slide_id: str, index: Optional[int] = None) -> str:
     """Duplicate a slide within the presentation."""
-    service = get_service('slides', 'v1')
-
     requests = [{
         'duplicateObject': {
             'objectId': slide_id,
@@ -5509,74 +6787,65 @@ def slides_duplicate_slide(presentation_id: str, slide_id: str, index: Optional[
         }
     }]
 
-    response = service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    _speaker_notes_cache.pop(presentation_id)
+    response = batch_update('slides', presentation_id, requests, needs_replies=True)
 
     new_slide_id = response['replies'][0]['duplicateObject']['objectId']
     return f"✅ Slide duplicated!\nOriginal: {slide_id}\nNew slide ID: {new_slide_id}"
 
 
-@mcp.tool()
-def slides_add_speaker_notes(presentation_id: str, slide_id: str, notes: str) -> str:
-    """Add or update speaker notes for a slide."""
-    service = get_service('slides', 'v1')
+# presentation_id -> {slide_id: notes_shape_id}, so repeated notes edits on one deck skip
+# the lookup GET. Cleared by tools that add, remove or copy slides. Whether a box holds
+# text is not cached, since notes can be edited outside this server.
+_speaker_notes_cache = TTLCache(ttl=60, maxsize=64)
 
-    # Get the presentation to find the notes page
-    presentation = service.presentations().get(presentationId=presentation_id).execute()
 
-    # Find the slide and its notes page
-    notes_page_id = None
+def _load_speaker_notes_index(presentation_id: str) -> dict:
+    """Fetch each slide's speaker notes shape ID."""
+    service = get_service('slides', 'v1')
+    presentation = execute_with_retry(service.presentations().get(
+        presentationId=presentation_id,
+        fields='slides(objectId,slideProperties/notesPage/notesProperties/speakerNotesObjectId)'
+    ))
+
+    notes_index = {}
     for slide in presentation.get('slides', []):
-        if slide['objectId'] == slide_id:
-            notes_page_id = slide.get('slideProperties', {}).get('notesPage', {}).get('objectId')
-            break
+        notes_page = slide.get('slideProperties', {}).get('notesPage', {})
+        notes_index[slide['objectId']] = notes_page.get('notesProperties', {}).get('speakerNotesObjectId')
 
-    if not notes_page_id:
-        return f"❌ Could not find notes page for slide {slide_id}"
+    _speaker_notes_cache.set(presentation_id, notes_index)
+    return notes_index
 
-    # Get notes page to find the notes shape
-    notes_page = service.presentations().pages().get(
-        presentationId=presentation_id,
-        pageObjectId=notes_page_id
-    ).execute()
 
-    # Find the notes shape (usually the second shape on the notes page)
-    notes_shape_id = None
-    for element in notes_page.get('pageElements', []):
-        if 'shape' in element and element['shape'].get('shapeType') == 'TEXT_BOX':
-            # Skip the first text box (slide thumbnail placeholder)
-            if notes_shape_id is None:
-                notes_shape_id = element['objectId']
-                continue
-            notes_shape_id = element['objectId']
-            break
+@mcp.tool()
+def slides_add_speaker_notes(presentation_id: str, slide_id: str, notes: str) -> str:
+    """Add or update speaker notes for a slide."""
+    notes_index = _speaker_notes_cache.get(presentation_id)
+    if notes_index is None or slide_id not in notes_index:
+        notes_index = _load_speaker_notes_index(presentation_id)
+
+    notes_shape_id = notes_index.get(slide_id)
 
     if not notes_shape_id:
         return f"❌ Could not find notes shape on slide {slide_id}"
 
-    # Insert text into notes
+    # Replace existing notes. deleteText fails on an empty box, so a space is inserted
+    # first; the box then always has text to delete, whatever it held before.
     requests = [
-        {
-            'deleteText': {
-                'objectId': notes_shape_id,
-                'textRange': {'type': 'ALL'}
-            }
-        },
-        {
+        {'insertText': {'objectId': notes_shape_id, 'text': ' ', 'insertionIndex': 0}},
+        {'deleteText': {'objectId': notes_shape_id, 'textRange': {'type': 'ALL'}}},
+    ]
+    if notes:
+        requests.append({
             'insertText': {
                 'objectId': notes_shape_id,
                 'text': notes,
                 'insertionIndex': 0
             }
-        }
-    ]
+        })
 
-    service.presentations().batchUpdate(
-        presentationId=presentation_id,
-        body={'requests': requests}
-    ).execute()
+    if batch_update('slides', presentation_id, requests) is None:
+        return queued_message('slides', presentation_id)
 
     return f"✅ Speaker notes added to slide {slide_id}"
 
@@ -5585,6 +6854,11 @@ def slides_add_speaker_notes(presentation_id: str, slide_id: str, notes: str) ->
 # FORMS TOOLS
 # ============================================================================
 
+# Recently fetched forms, so repeated forms_get polls skip the round trip. The Forms
+# API has no ETags to revalidate with, so entries expire quickly and every tool here
+# that edits a form drops its entry.
+_form_cache = TTLCache(ttl=30, maxsize=64)
+
 @mcp.tool()
 def forms_create(title: str, description: Optional[str] = None) -> str:
     """Create a new Google Form."""
@@ -5599,7 +6873,7 @@ def forms_create(title: str, description: Optional[str] = None) -> str:
     if description:
         form['info']['documentTitle'] = description
 
-    created_form = service.forms().create(body=form).execute()
+    created_form = execute_with_retry(service.forms().create(body=form))
 
     return f"✅ Google Form created!\nTitle: {created_form['info']['title']}\nForm ID: {created_form['formId']}\nEdit Link: https://docs.google.com/forms/d/{created_form['formId']}/edit"
 
@@ -5609,176 +6883,166 @@ def forms_get(form_id: str) -> str:
     """Get details about a Google Form including all questions."""
     service = get_service('forms', 'v1')
 
-    form = service.forms().get(formId=form_id).execute()
+    form = _form_cache.get(form_id)
+    if form is None:
+        form = execute_with_retry(service.forms().get(formId=form_id, fields='formId,info/title,items/questionItem/question'))
+        _form_cache.set(form_id, form)
 
-    output = f"Form: {form['info']['title']}\n"
-    output += f"ID: {form['formId']}\n"
-    output += f"Edit Link: https://docs.google.com/forms/d/{form['formId']}/edit\n"
-    output += f"Response Link: https://docs.google.com/forms/d/{form['formId']}/viewform\n\n"
+    output = [
+        f"Form: {form['info']['title']}\n",
+        f"ID: {form['formId']}\n",
+        f"Edit Link: https://docs.google.com/forms/d/{form['formId']}/edit\n",
+        f"Response Link: https://docs.google.com/forms/d/{form['formId']}/viewform\n\n",
+    ]
 
     if 'items' in form:
-        output += f"Questions ({len(form['items'])}):\n\n"
+        output.append(f"Questions ({len(form['items'])}):\n\n")
         for idx, item in enumerate(form['items'], 1):
             if 'questionItem' in item:
                 question = item['questionItem']['question']
-                output += f"{idx}. {question.get('questionId', 'N/A')}\n"
+                output.append(f"{idx}. {question.get('questionId', 'N/A')}\n")
                 if 'textQuestion' in question:
-                    output += f"   Type: Text\n"
+                    output.append("   Type: Text\n")
                 elif 'choiceQuestion' in question:
-                    output += f"   Type: Multiple Choice\n"
+                    output.append("   Type: Multiple Choice\n")
                 elif 'scaleQuestion' in question:
-                    output += f"   Type: Scale\n"
-                output += "\n"
+                    output.append("   Type: Scale\n")
+                output.append("\n")
 
-    return output
+    return ''.join(output)
 
 
-@mcp.tool()
-def forms_add_text_question(form_id: str, question_text: str, required: bool = False) -> str:
-    """Add a text question to a form."""
+# Splits 'Option 1, Option 2' in one pass, dropping the whitespace around each comma.
+_OPT_SPLIT = re.compile(r'\s*,\s*')
+
+# Constant question bodies, shared by every request (they are only ever serialized).
+_TEXT_QUESTION = {'paragraph': False}
+_PARAGRAPH_QUESTION = {'paragraph': True}
+
+
+def _choice_question(choice_type: str):
+    """Builder for a choice question of the given type (RADIO, CHECKBOX, DROP_DOWN)."""
+    def build_choice(spec: dict) -> dict:
+        options = spec.get('options', [])
+        if isinstance(options, str):
+            options = _OPT_SPLIT.split(options.strip())
+        return {'choiceQuestion': {'type': choice_type, 'options': [{'value': opt} for opt in options]}}
+    return build_choice
+
+
+def _scale_question(spec: dict) -> dict:
+    """Builder for a linear scale question, with optional end labels."""
+    scale_question = {'low': spec.get('low', 1), 'high': spec.get('high', 5)}
+    if spec.get('low_label'):
+        scale_question['lowLabel'] = spec['low_label']
+    if spec.get('high_label'):
+        scale_question['highLabel'] = spec['high_label']
+    return {'scaleQuestion': scale_question}
+
+
+# Question spec type -> builder of the type-specific part of the question body.
+_QSPEC_BUILDERS = {
+    'text': lambda spec: {'textQuestion': _TEXT_QUESTION},
+    'paragraph': lambda spec: {'textQuestion': _PARAGRAPH_QUESTION},
+    'choice': _choice_question('RADIO'),
+    'checkbox': _choice_question('CHECKBOX'),
+    'dropdown': _choice_question('DROP_DOWN'),
+    'scale': _scale_question,
+    'date': lambda spec: {'dateQuestion': {'includeYear': spec.get('include_year', True)}},
+    'time': lambda spec: {'timeQuestion': {'duration': spec.get('duration', False)}},
+}
+
+
+def _question(spec: dict) -> dict:
+    """Build a Forms question body from a question spec (see forms_add_questions)."""
+    kind = spec.get('type', 'text')
+    builder = _QSPEC_BUILDERS.get(kind)
+    if builder is None:
+        raise ValueError(f"Unknown question type: {kind}")
+
+    question = builder(spec)
+    question['required'] = spec.get('required', False)
+    return question
+
+
+def _add_questions(form_id: str, specs: list, index: int = 0):
+    """Create all questions in one batchUpdate, in order, starting at index."""
+    requests = [{
+        'createItem': {
+            'item': {
+                'title': spec['title'],
+                'questionItem': {'question': _question(spec)}
+            },
+            'location': {'index': index + offset}
+        }
+    } for offset, spec in enumerate(specs)]
+
     service = get_service('forms', 'v1')
+    execute_with_retry(service.forms().batchUpdate(formId=form_id, body={'requests': requests}))
+    _form_cache.pop(form_id)
+
+
+@mcp.tool()
+def forms_add_questions(form_id: str, questions: str, index: int = 0) -> str:
+    """Add several questions in a single request, keeping their order.
+
+    Args:
+        questions: JSON array like '[{"type": "text", "title": "Name", "required": true},
+                   {"type": "choice", "title": "Colour", "options": ["Red", "Blue"]}]'.
+                   type is one of text, paragraph, choice, checkbox, dropdown, scale
+                   (low, high, low_label, high_label), date (include_year) or time (duration).
+        index: Position of the first new question (0 = top of the form)
+    """
+    try:
+        specs = parse_json(questions)
+    except ValueError:
+        specs = None
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+        return "❌ Error: questions must be a JSON array of objects"
+
+    if not specs:
+        return "ℹ️ No questions to add"
+
+    try:
+        _add_questions(form_id, specs, index)
+    except (KeyError, ValueError) as e:
+        return f"❌ Invalid question spec: {str(e)}"
+
+    return f"✅ Added {len(specs)} question(s) in one request"
 
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'textQuestion': {
-                                'paragraph': False
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
 
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+@mcp.tool()
+def forms_add_text_question(form_id: str, question_text: str, required: bool = False) -> str:
+    """Add a text question to a form."""
+    _add_questions(form_id, [{'type': 'text', 'title': question_text, 'required': required}])
     return f"✅ Added text question: {question_text}"
 
 
 @mcp.tool()
 def forms_add_multiple_choice(form_id: str, question_text: str, options: str, required: bool = False) -> str:
     """Add a multiple choice question. options: comma-separated like 'Option 1,Option 2,Option 3'"""
-    service = get_service('forms', 'v1')
-
-    option_list = [opt.strip() for opt in options.split(',')]
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'choiceQuestion': {
-                                'type': 'RADIO',
-                                'options': [{'value': opt} for opt in option_list]
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'choice', 'title': question_text, 'options': options, 'required': required}])
     return f"✅ Added multiple choice question: {question_text}"
 
 
 @mcp.tool()
 def forms_add_paragraph_text(form_id: str, question_text: str, required: bool = False) -> str:
     """Add a paragraph text question (long-form text) to a form."""
-    service = get_service('forms', 'v1')
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'textQuestion': {
-                                'paragraph': True
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'paragraph', 'title': question_text, 'required': required}])
     return f"✅ Added paragraph text question: {question_text}"
 
 
 @mcp.tool()
 def forms_add_checkbox(form_id: str, question_text: str, options: str, required: bool = False) -> str:
     """Add a checkbox question (multiple selections allowed). options: comma-separated like 'Option 1,Option 2,Option 3'"""
-    service = get_service('forms', 'v1')
-
-    option_list = [opt.strip() for opt in options.split(',')]
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'choiceQuestion': {
-                                'type': 'CHECKBOX',
-                                'options': [{'value': opt} for opt in option_list]
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'checkbox', 'title': question_text, 'options': options, 'required': required}])
     return f"✅ Added checkbox question: {question_text}"
 
 
 @mcp.tool()
 def forms_add_dropdown(form_id: str, question_text: str, options: str, required: bool = False) -> str:
     """Add a dropdown question. options: comma-separated like 'Option 1,Option 2,Option 3'"""
-    service = get_service('forms', 'v1')
-
-    option_list = [opt.strip() for opt in options.split(',')]
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'choiceQuestion': {
-                                'type': 'DROP_DOWN',
-                                'options': [{'value': opt} for opt in option_list]
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'dropdown', 'title': question_text, 'options': options, 'required': required}])
     return f"✅ Added dropdown question: {question_text}"
 
 
@@ -5786,133 +7050,56 @@ def forms_add_dropdown(form_id: str, question_text: str, options: str, required:
 def forms_add_scale(form_id: str, question_text: str, low: int = 1, high: int = 5,
                     low_label: Optional[str] = None, high_label: Optional[str] = None, required: bool = False) -> str:
     """Add a linear scale question (e.g., 1-5 rating). Optionally provide labels for low and high values."""
-    service = get_service('forms', 'v1')
-
-    scale_question = {
-        'low': low,
-        'high': high
-    }
-
-    if low_label:
-        scale_question['lowLabel'] = low_label
-    if high_label:
-        scale_question['highLabel'] = high_label
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'scaleQuestion': scale_question
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'scale', 'title': question_text, 'low': low, 'high': high,
+                              'low_label': low_label, 'high_label': high_label, 'required': required}])
     return f"✅ Added scale question: {question_text} ({low}-{high})"
 
 
 @mcp.tool()
 def forms_add_date(form_id: str, question_text: str, include_year: bool = True, required: bool = False) -> str:
     """Add a date question to a form."""
-    service = get_service('forms', 'v1')
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'dateQuestion': {
-                                'includeYear': include_year
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'date', 'title': question_text, 'include_year': include_year,
+                              'required': required}])
     return f"✅ Added date question: {question_text}"
 
 
 @mcp.tool()
 def forms_add_time(form_id: str, question_text: str, duration: bool = False, required: bool = False) -> str:
     """Add a time question. If duration=True, asks for duration instead of time of day."""
-    service = get_service('forms', 'v1')
-
-    request = {
-        'requests': [{
-            'createItem': {
-                'item': {
-                    'title': question_text,
-                    'questionItem': {
-                        'question': {
-                            'required': required,
-                            'timeQuestion': {
-                                'duration': duration
-                            }
-                        }
-                    }
-                },
-                'location': {'index': 0}
-            }
-        }]
-    }
-
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    _add_questions(form_id, [{'type': 'time', 'title': question_text, 'duration': duration, 'required': required}])
     return f"✅ Added time question: {question_text}"
 
 
 @mcp.tool()
 def forms_update_settings(form_id: str, title: Optional[str] = None, description: Optional[str] = None,
-                          collect_email: Optional[bool] = None, allow_response_edits: Optional[bool] = None,
-                          quiz_mode: Optional[bool] = None) -> str:
+                          collect_email: Optional[bool] = None, quiz_mode: Optional[bool] = None) -> str:
     """Update form settings like title, description, and response options."""
     service = get_service('forms', 'v1')
 
     requests = []
 
-    if title is not None:
+    info = {key: value for key, value in (('title', title), ('description', description)) if value is not None}
+    if info:
         requests.append({
             'updateFormInfo': {
-                'info': {
-                    'title': title
-                },
-                'updateMask': 'title'
-            }
-        })
-
-    if description is not None:
-        requests.append({
-            'updateFormInfo': {
-                'info': {
-                    'description': description
-                },
-                'updateMask': 'description'
+                'info': info,
+                'updateMask': ','.join(info)
             }
         })
 
+    settings = {}
+    update_mask = []
     if collect_email is not None:
+        settings['emailCollectionType'] = 'VERIFIED' if collect_email else 'DO_NOT_COLLECT'
+        update_mask.append('emailCollectionType')
+    if quiz_mode is not None:
+        settings['quizSettings'] = {'isQuiz': quiz_mode}
+        update_mask.append('quizSettings.isQuiz')
+    if settings:
         requests.append({
             'updateSettings': {
-                'settings': {
-                    'quizSettings': {
-                        'isQuiz': quiz_mode if quiz_mode is not None else False
-                    }
-                },
-                'updateMask': 'quizSettings.isQuiz'
+                'settings': settings,
+                'updateMask': ','.join(update_mask)
             }
         })
 
@@ -5920,7 +7107,8 @@ def forms_update_settings(form_id: str, title: Optional[str] = None, description
         return "No settings to update."
 
     request_body = {'requests': requests}
-    service.forms().batchUpdate(formId=form_id, body=request_body).execute()
+    execute_with_retry(service.forms().batchUpdate(formId=form_id, body=request_body))
+    _form_cache.pop(form_id)
 
     return f"✅ Form settings updated!"
 
@@ -5930,17 +7118,6 @@ def forms_delete_question(form_id: str, question_index: int) -> str:
     """Delete a question from a form by its index (0-based)."""
     service = get_service('forms', 'v1')
 
-    # Get form to find item at index
-    form = service.forms().get(formId=form_id).execute()
-
-    if 'items' not in form or question_index >= len(form['items']):
-        return f"❌ Question at index {question_index} not found."
-
-    item_id = form['items'][question_index].get('itemId')
-
-    if not item_id:
-        return f"❌ Could not get item ID for question at index {question_index}"
-
     request = {
         'requests': [{
             'deleteItem': {
@@ -5951,7 +7128,13 @@ def forms_delete_question(form_id: str, question_index: int) -> str:
         }]
     }
 
-    service.forms().batchUpdate(formId=form_id, body=request).execute()
+    # The API rejects an out-of-range index, so no need to fetch the form first
+    try:
+        execute_with_retry(service.forms().batchUpdate(formId=form_id, body=request))
+    except HttpError as e:
+        return f"❌ Could not delete question at index {question_index}: {e.reason}"
+    _form_cache.pop(form_id)
+
     return f"✅ Deleted question at index {question_index}"
 
 
@@ -5960,30 +7143,26 @@ def forms_get_response(form_id: str, response_id: str) -> str:
     """Get a specific form response with detailed answers."""
     service = get_service('forms', 'v1')
 
-    try:
-        response = service.forms().responses().get(formId=form_id, responseId=response_id).execute()
-
-        output = f"Response ID: {response['responseId']}\n"
-        output += f"Timestamp: {response.get('lastSubmittedTime', 'N/A')}\n\n"
+    response = execute_with_retry(service.forms().responses().get(formId=form_id, responseId=response_id))
 
-        if 'answers' in response:
-            output += "Answers:\n\n"
-            for question_id, answer in response['answers'].items():
-                output += f"Question ID: {question_id}\n"
+    output = f"Response ID: {response['responseId']}\n"
+    output += f"Timestamp: {response.get('lastSubmittedTime', 'N/A')}\n\n"
 
-                if 'textAnswers' in answer:
-                    for text_ans in answer['textAnswers'].get('answers', []):
-                        output += f"  Answer: {text_ans.get('value', 'N/A')}\n"
+    if 'answers' in response:
+        output += "Answers:\n\n"
+        for question_id, answer in response['answers'].items():
+            output += f"Question ID: {question_id}\n"
 
-                if 'fileUploadAnswers' in answer:
-                    output += f"  File upload response\n"
+            if 'textAnswers' in answer:
+                for text_ans in answer['textAnswers'].get('answers', []):
+                    output += f"  Answer: {text_ans.get('value', 'N/A')}\n"
 
-                output += "\n"
+            if 'fileUploadAnswers' in answer:
+                output += f"  File upload response\n"
 
-        return output
+            output += "\n"
 
-    except Exception as e:
-        return f"❌ Error getting response: {str(e)}"
+    return output
 
 
 @mcp.tool()
@@ -5991,59 +7170,66 @@ def forms_list_responses(form_id: str) -> str:
     """List all responses to a form."""
     service = get_service('forms', 'v1')
 
-    try:
-        responses = service.forms().responses().list(formId=form_id).execute()
-        response_list = responses.get('responses', [])
-
-        if not response_list:
-            return "No responses yet."
-
-        output = f"Found {len(response_list)} response(s):\n\n"
-        for idx, resp in enumerate(response_list, 1):
-            output += f"Response #{idx}\n"
-            output += f"Response ID: {resp['responseId']}\n"
-            output += f"Timestamp: {resp.get('lastSubmittedTime', 'N/A')}\n"
-
-            if 'answers' in resp:
-                output += "Answers:\n"
-                for question_id, answer in resp['answers'].items():
-                    if 'textAnswers' in answer:
-                        for text_ans in answer['textAnswers'].get('answers', []):
-                            output += f"  - {text_ans.get('value', 'N/A')}\n"
-            output += "\n"
+    response_list = list(paginate(lambda page_token: service.forms().responses().list(
+        formId=form_id, pageToken=page_token,
+        fields='nextPageToken,responses(responseId,lastSubmittedTime,answers)'
+    ), 'responses'))
 
-        return output
+    if not response_list:
+        return "No responses yet."
 
-    except Exception as e:
-        return f"❌ Error listing responses: {str(e)}"
+    output = [f"Found {len(response_list)} response(s):\n\n"]
+    append = output.append
+    for idx, resp in enumerate(response_list, 1):
+        append(f"Response #{idx}\n"
+               f"Response ID: {resp['responseId']}\n"
+               f"Timestamp: {resp.get('lastSubmittedTime', 'N/A')}\n")
+
+        answers = resp.get('answers')
+        if answers is not None:
+            append("Answers:\n")
+            for answer in answers.values():
+                text_answers = answer.get('textAnswers')
+                if text_answers is not None:
+                    output.extend(f"  - {text_ans.get('value', 'N/A')}\n"
+                                  for text_ans in text_answers.get('answers', ()))
+        append("\n")
+
+    return ''.join(output)
 
 
 # ============================================================================
 # GOOGLE CHAT TOOLS
 # ============================================================================
 
+# Recently fetched spaces and messages, keyed by resource name, for repeated get
+# polls. Chat resources carry no ETags, so entries expire quickly and the update and
+# delete tools drop theirs.
+_chat_cache = TTLCache(ttl=30, maxsize=256)
+
 @mcp.tool()
 def chat_list_spaces(page_size: int = 100) -> str:
     """List all Google Chat spaces (rooms and DMs) the user has access to."""
     service = get_service('chat', 'v1')
 
-    results = service.spaces().list(pageSize=page_size).execute()
-    spaces = results.get('spaces', [])
+    spaces = list(itertools.islice(paginate(lambda page_token: service.spaces().list(
+        pageSize=page_size, pageToken=page_token, fields='nextPageToken,spaces(name,displayName,type)'
+    ), 'spaces'), page_size))
 
     if not spaces:
         return "No Chat spaces found."
 
-    output = f"Found {len(spaces)} space(s):\n\n"
+    output = [f"Found {len(spaces)} space(s):\n\n"]
     for space in spaces:
         space_type = space.get('type', 'UNKNOWN')
         display_name = space.get('displayName', 'Unnamed')
 
         icon = "💬" if space_type == 'DM' else "👥"
-        output += f"{icon} {display_name}\n"
-        output += f"   Type: {space_type}\n"
-        output += f"   Space ID: {space['name']}\n\n"
+        output.append(f"{icon} {display_name}\n"
+                      f"   Type: {space_type}\n"
+                      f"   Space ID: {space['name']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6051,7 +7237,10 @@ def chat_get_space(space_id: str) -> str:
     """Get details about a specific Google Chat space."""
     service = get_service('chat', 'v1')
 
-    space = service.spaces().get(name=space_id).execute()
+    space = _chat_cache.get(space_id)
+    if space is None:
+        space = execute_with_retry(service.spaces().get(name=space_id))
+        _chat_cache.set(space_id, space)
 
     output = f"Space: {space.get('displayName', 'Unnamed')}\n"
     output += f"ID: {space['name']}\n"
@@ -6068,6 +7257,48 @@ def chat_get_space(space_id: str) -> str:
     return output
 
 
+@mcp.tool()
+def chat_get_space_overview(space_id: str, message_count: int = 10) -> str:
+    """Get a space's details, members and most recent messages, fetched in parallel."""
+    service = get_service('chat', 'v1')
+
+    (space, space_error), (members, members_error), (messages, messages_error) = execute_concurrently([
+        service.spaces().get(name=space_id),
+        service.spaces().members().list(parent=space_id, pageSize=100,
+                                        fields='memberships(role,member/displayName)'),
+        service.spaces().messages().list(parent=space_id, pageSize=message_count, orderBy='createTime desc',
+                                         fields='messages(text,sender/displayName)'),
+    ])
+
+    if space_error:
+        return f"❌ Error getting space: {str(space_error)}"
+
+    output = [f"Space: {space.get('displayName', 'Unnamed')}\n"]
+    output.append(f"ID: {space['name']}\n")
+    output.append(f"Type: {space.get('type', 'UNKNOWN')}\n\n")
+
+    if members_error:
+        output.append(f"❌ Error listing members: {str(members_error)}\n\n")
+    else:
+        memberships = members.get('memberships', [])
+        output.append(f"Members ({len(memberships)}):\n")
+        for member in memberships:
+            member_data = member.get('member', {})
+            output.append(f"👤 {member_data.get('displayName', 'Unknown')} ({member.get('role', 'MEMBER')})\n")
+        output.append("\n")
+
+    if messages_error:
+        output.append(f"❌ Error listing messages: {str(messages_error)}\n")
+    else:
+        recent = messages.get('messages', [])
+        output.append(f"Recent messages ({len(recent)}):\n")
+        for msg in recent:
+            sender_name = msg.get('sender', {}).get('displayName', 'Unknown')
+            output.append(f"💬 {sender_name}: {msg.get('text', '(no text)')[:100]}\n")
+
+    return ''.join(output)
+
+
 @mcp.tool()
 def chat_create_space(display_name: str, space_type: str = "SPACE") -> str:
     """Create a new Google Chat space. Types: SPACE (room) or DM (direct message)."""
@@ -6078,7 +7309,11 @@ def chat_create_space(display_name: str, space_type: str = "SPACE") -> str:
         'spaceType': space_type
     }
 
-    created_space = service.spaces().create(body=space_body).execute()
+    # requestId makes the create safe to retry: Chat returns the existing space for a repeated ID
+    created_space = execute_with_retry(
+        service.spaces().create(body=space_body, requestId=uuid.uuid4().hex),
+        idempotent=True
+    )
 
     return f"✅ Chat space created!\nName: {created_space.get('displayName', 'Unnamed')}\nSpace ID: {created_space['name']}"
 
@@ -6102,11 +7337,12 @@ def chat_update_space(space_id: str, display_name: Optional[str] = None, descrip
     if not update_mask:
         return "No fields to update."
 
-    updated_space = service.spaces().patch(
+    updated_space = execute_with_retry(service.spaces().patch(
         name=space_id,
         updateMask=','.join(update_mask),
         body=space_body
-    ).execute()
+    ))
+    _chat_cache.pop(space_id)
 
     return f"✅ Space updated!\nName: {updated_space.get('displayName', 'Unnamed')}\nSpace ID: {updated_space['name']}"
 
@@ -6116,7 +7352,8 @@ def chat_delete_space(space_id: str) -> str:
     """Delete a Google Chat space."""
     service = get_service('chat', 'v1')
 
-    service.spaces().delete(name=space_id).execute()
+    execute_with_retry(service.spaces().delete(name=space_id))
+    _chat_cache.pop(space_id)
 
     return f"✅ Space {space_id} deleted"
 
@@ -6131,41 +7368,71 @@ def chat_send_message(space_id: str, text: str, thread_key: Optional[str] = None
     if thread_key:
         message_body['thread'] = {'threadKey': thread_key}
 
-    message = service.spaces().messages().create(
+    # requestId makes the send safe to retry: Chat returns the existing message for a repeated ID
+    message = execute_with_retry(service.spaces().messages().create(
         parent=space_id,
-        body=message_body
-    ).execute()
+        body=message_body,
+        requestId=uuid.uuid4().hex
+    ), idempotent=True)
 
     return f"✅ Message sent!\nMessage ID: {message['name']}\nSpace: {space_id}"
 
 
+@mcp.tool()
+def chat_send_message_bulk(space_ids: str, text: str) -> str:
+    """Send the same message to several Google Chat spaces in one batched request.
+
+    Args:
+        space_ids: Comma-separated space IDs (e.g. 'spaces/AAA,spaces/BBB')
+    """
+    service = get_service('chat', 'v1')
+    ids = [sid.strip() for sid in space_ids.split(',') if sid.strip()]
+
+    results = execute_batch(service, [
+        service.spaces().messages().create(
+            parent=sid, body={'text': text}, requestId=uuid.uuid4().hex, fields='name'
+        )
+        for sid in ids
+    ], idempotent=True)
+
+    output = []
+    for sid, (message, error) in zip(ids, results):
+        if error:
+            output.append(f"❌ {sid}: {str(error)}\n")
+        else:
+            output.append(f"✅ {sid}: {message['name']}\n")
+    return ''.join(output)
+
+
 @mcp.tool()
 def chat_list_messages(space_id: str, page_size: int = 25) -> str:
     """List messages in a Google Chat space."""
     service = get_service('chat', 'v1')
 
-    results = service.spaces().messages().list(
+    messages = list(itertools.islice(paginate(lambda page_token: service.spaces().messages().list(
         parent=space_id,
         pageSize=page_size,
-        orderBy='createTime desc'
-    ).execute()
-
-    messages = results.get('messages', [])
+        pageToken=page_token,
+        orderBy='createTime desc',
+        fields='nextPageToken,messages(name,text,createTime,sender/displayName)'
+    ), 'messages'), page_size))
 
     if not messages:
         return f"No messages found in space {space_id}"
 
-    output = f"Found {len(messages)} message(s):\n\n"
+    output = [f"Found {len(messages)} message(s):\n\n"]
+    append = output.append
     for msg in messages:
-        sender_name = msg.get('sender', {}).get('displayName', 'Unknown')
-        text = msg.get('text', '(no text)')
-        create_time = msg.get('createTime', 'Unknown')
+        msg_get = msg.get
+        sender_name = (msg_get('sender') or {}).get('displayName', 'Unknown')
+        text = msg_get('text', '(no text)')
+        create_time = msg_get('createTime', 'Unknown')
 
-        output += f"💬 {sender_name}: {text[:100]}\n"
-        output += f"   Time: {create_time}\n"
-        output += f"   Message ID: {msg['name']}\n\n"
+        append(f"💬 {sender_name}: {text[:100]}\n"
+               f"   Time: {create_time}\n"
+               f"   Message ID: {msg['name']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6173,7 +7440,10 @@ def chat_get_message(message_id: str) -> str:
     """Get details about a specific Google Chat message."""
     service = get_service('chat', 'v1')
 
-    message = service.spaces().messages().get(name=message_id).execute()
+    message = _chat_cache.get(message_id)
+    if message is None:
+        message = execute_with_retry(service.spaces().messages().get(name=message_id))
+        _chat_cache.set(message_id, message)
 
     output = f"Message ID: {message['name']}\n"
     output += f"Sender: {message.get('sender', {}).get('displayName', 'Unknown')}\n"
@@ -6191,11 +7461,12 @@ def chat_update_message(message_id: str, text: str) -> str:
     """Update (edit) a Google Chat message."""
     service = get_service('chat', 'v1')
 
-    updated_message = service.spaces().messages().patch(
+    updated_message = execute_with_retry(service.spaces().messages().patch(
         name=message_id,
         updateMask='text',
         body={'text': text}
-    ).execute()
+    ))
+    _chat_cache.pop(message_id)
 
     return f"✅ Message updated!\nMessage ID: {updated_message['name']}"
 
@@ -6205,7 +7476,8 @@ def chat_delete_message(message_id: str) -> str:
     """Delete a Google Chat message."""
     service = get_service('chat', 'v1')
 
-    service.spaces().messages().delete(name=message_id).execute()
+    execute_with_retry(service.spaces().messages().delete(name=message_id))
+    _chat_cache.pop(message_id)
 
     return f"✅ Message {message_id} deleted"
 
@@ -6215,29 +7487,31 @@ def chat_list_members(space_id: str, page_size: int = 100) -> str:
     """List all members in a Google Chat space."""
     service = get_service('chat', 'v1')
 
-    results = service.spaces().members().list(
+    members = list(itertools.islice(paginate(lambda page_token: service.spaces().members().list(
         parent=space_id,
-        pageSize=page_size
-    ).execute()
-
-    members = results.get('memberships', [])
+        pageSize=page_size,
+        pageToken=page_token,
+        fields='nextPageToken,memberships(name,role,member(name,displayName))'
+    ), 'memberships'), page_size))
 
     if not members:
         return f"No members found in space {space_id}"
 
-    output = f"Found {len(members)} member(s):\n\n"
+    output = [f"Found {len(members)} member(s):\n\n"]
+    append = output.append
     for member in members:
-        member_data = member.get('member', {})
-        name = member_data.get('displayName', 'Unknown')
-        email = member_data.get('name', 'N/A')
+        member_data = member.get('member') or {}
+        member_get = member_data.get
+        name = member_get('displayName', 'Unknown')
+        email = member_get('name', 'N/A')
         role = member.get('role', 'MEMBER')
 
-        output += f"👤 {name}\n"
-        output += f"   Email/ID: {email}\n"
-        output += f"   Role: {role}\n"
-        output += f"   Membership ID: {member['name']}\n\n"
+        append(f"👤 {name}\n"
+               f"   Email/ID: {email}\n"
+               f"   Role: {role}\n"
+               f"   Membership ID: {member['name']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6252,20 +7526,48 @@ def chat_add_member(space_id: str, user_email: str) -> str:
         }
     }
 
-    membership = service.spaces().members().create(
+    membership = execute_with_retry(service.spaces().members().create(
         parent=space_id,
         body=membership_body
-    ).execute()
+    ))
 
     return f"✅ Added {user_email} to space!\nMembership ID: {membership['name']}"
 
 
+@mcp.tool()
+def chat_add_members(space_id: str, user_emails: str) -> str:
+    """Add several members to a Google Chat space in one batched request.
+
+    Args:
+        user_emails: Comma-separated email addresses
+    """
+    service = get_service('chat', 'v1')
+    emails = [email.strip() for email in user_emails.split(',') if email.strip()]
+
+    results = execute_batch(service, [
+        service.spaces().members().create(
+            parent=space_id,
+            body={'member': {'name': f'users/{email}', 'type': 'HUMAN'}},
+            fields='name'
+        )
+        for email in emails
+    ])
+
+    output = []
+    for email, (membership, error) in zip(emails, results):
+        if error:
+            output.append(f"❌ {email}: {str(error)}\n")
+        else:
+            output.append(f"✅ Added {email} (Membership ID: {membership['name']})\n")
+    return ''.join(output)
+
+
 @mcp.tool()
 def chat_remove_member(membership_id: str) -> str:
     """Remove a member from a Google Chat space. Use chat_list_members to get membership IDs."""
     service = get_service('chat', 'v1')
 
-    service.spaces().members().delete(name=membership_id).execute()
+    execute_with_retry(service.spaces().members().delete(name=membership_id))
 
     return f"✅ Removed member {membership_id} from space"
 
@@ -6281,10 +7583,10 @@ def chat_create_reaction(message_id: str, emoji: str) -> str:
         }
     }
 
-    reaction = service.spaces().messages().reactions().create(
+    reaction = execute_with_retry(service.spaces().messages().reactions().create(
         parent=message_id,
         body=reaction_body
-    ).execute()
+    ))
 
     return f"✅ Reaction added!\nEmoji: {emoji}\nReaction ID: {reaction['name']}"
 
@@ -6294,21 +7596,23 @@ def chat_list_reactions(message_id: str) -> str:
     """List all reactions on a message."""
     service = get_service('chat', 'v1')
 
-    results = service.spaces().messages().reactions().list(parent=message_id).execute()
+    results = execute_with_retry(service.spaces().messages().reactions().list(
+        parent=message_id, fields='reactions(name,emoji/unicode,user/displayName)'
+    ))
     reactions = results.get('reactions', [])
 
     if not reactions:
         return f"No reactions on message {message_id}"
 
-    output = f"Found {len(reactions)} reaction(s):\n\n"
+    output = [f"Found {len(reactions)} reaction(s):\n\n"]
     for reaction in reactions:
         emoji = reaction.get('emoji', {}).get('unicode', '?')
         user = reaction.get('user', {}).get('displayName', 'Unknown')
 
-        output += f"{emoji} by {user}\n"
-        output += f"   Reaction ID: {reaction['name']}\n\n"
+        output.append(f"{emoji} by {user}\n"
+                      f"   Reaction ID: {reaction['name']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6316,7 +7620,7 @@ def chat_delete_reaction(reaction_id: str) -> str:
     """Delete a reaction from a message. Use chat_list_reactions to get reaction IDs."""
     service = get_service('chat', 'v1')
 
-    service.spaces().messages().reactions().delete(name=reaction_id).execute()
+    execute_with_retry(service.spaces().messages().reactions().delete(name=reaction_id))
 
     return f"✅ Reaction {reaction_id} deleted"
 
@@ -6333,21 +7637,21 @@ def tasks_list_task_lists(max_results: int = 10) -> str:
         max_results: Maximum number of task lists to return (default: 10)
     """
     service = get_service('tasks', 'v1')
-    results = service.tasklists().list(maxResults=max_results).execute()
+    results = execute_with_retry(service.tasklists().list(maxResults=max_results, fields='items(id,title,updated)'))
     task_lists = results.get('items', [])
 
     if not task_lists:
         return "No task lists found."
 
-    output = f"Found {len(task_lists)} task list(s):\n\n"
+    output = [f"Found {len(task_lists)} task list(s):\n\n"]
     for task_list in task_lists:
-        output += f"📋 {task_list['title']}\n"
-        output += f"   ID: {task_list['id']}\n"
+        output.append(f"📋 {task_list['title']}\n"
+                      f"   ID: {task_list['id']}\n")
         if task_list.get('updated'):
-            output += f"   Updated: {task_list['updated']}\n"
-        output += "\n"
+            output.append(f"   Updated: {task_list['updated']}\n")
+        output.append("\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6375,10 +7679,11 @@ def tasks_list(task_list_id: str = "@default", max_results: int = 20,
     # Build query parameters
     params = {
         'tasklist': task_list_id,
-        'maxResults': max_results,
+        'maxResults': min(max_results, 100),  # Per page; larger requests span several pages
         'showCompleted': show_completed,
         'showDeleted': show_deleted,
-        'showHidden': show_hidden
+        'showHidden': show_hidden,
+        'fields': 'nextPageToken,items(id,title,status,notes,due,completed,deleted,hidden)'
     }
 
     # Add optional date filters
@@ -6393,28 +7698,29 @@ def tasks_list(task_list_id: str = "@default", max_results: int = 20,
     if updated_min:
         params['updatedMin'] = updated_min
 
-    results = service.tasks().list(**params).execute()
-    tasks = results.get('items', [])
+    tasks = list(itertools.islice(paginate(
+        lambda page_token: service.tasks().list(pageToken=page_token, **params), 'items'
+    ), max_results))
 
     if not tasks:
         return "No tasks found matching the criteria."
 
-    output = f"Found {len(tasks)} task(s):\n\n"
+    output = [f"Found {len(tasks)} task(s):\n\n"]
     for task in tasks:
         status = "✅" if task.get('status') == 'completed' else "⬜"
         deleted = " [DELETED]" if task.get('deleted') else ""
         hidden = " [HIDDEN]" if task.get('hidden') else ""
 
-        output += f"{status} {task['title']}{deleted}{hidden}\n"
+        output.append(f"{status} {task['title']}{deleted}{hidden}\n")
         if task.get('notes'):
-            output += f"   Notes: {task['notes']}\n"
+            output.append(f"   Notes: {task['notes']}\n")
         if task.get('due'):
-            output += f"   Due: {task['due']}\n"
+            output.append(f"   Due: {task['due']}\n")
         if task.get('completed'):
-            output += f"   Completed: {task['completed']}\n"
-        output += f"   ID: {task['id']}\n\n"
+            output.append(f"   Completed: {task['completed']}\n")
+        output.append(f"   ID: {task['id']}\n\n")
 
-    return output
+    return ''.join(output)
 
 
 @mcp.tool()
@@ -6445,7 +7751,7 @@ def tasks_create(title: str, notes: Optional[str] = None, due: Optional[str] = N
     if previous:
         insert_params['previous'] = previous
 
-    result = service.tasks().insert(**insert_params).execute()
+    result = execute_with_retry(service.tasks().insert(**insert_params))
 
     output = f"✅ Task created!\nTitle: {result['title']}\nID: {result['id']}"
     if result.get('due'):
@@ -6464,7 +7770,7 @@ def tasks_get(task_id: str, task_list_id: str = "@default") -> str:
         task_list_id: Task list ID (default: "@default")
     """
     service = get_service('tasks', 'v1')
-    task = service.tasks().get(tasklist=task_list_id, task=task_id).execute()
+    task = execute_with_retry(service.tasks().get(tasklist=task_list_id, task=task_id))
 
     status = "✅ Completed" if task.get('status') == 'completed' else "⬜ Not completed"
     output = f"Task Details:\n\n"
@@ -6505,7 +7811,7 @@ def tasks_update(task_id: str, task_list_id: str = "@default",
     service = get_service('tasks', 'v1')
 
     # Get current task
-    task = service.tasks().get(tasklist=task_list_id, task=task_id).execute()
+    task = execute_with_retry(service.tasks().get(tasklist=task_list_id, task=task_id))
 
     # Update fields if provided
     if title is not None:
@@ -6518,7 +7824,7 @@ def tasks_update(task_id: str, task_list_id: str = "@default",
         task['due'] = due
 
     # Update the task
-    result = service.tasks().update(tasklist=task_list_id, task=task_id, body=task).execute()
+    result = execute_with_retry(service.tasks().update(tasklist=task_list_id, task=task_id, body=task))
 
     status_emoji = "✅" if result.get('status') == 'completed' else "⬜"
     output = f"{status_emoji} Task updated!\n\n"
@@ -6537,9 +7843,7 @@ def tasks_update(task_id: str, task_list_id: str = "@default",
 def tasks_complete(task_id: str, task_list_id: str = "@default") -> str:
     """Mark a task as completed."""
     service = get_service('tasks', 'v1')
-    task = service.tasks().get(tasklist=task_list_id, task=task_id).execute()
-    task['status'] = 'completed'
-    service.tasks().update(tasklist=task_list_id, task=task_id, body=task).execute()
+    execute_with_retry(service.tasks().patch(tasklist=task_list_id, task=task_id, body={'status': 'completed'}))
     return f"✅ Task {task_id} marked as completed"
 
 
@@ -6547,11 +7851,12 @@ def tasks_complete(task_id: str, task_list_id: str = "@default") -> str:
 def tasks_delete(task_id: str, task_list_id: str = "@default") -> str:
     """Delete a task."""
     service = get_service('tasks', 'v1')
-    service.tasks().delete(tasklist=task_list_id, task=task_id).execute()
+    execute_with_retry(service.tasks().delete(tasklist=task_list_id, task=task_id))
     return f"✅ Task {task_id} deleted"
 
 
-if __name__ == "__main__":
+def run_server():
+    """Start the MCP server on the configured transport."""
     # Support both stdio (local) and SSE (web/mobile) transports
     # Set TRANSPORT=sse environment variable for web deployment
     transport = os.environ.get('TRANSPORT', 'stdio')
@@ -6564,3 +7869,22 @@ if __name__ == "__main__":
     else:
         # stdio transport for Claude Desktop (local)
         mcp.run()
+
+
+if __name__ == "__main__":
+    # Set GOOGLE_MCP_PROFILE=<file> (or pass --profile) to record a cProfile of the
+    # whole session, written when the server exits. Inspect it with
+    # `python -m pstats <file>` or snakeviz.
+    profile_path = os.environ.get('GOOGLE_MCP_PROFILE') or ('google-mcp.prof' if '--profile' in sys.argv else None)
+
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            run_server()
+        finally:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+    else:
+        run_server()
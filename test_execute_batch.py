@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for execute_batch's chunking of batched API requests"""
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+import server
+
+
+class FakeBatch:
+    """Stands in for BatchHttpRequest: answers every added request with its own value."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.items = []
+
+    def add(self, request, request_id):
+        self.items.append((request, request_id))
+
+    def execute(self, http=None):
+        for request, request_id in self.items:
+            self.callback(request_id, {'value': request}, None)
+
+
+class FakeService:
+    def __init__(self):
+        self.batches = []
+
+    def new_batch_http_request(self, callback):
+        batch = FakeBatch(callback)
+        self.batches.append(batch)
+        return batch
+
+
+class FakeRequest:
+    """Single API request that records how often it was sent."""
+
+    def __init__(self, method):
+        self.method = method
+        self.sent = 0
+
+    def execute(self, http=None):
+        self.sent += 1
+        return {'method': self.method}
+
+
+class FailingService:
+    """Service whose batch endpoint always answers with the given status."""
+
+    def __init__(self, status):
+        self.status = status
+
+    def new_batch_http_request(self, callback):
+        batch = mock.Mock(spec=['add', 'execute'])
+        batch.execute.side_effect = HttpError(httplib2.Response({'status': self.status}), b'{}')
+        return batch
+
+
+class ExecuteBatchTest(unittest.TestCase):
+    def run_batch(self, count):
+        service = FakeService()
+        results = server.execute_batch(service, list(range(count)))
+        return service, results
+
+    def test_no_requests(self):
+        service, results = self.run_batch(0)
+        self.assertEqual(results, [])
+        self.assertEqual(service.batches, [])
+
+    def test_single_request(self):
+        service, results = self.run_batch(1)
+        self.assertEqual(results, [({'value': 0}, None)])
+        self.assertEqual(len(service.batches), 1)
+
+    def test_more_than_one_batch(self):
+        service, results = self.run_batch(101)
+        self.assertEqual(results, [({'value': i}, None) for i in range(101)])
+        self.assertEqual(sorted(len(batch.items) for batch in service.batches), [1, 100])
+
+    def test_server_error_resends_only_idempotent_requests(self):
+        get, post = FakeRequest('GET'), FakeRequest('POST')
+        results = server.execute_batch(FailingService(503), [get, post])
+        self.assertEqual(results[0], ({'method': 'GET'}, None))
+        self.assertIsInstance(results[1][1], HttpError)
+        self.assertEqual((get.sent, post.sent), (1, 0))
+
+    def test_rejected_batch_resends_everything(self):
+        get, post = FakeRequest('GET'), FakeRequest('POST')
+        results = server.execute_batch(FailingService(400), [get, post])
+        self.assertEqual([error for _, error in results], [None, None])
+        self.assertEqual((get.sent, post.sent), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()